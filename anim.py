@@ -0,0 +1,167 @@
+# anim.py
+# ---------------------------------------------------------
+# 스프라이트 시트 애니메이션.
+#
+# - 시트는 (경로, 크기)당 한 번만 잘라서 프레임 surface로 만든다.
+#   좌우 반전 프레임도 그때 같이 만들어 둔다 → 그리기 중 transform 없음.
+# - 같은 시트를 쓰는 모든 엔티티가 프레임 리스트를 공유(_sheet_cache).
+#   디코딩한 시트 원본도 시트당 한 번만 읽어 둔다(_sheet_src) → 다른 크기는 메모리에서만 리샘플링.
+# - 내부 해상도 렌더 배율(render_scale)별 프레임은 Animator를 만들 때 BAKE_SCALES만큼 미리 만든다
+#   (main이 동적 해상도 단계 목록으로 set_bake_scales). 그리는 중 배율이 바뀌어도 디스크/리샘플링 없음.
+# - Animator는 엔티티별 상태(클립 이름, 타이머, 프레임 번호)만 가진다.
+#   프레임 선택은 dt 누적 타이머로만 하고, 매 프레임 새 객체를 만들지 않는다.
+#
+# 사용 예:
+#
+#     anim = Animator("player", (72, 90))
+#     anim.play("walk")
+#     anim.update(dt)
+#     surf.blit(anim.image(facing), (x, y))
+# ---------------------------------------------------------
+
+from __future__ import annotations
+import pygame
+
+# 시트 정의
+# - frames: 시트 안 칸 번호(왼→오, 위→아래)
+# - facing: 원본 프레임이 바라보는 방향(-1 왼쪽, 1 오른쪽, 0 정면 → 반전 안 함)
+SHEETS = {
+    "player": {
+        "path": "assets/sprites/player_sheet.png",
+        "cols": 3,
+        "rows": 3,
+        "clips": {
+            "idle": {"frames": [1], "fps": 1, "facing": 0},
+            "walk": {"frames": [3, 4, 5, 4], "fps": 8, "facing": -1},
+            "jump": {"frames": [4], "fps": 1, "facing": -1},
+        },
+    },
+    "bank_npc": {
+        "path": "assets/sprites/bank_npc.png",
+        "cols": 1,
+        "rows": 1,
+        "clips": {
+            "idle": {"frames": [0], "fps": 1, "facing": 0},
+        },
+    },
+}
+
+# (sheet_id, w, h) -> {clip: (오른쪽 프레임들, 왼쪽 프레임들)}
+_sheet_cache: dict[tuple[str, int, int], dict] = {}
+# sheet_id -> 디코딩한 시트 surface(convert_alpha)
+_sheet_src: dict[str, pygame.Surface] = {}
+
+# Animator가 미리 만들어 둘 렌더 배율(1.0 포함)
+BAKE_SCALES: tuple = (1.0,)
+
+
+def set_bake_scales(scales) -> None:
+    """내부 해상도 렌더 배율 목록(render_scale.RenderScaler.steps()). 이후 만드는 Animator부터 적용."""
+    global BAKE_SCALES
+    BAKE_SCALES = tuple(sorted(set(scales) | {1.0}))
+
+
+def _scaled_size(size, scale: float) -> tuple:
+    return (max(1, int(size[0] * scale)), max(1, int(size[1] * scale)))
+
+
+def _sheet_surface(sheet_id: str) -> pygame.Surface:
+    sheet = _sheet_src.get(sheet_id)
+    if sheet is None:
+        sheet = pygame.image.load(SHEETS[sheet_id]["path"]).convert_alpha()
+        _sheet_src[sheet_id] = sheet
+    return sheet
+
+
+def _fit_frame(cell: pygame.Surface, size) -> pygame.Surface:
+    """칸 이미지를 비율 유지로 size 안에 맞추고 아래-가운데 정렬(발 위치 고정)."""
+    w, h = size
+    cw, ch = cell.get_size()
+    k = min(w / cw, h / ch)
+    sw, sh = max(1, int(cw * k)), max(1, int(ch * k))
+    img = pygame.transform.smoothscale(cell, (sw, sh))
+    out = pygame.Surface((w, h), pygame.SRCALPHA)
+    out.blit(img, ((w - sw) // 2, h - sh))
+    return out
+
+
+def load_sheet(sheet_id: str, size) -> dict:
+    """
+    시트를 잘라 클립별 (오른쪽, 왼쪽) 프레임 튜플로 반환(캐시).
+    파일이 없거나 디스플레이 전이면 pygame.error/FileNotFoundError.
+    """
+    w, h = int(size[0]), int(size[1])
+    key = (sheet_id, w, h)
+    cached = _sheet_cache.get(key)
+    if cached is not None:
+        return cached
+
+    spec = SHEETS[sheet_id]
+    sheet = _sheet_surface(sheet_id)
+    cols, rows = spec["cols"], spec["rows"]
+    cw, ch = sheet.get_width() // cols, sheet.get_height() // rows
+
+    cells = {}
+
+    def cell(i):
+        if i not in cells:
+            r, c = divmod(i, cols)
+            cells[i] = _fit_frame(sheet.subsurface((c * cw, r * ch, cw, ch)), (w, h))
+        return cells[i]
+
+    clips = {}
+    for name, clip in spec["clips"].items():
+        src = [cell(i) for i in clip["frames"]]
+        flipped = [pygame.transform.flip(f, True, False) for f in src] if clip["facing"] else src
+        # 오른쪽(facing=1)을 바라보는 프레임 / 왼쪽 프레임
+        if clip["facing"] < 0:
+            right, left = tuple(flipped), tuple(src)
+        else:
+            right, left = tuple(src), tuple(flipped)
+        clips[name] = {"right": right, "left": left, "dur": 1.0 / max(1, clip["fps"])}
+
+    _sheet_cache[key] = clips
+    return clips
+
+
+class Animator:
+    """엔티티 하나의 재생 상태. 프레임 데이터는 load_sheet 캐시를 공유."""
+
+    def __init__(self, sheet_id: str, size, clip: str = "idle"):
+        self.sheet_id = sheet_id
+        self.size = (int(size[0]), int(size[1]))
+        self.clips = load_sheet(sheet_id, self.size)
+        # 내부 해상도 렌더 배율별 프레임(BAKE_SCALES는 지금 미리, 같은 시트/크기면 캐시 공유)
+        self._scaled = {s: load_sheet(sheet_id, _scaled_size(self.size, s)) for s in BAKE_SCALES}
+        self._scaled[1.0] = self.clips
+        self.clip = clip if clip in self.clips else next(iter(self.clips))
+        self.t = 0.0
+        self.i = 0
+
+    def play(self, clip: str) -> None:
+        """클립 전환(같은 클립이면 이어서 재생)."""
+        if clip == self.clip or clip not in self.clips:
+            return
+        self.clip = clip
+        self.t = 0.0
+        self.i = 0
+
+    def update(self, dt: float) -> None:
+        c = self.clips[self.clip]
+        n = len(c["right"])
+        if n <= 1:
+            return
+        self.t += dt
+        dur = c["dur"]
+        while self.t >= dur:
+            self.t -= dur
+            self.i = (self.i + 1) % n
+
+    def image(self, facing: int = 1, scale: float = 1.0) -> pygame.Surface:
+        clips = self._scaled.get(scale)
+        if clips is None:
+            # 미리 안 만든 배율(BAKE_SCALES 밖): 시트 원본은 메모리에 있으니 리샘플링만
+            clips = load_sheet(self.sheet_id, _scaled_size(self.size, scale))
+            self._scaled[scale] = clips
+        c = clips[self.clip]
+        return (c["left"] if facing < 0 else c["right"])[self.i]
@@ -0,0 +1,160 @@
+# bench_entities.py
+# ---------------------------------------------------------
+# 엔티티(Player / NPC / WarpGate) 마이크로 벤치마크.
+#
+# 측정
+#   - update : 엔티티 하나당 프레임 갱신 비용(µs)
+#              NPC.update / WarpGate.update (근접 판정 = rect 접근) + Player.rect
+#   - memory : 엔티티 하나당 파이썬 객체 메모리(bytes, tracemalloc)
+#              + 인스턴스 자체 크기(sys.getsizeof, __dict__ 포함)
+#
+# before / after 두 줄을 같이 출력한다.
+#   - after  : 지금 클래스(__slots__ + 캐시 rect + 제곱 거리 비교)
+#   - before : 같은 메서드를 __slots__ 없이(__dict__) 복사한 클래스에
+#              예전 동작(rect 접근마다 새 pygame.Rect, 근접 판정에서 rect 두 번 + sqrt)을 덮어쓴 것
+#
+# 실행:
+#   python bench_entities.py [N]        (기본 N=300, 화면 없이 dummy 드라이버)
+# ---------------------------------------------------------
+
+import os
+import sys
+import time
+import types
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+import settings as S
+import key as K
+
+
+def _instance_bytes(obj) -> int:
+    n = sys.getsizeof(obj)
+    d = getattr(obj, "__dict__", None)
+    if d is not None:
+        n += sys.getsizeof(d)
+    return n
+
+
+def _alloc_per_entity(make, n: int) -> float:
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objs = [make(i) for i in range(n)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    total = sum(s.size_diff for s in after.compare_to(before, "filename"))
+    del objs
+    return total / n
+
+
+def _time_per_entity(fn, objs, frames: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(frames):
+        for o in objs:
+            fn(o)
+    return (time.perf_counter() - t0) / (frames * len(objs)) * 1e6
+
+
+# ---------------------------------------------------------
+# before: __slots__/캐시 rect 적용 전 동작
+# ---------------------------------------------------------
+def _dict_class(cls, **overrides):
+    """cls의 메서드를 그대로 쓰되 __slots__ 없이(인스턴스 __dict__) 만든 클래스."""
+    ns = {k: v for k, v in vars(cls).items()
+          if k not in ("__slots__", "__dict__", "__weakref__") and not isinstance(v, types.MemberDescriptorType)}
+    ns.update(overrides)
+    return type(cls.__name__ + "Before", (), ns)
+
+
+@property
+def _rect_pos(self):
+    return pygame.Rect(int(self.pos.x), int(self.pos.y), self.w, self.h)
+
+
+@property
+def _rect_xy(self):
+    return pygame.Rect(int(self.x), int(self.y), self.w, self.h)
+
+
+def _npc_is_near(self, player_rect):
+    dx = player_rect.centerx - self.rect.centerx
+    dy = player_rect.centery - self.rect.centery
+    return (dx * dx + dy * dy) ** 0.5 <= self.range
+
+
+def _gate_update(self, player_rect, events, *, blocked=False):
+    if blocked:
+        return False, False
+    dx = player_rect.centerx - self.rect.centerx
+    dy = player_rect.centery - self.rect.centery
+    near = (dx * dx + dy * dy) ** 0.5 <= self.range
+    activated = False
+    for e in events:
+        if e.type == pygame.KEYDOWN and e.key == K.INTERACT and near:
+            activated = True
+    return near, activated
+
+
+def _classes(before: bool) -> tuple:
+    from player import Player
+    from npc import NPC
+    from main import WarpGate
+
+    if not before:
+        return Player, NPC, WarpGate
+    return (_dict_class(Player, rect=_rect_pos),
+            _dict_class(NPC, rect=_rect_pos, _is_near=_npc_is_near),
+            _dict_class(WarpGate, rect=_rect_xy, update=_gate_update))
+
+
+def run(n: int = 300, frames: int = 200, before: bool = False) -> dict:
+    Player, NPC, WarpGate = _classes(before)
+
+    ground = getattr(S, "GROUND_Y", int(S.SCREEN_H * 0.78))
+    player = Player((400, ground - S.PLAYER_SIZE[1]))
+    pr = player.rect
+    events = []
+
+    npcs = [NPC("워니", 40 * i, None) for i in range(n)]
+    gates = [WarpGate(40 * i, None, "gate", "lab") for i in range(n)]
+    players = [Player((40 * i, 100)) for i in range(n)]
+
+    res = {
+        "n": n,
+        "label": "before" if before else "after",
+        "slots": hasattr(NPC, "__slots__"),
+        "npc_update_us": _time_per_entity(lambda o: o.update(pr, events), npcs, frames),
+        "gate_update_us": _time_per_entity(lambda o: o.update(pr, events), gates, frames),
+        "player_rect_us": _time_per_entity(lambda o: o.rect, players, frames),
+        "npc_bytes": _alloc_per_entity(lambda i: NPC("워니", 40 * i, None), n),
+        "gate_bytes": _alloc_per_entity(lambda i: WarpGate(40 * i, None, "gate", "lab"), n),
+        "player_bytes": _alloc_per_entity(lambda i: Player((40 * i, 100)), n),
+        "npc_inst": _instance_bytes(npcs[0]),
+        "gate_inst": _instance_bytes(gates[0]),
+        "player_inst": _instance_bytes(players[0]),
+    }
+    return res
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    n = int(argv[0]) if argv else 300
+    pygame.init()
+    pygame.display.set_mode((S.SCREEN_W, S.SCREEN_H))
+    rows = [run(n, before=True), run(n)]
+    pygame.quit()
+    print(f"[bench_entities] N={n}")
+    print("           update / entity (us)              alloc / entity (B)       instance size (B)")
+    for r in rows:
+        print(f"  {r['label']:<7} npc={r['npc_update_us']:.3f} gate={r['gate_update_us']:.3f} "
+              f"player.rect={r['player_rect_us']:.3f}  "
+              f"npc={r['npc_bytes']:.0f} gate={r['gate_bytes']:.0f} player={r['player_bytes']:.0f}  "
+              f"npc={r['npc_inst']} gate={r['gate_inst']} player={r['player_inst']}  (slots={r['slots']})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+# collision.py
+# ---------------------------------------------------------
+# 사이드뷰 연속 충돌(swept AABB) 유틸.
+#
+# 기존 Player.update는 vel * dt 만큼 한 번에 옮긴 뒤 겹침만 풀었다.
+# 프레임이 길면(10 FPS 등) 낙하 속도에서 한 프레임 이동량이
+# "플레이어 높이 + 얇은 지형지물 두께"를 넘어서 그대로 통과(tunneling)한다.
+#
+# 여기서는 축별로 "이동 경로 전체"를 쓸어서(sweep) 가장 먼저 닿는 면에서 멈춘다.
+# - 경로 중간의 얇은 물체도 잡힘
+# - 시작부터 겹친 물체는 기존과 같은 방향으로 밀어냄
+# 축 분리 순서(x → y) 때문에 생기는 모서리 오차는, 이동량이 가장 작은
+# 물체 크기의 SUBSTEP_FRAC 배를 넘을 때만 하위 스텝으로 나눠 줄인다.
+# 보통 걷기/점프 속도에서는 스텝 1개 = 기존 두 번의 solids 루프와 같은 비용.
+# ---------------------------------------------------------
+
+from __future__ import annotations
+import math
+
+SUBSTEP_FRAC = 0.5
+MAX_SUBSTEPS = 16
+
+
+def sweep_x(x: float, y: float, w: int, h: int, dx: float, solids):
+    """
+    x축으로 dx 이동. 막히면 닿는 면까지만.
+    반환: (new_x, hit) — hit은 막혔는지 여부.
+    """
+    if not dx:
+        return x, False
+    top, bottom = y, y + h
+    hit = False
+    if dx > 0:
+        nx = x + dx
+        reach = nx + w
+        for s in solids:
+            if s.bottom <= top or s.top >= bottom:
+                continue
+            if s.right > x and s.left < reach and s.left - w < nx:
+                nx = s.left - w
+                hit = True
+    else:
+        nx = x + dx
+        for s in solids:
+            if s.bottom <= top or s.top >= bottom:
+                continue
+            if s.left < x + w and s.right > nx:
+                nx = s.right
+                hit = True
+    return nx, hit
+
+
+def sweep_y(x: float, y: float, w: int, h: int, dy: float, solids):
+    """
+    y축으로 dy 이동. 막히면 닿는 면까지만.
+    반환: (new_y, hit)
+    """
+    if not dy:
+        return y, False
+    left, right = x, x + w
+    hit = False
+    if dy > 0:
+        ny = y + dy
+        reach = ny + h
+        for s in solids:
+            if s.right <= left or s.left >= right:
+                continue
+            if s.bottom > y and s.top < reach and s.top - h < ny:
+                ny = s.top - h
+                hit = True
+    else:
+        ny = y + dy
+        for s in solids:
+            if s.right <= left or s.left >= right:
+                continue
+            if s.top < y + h and s.bottom > ny:
+                ny = s.bottom
+                hit = True
+    return ny, hit
+
+
+def min_extent(solids) -> int:
+    """solids 중 가장 얇은 변 길이(없으면 0)."""
+    m = 0
+    for s in solids:
+        e = s.w if s.w < s.h else s.h
+        if e > 0 and (m == 0 or e < m):
+            m = e
+    return m
+
+
+def substeps_for(dx: float, dy: float, smallest: int) -> int:
+    """이동량이 가장 얇은 물체의 SUBSTEP_FRAC배를 넘으면 나눠서 이동."""
+    if smallest <= 0:
+        return 1
+    d = max(abs(dx), abs(dy))
+    limit = smallest * SUBSTEP_FRAC
+    if d <= limit:
+        return 1
+    return min(MAX_SUBSTEPS, int(math.ceil(d / limit)))
+
+
+class SpatialGrid:
+    """
+    고정 크기 칸(cell px) 해시. key → 겹치는 칸들.
+    움직이는 물체는 move()로 "자기 것만" 다시 넣는다.
+    차지하는 칸 범위가 그대로면(칸 안에서만 움직이면) 아무 일도 하지 않는다.
+    """
+
+    def __init__(self, cell: int = 128):
+        self.cell = cell
+        self.cells: dict[tuple[int, int], set] = {}
+        self._span: dict = {}
+
+    def _span_of(self, r):
+        c = self.cell
+        return (r.left // c, r.top // c, (r.right - 1) // c, (r.bottom - 1) // c)
+
+    def clear(self) -> None:
+        self.cells.clear()
+        self._span.clear()
+
+    def insert(self, key, rect) -> None:
+        span = self._span_of(rect)
+        self._span[key] = span
+        c0, r0, c1, r1 = span
+        for cy in range(r0, r1 + 1):
+            for cx in range(c0, c1 + 1):
+                self.cells.setdefault((cx, cy), set()).add(key)
+
+    def remove(self, key) -> None:
+        span = self._span.pop(key, None)
+        if span is None:
+            return
+        c0, r0, c1, r1 = span
+        for cy in range(r0, r1 + 1):
+            for cx in range(c0, c1 + 1):
+                bucket = self.cells.get((cx, cy))
+                if bucket is not None:
+                    bucket.discard(key)
+                    if not bucket:
+                        del self.cells[(cx, cy)]
+
+    def move(self, key, rect) -> bool:
+        """칸 범위가 바뀌었을 때만 다시 넣는다. 다시 넣었으면 True."""
+        if self._span.get(key) == self._span_of(rect):
+            return False
+        self.remove(key)
+        self.insert(key, rect)
+        return True
+
+    def query(self, rect) -> set:
+        """rect와 같은 칸에 걸친 key들(후보 - 실제 겹침은 호출 쪽에서 확인)."""
+        out = set()
+        c0, r0, c1, r1 = self._span_of(rect)
+        cells = self.cells
+        for cy in range(r0, r1 + 1):
+            for cx in range(c0, c1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    out |= bucket
+        return out
+
+
+# ---------------------------------------------------------
+# 자체 점검: python collision.py
+# - 10 FPS(그리고 5 FPS)에서 얇은 발판 위로 떨어졌을 때 통과하지 않는지
+# ---------------------------------------------------------
+def _selfcheck():
+    import pygame
+    from player import Player
+
+    class _Level:
+        world_w, world_h = 4800, 540
+
+        def __init__(self, solids):
+            self._solids = solids
+
+        def get_solid_rects(self):
+            return list(self._solids)
+
+        def surface_y(self, rect):
+            return 530 - rect.height
+
+    class _Keys:
+        def __getitem__(self, k):
+            return False
+
+    ok = True
+    for fps in (60, 10, 5):
+        for thick in (4, 10, 24):
+            # 발판 아래에도 지면이 있어서, 통과하면 지면 스냅에 걸려 feet=530이 된다
+            plat = pygame.Rect(0, 400, 4800, thick)
+            level = _Level([plat])
+            p = Player((100, 0))
+            p.vel.y = 1200  # 화면 위에서 이미 떨어지던 중
+            for _ in range(fps * 3):
+                p.update(1.0 / fps, _Keys(), level)
+            landed = abs((p.pos.y + p.h) - plat.top) < 1e-6 and p.on_ground
+            ok &= landed
+            print(f"  fps={fps:>2} platform={thick:>2}px  -> feet={p.pos.y + p.h:.1f} "
+                  f"{'OK' if landed else 'TUNNELED'}")
+
+    # 벽: 한 프레임에 벽 두께 + 플레이어 폭보다 멀리 가는 속도
+    wall = pygame.Rect(600, 0, 4, 540)
+    p = Player((400, 330))
+    p.vel.x = 2000
+    p.max_speed = 5000
+    p.update(0.2, _Keys(), _Level([wall]))
+    blocked = p.pos.x + p.w <= wall.left
+    ok &= blocked
+    print(f"  wall sweep -> right={p.pos.x + p.w:.1f} {'OK' if blocked else 'TUNNELED'}")
+
+    print("collision selfcheck:", "PASS" if ok else "FAIL")
+    return ok
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(0 if _selfcheck() else 1)
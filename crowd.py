@@ -0,0 +1,372 @@
+# crowd.py
+# ---------------------------------------------------------
+# NPC 무리(crowd)용 사이드뷰 물리 - NumPy struct-of-arrays.
+#
+# Player.update의 사이드뷰 규칙(가속/마찰/속도 제한/점프/중력,
+# swept AABB 충돌 + 하위 스텝, surface_y 지면 스냅, 월드 클램프)을
+# 몸체 N개에 대해 배열 연산 몇 번으로 한꺼번에 적분한다.
+#
+# - 상태는 몸체별 객체가 아니라 필드별 배열(x, y, vx, vy, w, h, ...)
+# - 입력은 move(-1/0/1)와 jump(bool) 배열에 AI/스크립트가 써 넣는다
+# - 충돌은 (몸체 N x 솔리드 S) 브로드캐스트 한 번으로 축별 처리
+# - 지면 스냅은 ground_segments 표를 searchsorted로 한 번에 보간
+#
+# 몸체가 하나면 Player.update와 같은 결과가 나온다(python crowd.py 로 확인).
+#
+# 사용 예:
+#
+#     crowd = CrowdPhysics(level)
+#     i = crowd.add(1400, 300)
+#     crowd.move[i] = 1          # 오른쪽으로 걷기
+#     crowd.jump[i] = True       # 땅에 있으면 점프
+#     crowd.step(dt)
+#     crowd.sync(npcs)           # npc.pos 에 결과 반영(그리기용)
+# ---------------------------------------------------------
+
+from __future__ import annotations
+
+try:
+    import numpy as np
+except ImportError:  # numpy는 선택 의존성(crowd 기능에만 필요)
+    np = None
+
+import settings as S
+from collision import SUBSTEP_FRAC, MAX_SUBSTEPS
+
+
+class CrowdPhysics:
+    def __init__(self, level, capacity: int = 64):
+        if np is None:
+            raise ImportError("[crowd] numpy가 필요합니다 (pip install numpy)")
+
+        # 파라미터는 Player와 같은 설정값을 공유
+        self.accel = getattr(S, "PLAYER_ACCEL", 1200)
+        self.friction = getattr(S, "PLAYER_FRICTION", 1600)
+        self.max_speed = getattr(S, "PLAYER_MAX_SPEED", 260)
+        self.gravity = getattr(S, "PLAYER_GRAVITY", 2000)
+        self.jump_speed = getattr(S, "PLAYER_JUMP_SPEED", 750)
+
+        self.count = 0
+        self._alloc(max(1, capacity))
+        self.set_level(level)
+
+    # ---------------------------------------------------------
+    # 배열 관리
+    # ---------------------------------------------------------
+    def _alloc(self, cap: int) -> None:
+        old = self.count and {
+            k: getattr(self, k)[:self.count]
+            for k in ("x", "y", "vx", "vy", "w", "h", "move", "jump", "on_ground", "facing")
+        }
+        self.capacity = cap
+        self.x = np.zeros(cap)
+        self.y = np.zeros(cap)
+        self.vx = np.zeros(cap)
+        self.vy = np.zeros(cap)
+        self.w = np.zeros(cap)
+        self.h = np.zeros(cap)
+        self.move = np.zeros(cap)              # -1 / 0 / 1
+        self.jump = np.zeros(cap, dtype=bool)
+        self.on_ground = np.zeros(cap, dtype=bool)
+        self.facing = np.ones(cap, dtype=np.int8)
+        if old:
+            for k, v in old.items():
+                getattr(self, k)[:self.count] = v
+
+    def add(self, x: float, y: float, w=None, h=None) -> int:
+        """몸체 추가. 인덱스 반환(배열이 차면 두 배로 늘림)."""
+        if self.count == self.capacity:
+            self._alloc(self.capacity * 2)
+        if w is None or h is None:
+            w, h = getattr(S, "PLAYER_SIZE", (36, 60))
+        i = self.count
+        self.x[i], self.y[i] = x, y
+        self.vx[i] = self.vy[i] = 0.0
+        self.w[i], self.h[i] = w, h
+        self.move[i] = 0
+        self.jump[i] = False
+        self.on_ground[i] = False
+        self.facing[i] = 1
+        self.count += 1
+        return i
+
+    def set_level(self, level) -> None:
+        """레벨 교체: 솔리드/지면 표를 배열로 한 번만 변환."""
+        self.level = level
+        self.world_w = getattr(level, "world_w", S.SCREEN_W)
+        self.world_h = getattr(level, "world_h", S.SCREEN_H)
+
+        solids = level.get_solid_rects() if hasattr(level, "get_solid_rects") else []
+        self._solids = solids
+        self.sl = np.array([s.left for s in solids], dtype=float)
+        self.st = np.array([s.top for s in solids], dtype=float)
+        self.sr = np.array([s.right for s in solids], dtype=float)
+        self.sb = np.array([s.bottom for s in solids], dtype=float)
+        # collision.min_extent와 같은 값
+        ext = [min(s.w, s.h) for s in solids if min(s.w, s.h) > 0]
+        self.smallest = getattr(level, "solid_min_extent", min(ext) if ext else 0)
+
+        # 지면: ground_segments가 x 오름차순이면 배열 보간, 아니면 level.surface_y 호출
+        self.gx = self.gy = None
+        segs = getattr(level, "ground_segments", None)
+        if segs and all(segs[i][0] <= segs[i + 1][0] for i in range(len(segs) - 1)):
+            self.gx = np.array([p[0] for p in segs], dtype=float)
+            self.gy = np.array([p[1] for p in segs], dtype=float)
+
+    # ---------------------------------------------------------
+    # 지면 높이(Level.surface_y_rect_x 벡터화)
+    # ---------------------------------------------------------
+    def _surface_at(self, wx):
+        gx, gy = self.gx, self.gy
+        j = np.clip(np.searchsorted(gx, wx, side="left"), 1, len(gx) - 1)
+        x0, x1 = gx[j - 1], gx[j]
+        y0, y1 = gy[j - 1], gy[j]
+        t = (wx - x0) / np.maximum(1.0, x1 - x0)
+        out = np.trunc(y0 * (1 - t) + y1 * t)
+        out = np.where(wx <= gx[0], gy[0], out)
+        return np.where(wx >= gx[-1], gy[-1], out)
+
+    def _ground_top(self, n):
+        # Player: level.surface_y(Rect(int(x), int(y), w, h))
+        x, w, h = self.x[:n], self.w[:n], self.h[:n]
+        cx = np.trunc(x) + np.floor_divide(w, 2)
+        if self.gx is not None:
+            return self._surface_at(cx) - h
+        import pygame
+        return np.array([
+            self.level.surface_y(pygame.Rect(int(x[i]), int(self.y[i]), int(w[i]), int(h[i])))
+            for i in range(n)
+        ], dtype=float)
+
+    def _apply_movers(self, n: int) -> None:
+        """
+        Level.update에서 움직인 발판(level.moved)만 솔리드 배열 행을 갱신하고,
+        그 위에 서 있던 몸체를 같이 옮긴다(Level.carry의 탑승자 규칙, 가로 벽 검사는 생략).
+        """
+        moved = getattr(self.level, "moved", None)
+        if not moved:
+            return
+        x, y, w, h = self.x[:n], self.y[:n], self.w[:n], self.h[:n]
+        for k, m in moved:
+            if k >= len(self.sl) or self._solids[k] is not m.rect:
+                continue
+            old, r = m.prev, m.rect
+            self.sl[k], self.st[k], self.sr[k], self.sb[k] = r.left, r.top, r.right, r.bottom
+            riders = (np.abs(y + h - old.top) < 1.0) & (x + w > old.left) & (x < old.right)
+            if riders.any():
+                x[riders] = np.clip(x[riders] + m.dx, 0, self.world_w - w[riders])
+                y[riders] = r.top - h[riders]
+
+    # ---------------------------------------------------------
+    # 적분
+    # ---------------------------------------------------------
+    def step(self, dt: float) -> None:
+        """level.update(dt) 이후 호출(움직이는 발판이 있으면 먼저 반영)."""
+        n = self.count
+        if not n:
+            return
+        self._apply_movers(n)
+        x, y, vx, vy = self.x[:n], self.y[:n], self.vx[:n], self.vy[:n]
+        w, h = self.w[:n], self.h[:n]
+        move, on_ground = self.move[:n], self.on_ground[:n]
+
+        # --- 수평 가속 / 마찰 ---
+        moving = move != 0
+        vx[:] = np.where(
+            moving,
+            vx + move * self.accel * dt,
+            np.where(vx > 0, np.maximum(0, vx - self.friction * dt),
+                     np.where(vx < 0, np.minimum(0, vx + self.friction * dt), vx)),
+        )
+        self.facing[:n] = np.where(moving, np.sign(move), self.facing[:n])
+        np.clip(vx, -self.max_speed, self.max_speed, out=vx)
+
+        # --- 점프 / 중력 ---
+        jumping = self.jump[:n] & on_ground
+        vy[jumping] = -self.jump_speed
+        vy += self.gravity * dt
+        on_ground[:] = False
+
+        # --- 하위 스텝 수(collision.substeps_for) ---
+        if self.smallest > 0:
+            d = np.maximum(np.abs(vx * dt), np.abs(vy * dt))
+            limit = self.smallest * SUBSTEP_FRAC
+            steps = np.where(d <= limit, 1, np.minimum(MAX_SUBSTEPS, np.ceil(d / limit))).astype(int)
+        else:
+            steps = np.ones(n, dtype=int)
+        sdt = dt / steps
+
+        sl, st, sr, sb = self.sl, self.st, self.sr, self.sb
+        has_solids = len(sl) > 0
+        for k in range(int(steps.max())):
+            live = steps > k
+
+            # 수평: 월드 클램프 후 sweep_x
+            act = live & (vx != 0)
+            nx = np.maximum(0, np.minimum(self.world_w - w, x + vx * sdt))
+            dx = nx - x
+            act &= dx != 0
+            if act.any():
+                nx = x + dx
+                hit = np.zeros(n, dtype=bool)
+                if has_solids:
+                    vert = ~((sb <= y[:, None]) | (st >= (y + h)[:, None]))
+                    # 오른쪽: 가장 가까운 왼쪽 면
+                    r_ok = vert & (sr > x[:, None]) & (sl < (nx + w)[:, None])
+                    cand = np.where(r_ok, sl - w[:, None], np.inf).min(axis=1)
+                    r_hit = (dx > 0) & (cand < nx)
+                    # 왼쪽: 가장 가까운 오른쪽 면
+                    l_ok = vert & (sl < (x + w)[:, None]) & (sr > nx[:, None])
+                    cand_l = np.where(l_ok, sr, -np.inf).max(axis=1)
+                    l_hit = (dx < 0) & (cand_l > nx)
+                    nx = np.where(r_hit, cand, np.where(l_hit, cand_l, nx))
+                    hit = r_hit | l_hit
+                x[:] = np.where(act, nx, x)
+                vx[act & hit] = 0
+
+            # 수직: sweep_y
+            act = live & (vy != 0)
+            if act.any():
+                dy = vy * sdt
+                ny = y + dy
+                hit = np.zeros(n, dtype=bool)
+                if has_solids:
+                    horz = ~((sr <= x[:, None]) | (sl >= (x + w)[:, None]))
+                    d_ok = horz & (sb > y[:, None]) & (st < (ny + h)[:, None])
+                    cand = np.where(d_ok, st - h[:, None], np.inf).min(axis=1)
+                    d_hit = (dy > 0) & (cand < ny)
+                    u_ok = horz & (st < (y + h)[:, None]) & (sb > ny[:, None])
+                    cand_u = np.where(u_ok, sb, -np.inf).max(axis=1)
+                    u_hit = (dy < 0) & (cand_u > ny)
+                    ny = np.where(d_hit, cand, np.where(u_hit, cand_u, ny))
+                    hit = d_hit | u_hit
+                hit &= act
+                on_ground |= hit & (vy > 0)
+                vy[hit] = 0
+                y[:] = np.where(act, ny, y)
+
+        # --- 지면 스냅 ---
+        if self.gx is not None or hasattr(self.level, "surface_y"):
+            top = self._ground_top(n)
+            below = y > top
+            y[below] = top[below]
+            vy[below] = 0
+            on_ground |= below
+
+        # --- 세로 월드 클램프 ---
+        over = y + h > self.world_h
+        y[over] = (self.world_h - h)[over]
+        vy[over] = 0
+        on_ground |= over
+        above = y < 0
+        y[above] = 0
+        vy[above & (vy < 0)] = 0
+
+    # ---------------------------------------------------------
+    # 엔티티 반영
+    # ---------------------------------------------------------
+    def sync(self, entities) -> None:
+        """entities[i].pos 에 i번 몸체 위치를 써 넣는다(그리기/근접 판정용)."""
+        xs, ys = self.x.tolist(), self.y.tolist()
+        for i, e in enumerate(entities[:self.count]):
+            e.pos.x, e.pos.y = xs[i], ys[i]
+
+
+# ---------------------------------------------------------
+# 자체 점검: python crowd.py
+# - 몸체 1개 결과가 Player.update와 같은지(입력 스크립트, 여러 FPS, 얇은 발판/벽)
+# - 몸체 N개: Player 객체 N개 루프 대비 시간
+# ---------------------------------------------------------
+def _selfcheck(n_bench: int = 500):
+    import time
+    import pygame
+    from player import Player
+    from level import Level
+
+    class _Level:
+        world_w, world_h = 2400, 540
+        ground_segments = [(0, 500), (800, 460), (1600, 520), (2400, 480)]
+
+        def __init__(self, solids):
+            self._solids = solids
+
+        def get_solid_rects(self):
+            return list(self._solids)
+
+        surface_y_rect_x = Level.surface_y_rect_x
+        surface_y = Level.surface_y
+
+    class _Keys:
+        def __init__(self, move, jump):
+            self.move, self.jump = move, jump
+
+        def __getitem__(self, k):
+            if k == pygame.K_d:
+                return self.move > 0
+            if k == pygame.K_a:
+                return self.move < 0
+            if k in (pygame.K_SPACE, pygame.K_w):
+                return self.jump
+            return False
+
+    def script(f):
+        # 오른쪽 걷기 → 점프 → 정지(마찰) → 왼쪽 → 점프 반복
+        phase = (f // 40) % 5
+        move = (1, 1, 0, -1, -1)[phase]
+        jump = phase in (1, 4) and f % 40 == 0
+        return move, jump
+
+    levels = {
+        "open": _Level([]),
+        "props": _Level([pygame.Rect(600, 380, 200, 6), pygame.Rect(1000, 300, 4, 240),
+                         pygame.Rect(300, 420, 120, 24), pygame.Rect(1400, 200, 300, 10)]),
+    }
+    ok = True
+    for name, level in levels.items():
+        for fps in (60, 30, 10):
+            p = Player((500, 100))
+            c = CrowdPhysics(level)
+            c.add(500, 100, p.w, p.h)
+            worst = 0.0
+            for f in range(fps * 8):
+                move, jump = script(f)
+                p.update(1.0 / fps, _Keys(move, jump), level)
+                c.move[0], c.jump[0] = move, jump
+                c.step(1.0 / fps)
+                worst = max(worst, abs(p.pos.x - c.x[0]), abs(p.pos.y - c.y[0]),
+                            abs(p.vel.x - c.vx[0]), abs(p.vel.y - c.vy[0]))
+                if p.on_ground != bool(c.on_ground[0]) or p.facing != int(c.facing[0]):
+                    worst = float("inf")
+            same = worst < 1e-9
+            ok &= same
+            print(f"  {name:<5} fps={fps:>2}  max diff={worst:.2e} {'OK' if same else 'MISMATCH'}")
+
+    # 속도 비교
+    level = levels["props"]
+    dt = 1.0 / 60
+    players = [Player((100 + (i * 37) % 2000, 100)) for i in range(n_bench)]
+    keys = _Keys(1, False)
+    t0 = time.perf_counter()
+    for _ in range(60):
+        for p in players:
+            p.update(dt, keys, level)
+    t_obj = (time.perf_counter() - t0) / 60 * 1000
+
+    c = CrowdPhysics(level, capacity=n_bench)
+    for i in range(n_bench):
+        c.add(100 + (i * 37) % 2000, 100)
+    c.move[:] = 1
+    t0 = time.perf_counter()
+    for _ in range(60):
+        c.step(dt)
+    t_vec = (time.perf_counter() - t0) / 60 * 1000
+    print(f"  N={n_bench}: Player.update loop {t_obj:.2f}ms/tick, CrowdPhysics {t_vec:.2f}ms/tick "
+          f"(x{t_obj / max(t_vec, 1e-9):.1f})")
+
+    print("crowd selfcheck:", "PASS" if ok else "FAIL")
+    return ok
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(0 if _selfcheck() else 1)
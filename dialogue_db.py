@@ -0,0 +1,222 @@
+# dialogue_db.py
+# ---------------------------------------------------------
+# 외부 파일 대사 DB(지연 로딩).
+#
+# 예전에는 npc.py 안의 DIALOGUE_DB 리터럴이 import 시점에 전부 파싱되고
+# 게임 내내 메모리에 남았다. 대사가 수만 줄이 되면 시작 시간/메모리가 같이 커진다.
+#
+# 여기서는
+# - dialogue/index.json : npc_id -> 파일 이름(작가가 NPC별/챕터별로 나눠 관리)
+#       {"_meta": {"version": 1}, "npcs": {"워니": "wonee.json", ...}}
+# - dialogue/<파일>.json : {npc_id: {"lines_by_visit": [...]}, ...}
+#   (한 파일에 여러 NPC가 있어도 됨 = 챕터 단위)
+# - 시작할 때는 index만 읽고, NPC가 생성될 때 그 NPC의 파일만 읽는다
+# - 읽은 파일은 LRU(DIALOGUE_CACHE_FILES개)로 보관, 넘치면 오래된 파일부터 버림
+#   → 씬을 오가도 최근 파일은 디스크를 다시 안 읽고, 전체 대사가 상주하지는 않음
+# - index.json이 없으면 폴더의 *.json을 훑어서 index를 만든다(작업 중 편의용)
+#
+# 사용 예:
+#
+#     import dialogue_db
+#     cfg = dialogue_db.load("워니")          # 없으면 {}
+#     for npc_id in dialogue_db.keys(): ...    # 파일은 안 읽음
+# ---------------------------------------------------------
+
+from __future__ import annotations
+import os
+import sys
+import json
+from collections import OrderedDict
+
+import settings as S
+
+INDEX_NAME = "index.json"
+
+
+def _base_dir() -> str:
+    # main.base_dir과 같은 규칙: exe로 실행 중이면 exe 위치(맵 json과 같이 배포), 개발 중이면 이 파일 위치
+    if getattr(sys, "frozen", False):
+        return os.path.dirname(sys.executable)
+    return os.path.dirname(os.path.abspath(__file__))
+
+
+def dialogue_dir() -> str:
+    return os.path.join(_base_dir(), getattr(S, "DIALOGUE_DIR", "dialogue"))
+
+
+def _read_json(path: str):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+class DialogueDB:
+    """npc_id -> 대사 설정. dict처럼 get/keys/[]/in 지원(값은 필요할 때 파일에서)."""
+
+    def __init__(self, root: str | None = None, max_files: int | None = None):
+        self.root = root or dialogue_dir()
+        self.max_files = max(1, int(max_files if max_files is not None
+                                    else getattr(S, "DIALOGUE_CACHE_FILES", 8)))
+        self._index: dict[str, str] | None = None
+        self._files: OrderedDict = OrderedDict()   # 파일 이름 -> {npc_id: cfg}
+        self.stats = {"file_loads": 0, "hits": 0, "evictions": 0}
+
+    # -------------------------
+    # index
+    # -------------------------
+    @property
+    def index(self) -> dict[str, str]:
+        if self._index is None:
+            self._index = self._load_index()
+        return self._index
+
+    def _load_index(self) -> dict[str, str]:
+        path = os.path.join(self.root, INDEX_NAME)
+        try:
+            return dict(_read_json(path).get("npcs", {}))
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print("[dialogue_db] index 읽기 실패:", e)
+
+        # index가 없으면 폴더를 훑어서 만든다(파일은 전부 한 번 읽음)
+        idx: dict[str, str] = {}
+        try:
+            names = sorted(n for n in os.listdir(self.root) if n.endswith(".json") and n != INDEX_NAME)
+        except OSError:
+            print(f"[dialogue_db] 대사 폴더 없음: {self.root}")
+            return idx
+        for name in names:
+            try:
+                for npc_id in _read_json(os.path.join(self.root, name)):
+                    idx.setdefault(npc_id, name)
+            except Exception as e:
+                print(f"[dialogue_db] {name} 읽기 실패:", e)
+        print(f"[dialogue_db] index.json 없음 → 폴더 스캔으로 {len(idx)}명 등록")
+        return idx
+
+    # -------------------------
+    # 파일 LRU
+    # -------------------------
+    def _file(self, name: str) -> dict:
+        data = self._files.get(name)
+        if data is not None:
+            self._files.move_to_end(name)
+            self.stats["hits"] += 1
+            return data
+        try:
+            data = _read_json(os.path.join(self.root, name))
+        except Exception as e:
+            print(f"[dialogue_db] {name} 읽기 실패:", e)
+            data = {}
+        self.stats["file_loads"] += 1
+        self._files[name] = data
+        while len(self._files) > self.max_files:
+            self._files.popitem(last=False)
+            self.stats["evictions"] += 1
+        return data
+
+    def get(self, npc_id, default=None):
+        name = self.index.get(npc_id)
+        if name is None:
+            return default
+        cfg = self._file(name).get(npc_id)
+        return default if cfg is None else cfg
+
+    def __getitem__(self, npc_id):
+        cfg = self.get(npc_id)
+        if cfg is None:
+            raise KeyError(npc_id)
+        return cfg
+
+    def __contains__(self, npc_id) -> bool:
+        return npc_id in self.index
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __iter__(self):
+        return iter(self.index)
+
+    def keys(self):
+        return self.index.keys()
+
+    def iter_all(self):
+        """(npc_id, cfg) 전부. 캐시에 넣지 않고 파일을 하나씩 읽는다(툴/워밍업용)."""
+        by_file: dict[str, list[str]] = {}
+        for npc_id, name in self.index.items():
+            by_file.setdefault(name, []).append(npc_id)
+        for name, ids in by_file.items():
+            data = self._files.get(name)
+            if data is None:
+                try:
+                    data = _read_json(os.path.join(self.root, name))
+                except Exception as e:
+                    print(f"[dialogue_db] {name} 읽기 실패:", e)
+                    continue
+            for npc_id in ids:
+                if npc_id in data:
+                    yield npc_id, data[npc_id]
+
+    def evict(self, npc_id=None) -> None:
+        """npc_id의 파일(없으면 전부)을 캐시에서 버림. 다음 get에서 다시 읽는다."""
+        if npc_id is None:
+            self._files.clear()
+            return
+        name = self.index.get(npc_id)
+        if name is not None:
+            self._files.pop(name, None)
+
+    def reload(self) -> None:
+        """index/파일 캐시 초기화(작가가 파일을 고친 뒤)."""
+        self._index = None
+        self._files.clear()
+
+
+DB = DialogueDB()
+
+
+def load(npc_id) -> dict:
+    return DB.get(npc_id, {})
+
+
+def keys():
+    return DB.keys()
+
+
+# ---------------------------------------------------------
+# 자체 점검: python dialogue_db.py
+# - index에 있는 NPC가 전부 파일에 있는지, 파일에만 있는 NPC가 없는지
+# - lines_by_visit 형식 확인
+# ---------------------------------------------------------
+def _selfcheck() -> bool:
+    ok = True
+    db = DialogueDB()
+    seen = set()
+    for npc_id, cfg in db.iter_all():
+        seen.add(npc_id)
+        lbv = cfg.get("lines_by_visit") if isinstance(cfg, dict) else None
+        if not isinstance(lbv, (list, dict)) or not lbv:
+            ok = False
+            print(f"  {npc_id}: lines_by_visit 없음/형식 오류")
+    for npc_id in db.keys():
+        if npc_id not in seen:
+            ok = False
+            print(f"  {npc_id}: index에는 있지만 {db.index[npc_id]}에 없음")
+    names = set(db.index.values())
+    for name in sorted(os.listdir(db.root)):
+        if name.endswith(".json") and name != INDEX_NAME and name not in names:
+            print(f"  경고: {name} 는 index에 없음")
+
+    # LRU: 파일 1개 캐시로 번갈아 읽으면 매번 로드, 같은 NPC 반복은 히트
+    small = DialogueDB(max_files=1)
+    ids = list(small.keys())
+    for npc_id in ids * 2:
+        small.get(npc_id)
+    small.get(ids[-1])
+    print(f"  {len(ids)} npcs in {len(names)} file(s), lru stats {small.stats}")
+    print("dialogue_db selfcheck:", "PASS" if ok else "FAIL")
+    return ok
+
+
+if __name__ == "__main__":
+    sys.exit(0 if _selfcheck() else 1)
@@ -0,0 +1,312 @@
+# dialogue_graph.py
+# ---------------------------------------------------------
+# 대사 그래프 컴파일러.
+#
+# 대사 DB의 lines_by_visit(문자열/dict/리스트 중첩)를 NPC마다 한 번만
+# 평평한 그래프로 바꾼다. 노드는 정수 id, 속성은 id로 인덱싱하는 배열.
+#
+#   text[n]         본문
+#   nxt[n]          SPACE로 넘어갈 노드(-1 = 대화 끝)
+#   choices[n]      선택지 id 튜플(없으면 ())
+#   has_choices[n]  선택지가 있는 노드인지
+#   terminal[n]     선택지 없고 nxt == -1 (마지막 줄)
+#   choice_label[c] / choice_target[c]   (target -1 = 대화 끝)
+#   visit_entry[v]  방문 세트 v(0부터)의 첫 노드
+#   node_cond[n]    노드 조건(flags.Condition, 없으면 None) - 거짓이면 건너뜀(nxt로)
+#   node_set[n]     노드가 보일 때 설정할 플래그 dict(없으면 None)
+#   rule_cond[r] / rule_entry[r]   NPC 단위 규칙: 조건이 참인 첫 규칙이 방문 세트보다 우선
+#
+# 대사 JSON 확장(flags.py 조건 문법):
+#   {"lines_by_visit": [...],
+#    "rules": [{"if": {"has": "은행의 비밀 장부"}, "lines": ["그거… 어디서 났어?"]}]}
+#   노드: {"text": "...", "if": {"visits": "lab", ">=": 1}, "set": {"quest_bank": 1}}
+#
+# 규칙은 예전 NPC 런타임과 같다
+# - 세트 안의 줄은 순서대로 nxt로 이어짐
+# - 선택지 노드에서는 SPACE로 안 넘어가고, 고른 선택지의 next(리스트/문자열)가 새 줄 목록
+#   (선택지 노드 뒤에 남은 줄은 도달 불가 → 경고)
+# - next가 없거나 비어 있으면 대화 끝
+#
+# 빌드 시 검사(validate)
+# - error  : 빈 본문, 선택지가 전부 잘못된 노드(버튼이 안 떠서 막힘 → 일반 줄로 컴파일)
+#            dict가 아닌 선택지(무시됨), 조건 문법 오류(조건 없음으로 처리)
+# - warning: 도달 불가 노드, 빈 방문 세트
+#
+# 사용 예:
+#
+#     g = graph_for("워니")          # 컴파일 결과 캐시(같은 NPC끼리 공유)
+#     n = g.entry_for_visit(3)
+#     while n != -1 and not g.has_choices[n]:
+#         print(g.text[n]); n = g.nxt[n]
+# ---------------------------------------------------------
+
+from __future__ import annotations
+import random
+from collections import OrderedDict
+
+import dialogue_db
+import flags
+
+FALLBACK_TEXT = "..."
+GRAPH_CACHE_MAX = 32
+
+
+class DialogueGraph:
+    __slots__ = ("npc_id", "text", "nxt", "choices", "has_choices", "terminal",
+                 "choice_label", "choice_target", "visit_entry",
+                 "node_cond", "node_set", "rule_cond", "rule_entry", "errors", "warnings")
+
+    def __init__(self, npc_id: str = ""):
+        self.npc_id = npc_id
+        self.text: list[str] = []
+        self.nxt: list[int] = []
+        self.choices: list[tuple] = []
+        self.has_choices: list[bool] = []
+        self.terminal: list[bool] = []
+        self.choice_label: list[str] = []
+        self.choice_target: list[int] = []
+        self.visit_entry: list[int] = []
+        self.node_cond: list = []
+        self.node_set: list = []
+        self.rule_cond: list = []
+        self.rule_entry: list[int] = []
+        self.errors: list[str] = []
+        self.warnings: list[str] = []
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+    def _rule_entry(self) -> int:
+        for cond, n in zip(self.rule_cond, self.rule_entry):
+            if cond.value:
+                return n
+        return -1
+
+    def entry_for_visit(self, visit: int) -> int:
+        """
+        방문 횟수(1부터) → 첫 노드(조건으로 건너뛴 뒤, -1이면 보여줄 줄 없음).
+        참인 규칙이 있으면 그 줄, 아니면 방문 세트. 5번째부터는 3~4번 세트 중 랜덤(세트가 4개 이상일 때).
+        """
+        n = self._rule_entry()
+        if n != -1:
+            return self.resolve(n)
+        ve = self.visit_entry
+        if visit >= 5 and len(ve) >= 4:
+            return self.resolve(random.choice((ve[2], ve[3])))
+        return self.resolve(ve[min(max(visit - 1, 0), len(ve) - 1)])
+
+    def entry_candidates(self, visit: int) -> tuple:
+        n = self._rule_entry()
+        if n != -1:
+            return (self.resolve(n),)
+        ve = self.visit_entry
+        if visit >= 5 and len(ve) >= 4:
+            return (self.resolve(ve[2]), self.resolve(ve[3]))
+        return (self.resolve(ve[min(max(visit - 1, 0), len(ve) - 1)]),)
+
+    def resolve(self, n: int) -> int:
+        """조건이 거짓인 노드를 nxt로 건너뛴 첫 노드(-1 = 끝). 조건 값은 캐시됨."""
+        conds = self.node_cond
+        while n != -1:
+            c = conds[n]
+            if c is None or c.value:
+                return n
+            n = self.nxt[n]
+        return n
+
+    def successors(self, n: int) -> list[int]:
+        """n 다음에 보일 수 있는 노드(SPACE 다음 줄 또는 선택지 결과 첫 줄)."""
+        if self.has_choices[n]:
+            return [t for t in (self.choice_target[c] for c in self.choices[n]) if t != -1]
+        return [self.nxt[n]] if self.nxt[n] != -1 else []
+
+
+# ---------------------------------------------------------
+# 컴파일
+# ---------------------------------------------------------
+class _Builder:
+    def __init__(self, npc_id: str):
+        self.g = DialogueGraph(npc_id)
+
+    def _add_node(self, text: str) -> int:
+        g = self.g
+        g.text.append(text)
+        g.nxt.append(-1)
+        g.choices.append(())
+        g.has_choices.append(False)
+        g.terminal.append(True)
+        g.node_cond.append(None)
+        g.node_set.append(None)
+        return len(g.text) - 1
+
+    def cond(self, src, where: str):
+        if src is None:
+            return None
+        try:
+            return flags.compile_condition(src)
+        except Exception as e:
+            self.g.errors.append(f"{where}: 조건 오류 {e}")
+            return None
+
+    def seq(self, lines, where: str) -> int:
+        """줄 목록 → 첫 노드 id(비어 있으면 -1)."""
+        if isinstance(lines, str):
+            lines = [lines]
+        g = self.g
+        first = prev = -1
+        prev_choices = False
+        for i, item in enumerate(lines):
+            n = self.node(item, f"{where}[{i}]")
+            if first == -1:
+                first = n
+            # 선택지 노드 뒤 줄은 SPACE로 못 감(예전 런타임과 동일) → 연결하지 않음
+            if prev != -1 and not prev_choices:
+                g.nxt[prev] = n
+            prev, prev_choices = n, g.has_choices[n]
+        return first
+
+    def node(self, item, where: str) -> int:
+        g = self.g
+        if isinstance(item, dict):
+            text = item.get("text", FALLBACK_TEXT)
+            raw = item.get("choices", [])
+        else:
+            text = "" if item is None else str(item)
+            raw = []
+        text = "" if text is None else str(text)
+        if not text.strip():
+            g.errors.append(f"{where}: 빈 본문")
+        n = self._add_node(text)
+        if isinstance(item, dict):
+            g.node_cond[n] = self.cond(item.get("if"), where)
+            st = item.get("set")
+            if isinstance(st, dict) and st:
+                g.node_set[n] = dict(st)
+            elif st is not None:
+                g.errors.append(f"{where}: set은 dict여야 함")
+
+        cids = []
+        if isinstance(raw, list):
+            for ci, ch in enumerate(raw):
+                if not isinstance(ch, dict):
+                    g.errors.append(f"{where}.choices[{ci}]: dict가 아닌 선택지(무시)")
+                    continue
+                g.choice_label.append(str(ch.get("label", f"선택 {ci + 1}")))
+                g.choice_target.append(-1)
+                cids.append(len(g.choice_label) - 1)
+                nxt = ch.get("next")
+                if isinstance(nxt, (list, str)) and nxt:
+                    g.choice_target[cids[-1]] = self.seq(nxt, f"{where}.choices[{ci}].next")
+            if raw and not cids:
+                g.errors.append(f"{where}: 선택지가 전부 잘못됨(막힘) → 일반 줄로 처리")
+        if cids:
+            g.choices[n] = tuple(cids)
+            g.has_choices[n] = True
+        return n
+
+    def finish(self) -> DialogueGraph:
+        g = self.g
+        for n in range(len(g.text)):
+            g.terminal[n] = not g.has_choices[n] and g.nxt[n] == -1
+        # 도달 가능성(방문 세트 첫 노드에서 출발)
+        seen = [False] * len(g.text)
+        stack = [e for e in g.visit_entry + g.rule_entry if e != -1]
+        while stack:
+            n = stack.pop()
+            if seen[n]:
+                continue
+            seen[n] = True
+            stack.extend(g.successors(n))
+        for n, ok in enumerate(seen):
+            if not ok:
+                g.warnings.append(f"노드 {n} 도달 불가: {g.text[n][:20]!r}")
+        return g
+
+
+def compile_lines(npc_id: str, lines_by_visit, rules=None) -> DialogueGraph:
+    """lines_by_visit(리스트, 또는 {1: [...], 2: [...]} dict) + rules → DialogueGraph."""
+    b = _Builder(npc_id)
+    for ri, rule in enumerate(rules or []):
+        where = f"rules[{ri}]"
+        if not isinstance(rule, dict) or "if" not in rule:
+            b.g.errors.append(f"{where}: {{\"if\": ..., \"lines\": [...]}} 형식이 아님")
+            continue
+        cond = b.cond(rule["if"], where)
+        first = b.seq(rule.get("lines") or [], f"{where}.lines")
+        if cond is None or first == -1:
+            b.g.errors.append(f"{where}: 조건/줄이 비어 있음(무시)")
+            continue
+        b.g.rule_cond.append(cond)
+        b.g.rule_entry.append(first)
+    if isinstance(lines_by_visit, dict):
+        sets = [v for _, v in sorted(lines_by_visit.items(), key=lambda kv: int(kv[0]))]
+    else:
+        sets = list(lines_by_visit or [])
+    if not sets:
+        b.g.warnings.append("lines_by_visit 없음 → '...'")
+        sets = [[FALLBACK_TEXT]]
+    for vi, lines in enumerate(sets):
+        first = b.seq(lines or [], f"visit[{vi}]")
+        if first == -1:
+            b.g.warnings.append(f"visit[{vi}]: 빈 세트 → '...'")
+            first = b._add_node(FALLBACK_TEXT)
+        b.g.visit_entry.append(first)
+    return b.finish()
+
+
+# ---------------------------------------------------------
+# NPC별 캐시(같은 npc_id NPC끼리 공유, 워프로 다시 만들어도 재컴파일 없음)
+# ---------------------------------------------------------
+_graphs: OrderedDict = OrderedDict()
+
+
+def graph_for(npc_id: str) -> DialogueGraph:
+    g = _graphs.get(npc_id)
+    if g is not None:
+        _graphs.move_to_end(npc_id)
+        return g
+    cfg = dialogue_db.load(npc_id)
+    g = compile_lines(npc_id, cfg.get("lines_by_visit", [[FALLBACK_TEXT]]), cfg.get("rules"))
+    for msg in g.errors:
+        print(f"[dialogue_graph] {npc_id}: {msg}")
+    _graphs[npc_id] = g
+    if len(_graphs) > GRAPH_CACHE_MAX:
+        _graphs.popitem(last=False)
+    return g
+
+
+def clear_cache() -> None:
+    _graphs.clear()
+
+
+# ---------------------------------------------------------
+# 검사: python dialogue_graph.py
+# - 대사 DB 전체를 컴파일해서 error/warning 출력, error가 있으면 종료 코드 1
+# ---------------------------------------------------------
+def _validate_all() -> bool:
+    ok = True
+    total = 0
+    for npc_id, cfg in dialogue_db.DB.iter_all():
+        g = compile_lines(npc_id, cfg.get("lines_by_visit", []), cfg.get("rules"))
+        total += len(g)
+        for msg in g.errors:
+            ok = False
+            print(f"  ERROR {npc_id}: {msg}")
+        for msg in g.warnings:
+            print(f"  warn  {npc_id}: {msg}")
+        print(f"  {npc_id}: {len(g)} nodes, {len(g.choice_label)} choices, "
+              f"{len(g.visit_entry)} visit sets, {len(g.rule_entry)} rules")
+
+    # 잘못된 데이터가 제대로 걸러지는지
+    bad = compile_lines("_test", [["", {"text": "a", "choices": ["x"]}, "b"], []])
+    expect = len(bad.errors) == 3 and any("빈 세트" in w for w in bad.warnings)
+    if not expect:
+        ok = False
+        print("  validator self-test failed:", bad.errors, bad.warnings)
+    print(f"dialogue_graph: {total} nodes", "PASS" if ok else "FAIL")
+    return ok
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(0 if _validate_all() else 1)
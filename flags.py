@@ -0,0 +1,221 @@
+# flags.py
+# ---------------------------------------------------------
+# 게임 상태 플래그 저장소 + 대사 조건 컴파일러.
+#
+# 플래그는 이름 → 값(숫자/문자열/bool). 게임 쪽에서 쓰는 이름 규칙:
+#   item:<아이템 이름>     인벤토리에 있으면 1 (Inventory.sync_flags)
+#   visits:<씬 id>        씬에 들어간 횟수 (Game.enter_scene)
+#   talks:<npc_id>        그 NPC와 대화를 시작한 횟수 (NPC._start_conversation)
+#   그 밖의 이름           퀘스트 플래그(대사 노드의 "set"으로 설정)
+#
+# 조건(대사 JSON에 그대로 씀):
+#   {"flag": "quest_bank"}                    참이면(0/""/None 아님)
+#   {"flag": "quest_bank", ">=": 2}           비교: == != > >= < <=
+#   {"has": "은행의 비밀 장부"}                 = {"flag": "item:은행의 비밀 장부"}
+#   {"visits": "casino", ">=": 2}             = {"flag": "visits:casino", ">=": 2}
+#   {"talks": "워니", ">=": 3}
+#   {"all": [...]} / {"any": [...]} / {"not": {...}}
+#
+# compile_condition은 조건을 한 번만 파이썬 클로저로 바꾸고(Condition),
+# 의존 플래그 목록(deps)을 뽑아 저장소에 등록한다.
+# 플래그가 바뀌면 그 플래그에 걸린 조건만 dirty가 되고,
+# 다음에 .value를 읽을 때 한 번 다시 계산한다(그 외에는 캐시된 bool).
+#
+# 사용 예:
+#
+#     import flags
+#     c = flags.compile_condition({"all": [{"has": "은행의 비밀 장부"}, {"visits": "lab"}]})
+#     flags.STORE.add("visits:lab")
+#     if c.value: ...
+#     flags.STORE.subscribe("visits:lab", lambda name, old, new: print(name, new))
+# ---------------------------------------------------------
+
+from __future__ import annotations
+import weakref
+import operator
+
+_OPS = {
+    "==": operator.eq, "!=": operator.ne,
+    ">": operator.gt, ">=": operator.ge,
+    "<": operator.lt, "<=": operator.le,
+}
+
+# 조건 키 → 플래그 이름 접두어
+_SUGAR = {"has": "item:", "visits": "visits:", "talks": "talks:"}
+
+
+class FlagStore:
+    """이름 → 값. 값이 바뀔 때만 구독자/조건에 알림."""
+
+    def __init__(self):
+        self._values: dict = {}
+        self._subs: dict[str, list] = {}                    # name -> [callback(name, old, new)]
+        self._conds: dict[str, weakref.WeakSet] = {}        # name -> 의존 Condition들
+        self.changes = 0
+
+    def get(self, name: str, default=0):
+        return self._values.get(name, default)
+
+    def set(self, name: str, value) -> None:
+        old = self._values.get(name, 0)
+        if old == value and name in self._values:
+            return
+        self._values[name] = value
+        self.changes += 1
+        ws = self._conds.get(name)
+        if ws:
+            for c in ws:
+                c.dirty = True
+        for cb in self._subs.get(name, ()):
+            try:
+                cb(name, old, value)
+            except Exception as e:
+                print(f"[flags] 구독자 오류({name}):", e)
+
+    def add(self, name: str, n=1) -> None:
+        self.set(name, self._values.get(name, 0) + n)
+
+    def update(self, values: dict) -> None:
+        for k, v in values.items():
+            self.set(k, v)
+
+    def subscribe(self, name: str, callback) -> None:
+        self._subs.setdefault(name, []).append(callback)
+
+    def unsubscribe(self, name: str, callback) -> None:
+        subs = self._subs.get(name)
+        if subs and callback in subs:
+            subs.remove(callback)
+
+    def _watch(self, cond: "Condition") -> None:
+        for name in cond.deps:
+            ws = self._conds.get(name)
+            if ws is None:
+                ws = self._conds[name] = weakref.WeakSet()
+            ws.add(cond)
+
+    def to_dict(self) -> dict:
+        return dict(self._values)
+
+    def load_dict(self, values: dict) -> None:
+        """저장된 값으로 통째로 교체(저장본에 없는 플래그는 0으로, 알림 포함)."""
+        for k in list(self._values):
+            if k not in values:
+                self.set(k, 0)
+        self.update(values)
+
+
+class Condition:
+    """컴파일된 조건. value는 의존 플래그가 바뀐 뒤 처음 읽을 때만 다시 계산."""
+    __slots__ = ("src", "deps", "_fn", "_value", "dirty", "evals", "__weakref__")
+
+    def __init__(self, src, fn, deps, store: FlagStore):
+        self.src = src
+        self.deps = frozenset(deps)
+        self._fn = fn
+        self._value = False
+        self.dirty = True
+        self.evals = 0
+        store._watch(self)
+
+    @property
+    def value(self) -> bool:
+        if self.dirty:
+            self._value = bool(self._fn())
+            self.dirty = False
+            self.evals += 1
+        return self._value
+
+    def __bool__(self) -> bool:
+        return self.value
+
+
+def _compile(src, store: FlagStore, deps: set):
+    """조건 dict → 인자 없는 클로저. deps에 의존 플래그 이름을 모은다."""
+    if src is None or src is True:
+        return lambda: True
+    if src is False:
+        return lambda: False
+    if isinstance(src, list):
+        src = {"all": src}
+    if not isinstance(src, dict):
+        raise ValueError(f"조건 형식 오류: {src!r}")
+
+    if "all" in src:
+        parts = tuple(_compile(c, store, deps) for c in src["all"])
+        return lambda: all(f() for f in parts)
+    if "any" in src:
+        parts = tuple(_compile(c, store, deps) for c in src["any"])
+        return lambda: any(f() for f in parts)
+    if "not" in src:
+        inner = _compile(src["not"], store, deps)
+        return lambda: not inner()
+
+    name = None
+    if "flag" in src:
+        name = str(src["flag"])
+    else:
+        for key, prefix in _SUGAR.items():
+            if key in src:
+                name = prefix + str(src[key])
+                break
+    if name is None:
+        raise ValueError(f"조건 키 없음(flag/has/visits/talks/all/any/not): {src!r}")
+    deps.add(name)
+
+    values = store._values
+    for op, fn in _OPS.items():
+        if op in src:
+            rhs = src[op]
+            return lambda: fn(values.get(name, 0), rhs)
+    return lambda: bool(values.get(name, 0))
+
+
+STORE = FlagStore()
+
+
+def compile_condition(src, store: FlagStore | None = None) -> Condition:
+    store = STORE if store is None else store
+    deps: set = set()
+    fn = _compile(src, store, deps)
+    return Condition(src, fn, deps, store)
+
+
+# ---------------------------------------------------------
+# 자체 점검: python flags.py
+# - 의존 플래그가 바뀔 때만 재계산되는지, 관계없는 플래그 변경은 무시되는지
+# ---------------------------------------------------------
+def _selfcheck() -> bool:
+    import time
+    st = FlagStore()
+    c = compile_condition({"all": [{"has": "은행의 비밀 장부"}, {"visits": "lab", ">=": 1},
+                                   {"not": {"flag": "워니_장부"}}]}, st)
+    ok = c.deps == {"item:은행의 비밀 장부", "visits:lab", "워니_장부"}
+    ok &= c.value is False and c.evals == 1
+    st.set("item:은행의 비밀 장부", 1)
+    st.add("visits:lab")
+    ok &= c.value is True and c.evals == 2
+    st.set("unrelated", 5)
+    for _ in range(1000):
+        c.value
+    ok &= c.evals == 2
+    seen = []
+    st.subscribe("워니_장부", lambda n, o, v: seen.append((n, o, v)))
+    st.set("워니_장부", 1)
+    ok &= c.value is False and seen == [("워니_장부", 0, 1)]
+
+    # 많은 조건 × 매 프레임 조회 비용
+    conds = [compile_condition({"talks": f"npc{i}", ">=": 2}, st) for i in range(1000)]
+    t0 = time.perf_counter()
+    for _ in range(100):
+        for cc in conds:
+            cc.value
+    us = (time.perf_counter() - t0) / (100 * len(conds)) * 1e6
+    print(f"  1000 conditions: {us:.3f}us/query (cached), evals={sum(x.evals for x in conds)}")
+    print("flags selfcheck:", "PASS" if ok else "FAIL")
+    return bool(ok)
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(0 if _selfcheck() else 1)
@@ -0,0 +1,172 @@
+# fonts.py
+# ---------------------------------------------------------
+# 프로세스 공용 폰트 레지스트리.
+#
+# pygame.font.SysFont는 처음 호출 때 시스템 폰트 목록을 훑고(리눅스 fc-list 등, 폰트가 많으면 느림)
+# 호출마다 Font 객체를 새로 만든다. NPC/WarpGate가 워프마다 새로 생성되면서
+# 같은 크기 폰트를 계속 다시 만들었다.
+#
+# 여기서는
+# - FONT_NAME(+굵게/기울임) → 폰트 파일 경로를 한 번만 찾는다(pygame.font.match_font)
+# - Font 객체를 (이름, 크기, 굵게, 기울임) 단위로 캐시 → 같은 폰트를 모두가 공유
+#   (textlayout 글자 폭 / glyphatlas 아틀라스 캐시도 폰트 단위라 같이 공유된다)
+# - FONT_CACHE_FILE이 있으면 찾은 경로를 저장 → 다음 실행은 시스템 스캔 없이 바로 로드
+#   (파일이 없어졌으면 다시 찾음, 못 찾은 결과는 저장하지 않음)
+# - 못 찾으면 pygame 기본 폰트(SysFont와 같은 fallback)
+#
+# 사용 예:
+#
+#     import fonts
+#     font = fonts.get(18)                    # settings.FONT_NAME
+#     big = fonts.get(22, "malgungothic", bold=True)
+# ---------------------------------------------------------
+
+from __future__ import annotations
+import os
+import sys
+import json
+import pygame
+
+import settings as S
+
+_fonts: dict = {}            # (name, size, bold, italic) -> Font
+_paths: dict = {}            # "name|b|i" -> 경로("" = 기본 폰트)
+_paths_loaded = False
+stats = {"hits": 0, "fonts": 0, "scans": 0}
+
+
+def _base_dir() -> str:
+    # main.base_dir과 같은 규칙(exe로 실행 중이면 exe 위치)
+    if getattr(sys, "frozen", False):
+        return os.path.dirname(sys.executable)
+    return os.path.dirname(os.path.abspath(__file__))
+
+
+def _cache_file():
+    name = getattr(S, "FONT_CACHE_FILE", None)
+    if not name:
+        return None
+    return name if os.path.isabs(name) else os.path.join(_base_dir(), name)
+
+
+def _load_paths() -> None:
+    global _paths_loaded
+    _paths_loaded = True
+    path = _cache_file()
+    if not path or not os.path.exists(path):
+        return
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        for k, v in data.items():
+            # 저장된 파일이 사라졌으면 버리고 다시 찾게 둔다
+            if v and os.path.exists(v):
+                _paths[k] = v
+    except Exception as e:
+        print("[fonts] 폰트 경로 캐시 읽기 실패:", e)
+
+
+def _save_paths() -> None:
+    path = _cache_file()
+    if not path:
+        return
+    try:
+        # 못 찾은 폰트("")는 저장 안 함 → 나중에 설치하면 다음 실행에서 찾음
+        found = {k: v for k, v in _paths.items() if v}
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(found, f, ensure_ascii=False, indent=1)
+    except Exception as e:
+        print("[fonts] 폰트 경로 캐시 저장 실패:", e)
+
+
+def resolve(name=None, bold: bool = False, italic: bool = False) -> str:
+    """폰트 이름 → 파일 경로("" = pygame 기본 폰트). 프로세스당 한 번만 스캔."""
+    if name is None:
+        name = getattr(S, "FONT_NAME", None)
+    if not _paths_loaded:
+        _load_paths()
+    key = f"{name or ''}|{int(bold)}|{int(italic)}"
+    path = _paths.get(key)
+    if path is not None:
+        return path
+    path = ""
+    if name:
+        stats["scans"] += 1
+        try:
+            path = pygame.font.match_font(name, bold, italic) or ""
+        except Exception as e:
+            print(f"[fonts] match_font 실패({name}):", e)
+    if not path and name:
+        print(f"[fonts] '{name}' 없음 → 기본 폰트")
+    _paths[key] = path
+    if path:
+        _save_paths()
+    return path
+
+
+def get(size: int, name=None, bold: bool = False, italic: bool = False) -> pygame.font.Font:
+    """공유 Font. 받은 쪽에서 set_bold 등으로 상태를 바꾸지 말 것."""
+    if not pygame.font.get_init():
+        # pygame.quit() 뒤 다시 init하면 예전 Font 객체는 못 씀
+        pygame.font.init()
+        _fonts.clear()
+    if name is None:
+        name = getattr(S, "FONT_NAME", None)
+    key = (name, int(size), bool(bold), bool(italic))
+    f = _fonts.get(key)
+    if f is not None:
+        stats["hits"] += 1
+        return f
+
+    path = resolve(name, bold, italic)
+    try:
+        f = pygame.font.Font(path or None, int(size))
+    except Exception as e:
+        print(f"[fonts] 폰트 로드 실패({path}):", e)
+        f = pygame.font.Font(None, int(size))
+    # 스타일 전용 파일을 못 찾았으면 합성 굵게/기울임(SysFont와 동일)
+    if bold and not path:
+        f.set_bold(True)
+    if italic and not path:
+        f.set_italic(True)
+    _fonts[key] = f
+    stats["fonts"] += 1
+    return f
+
+
+def clear() -> None:
+    _fonts.clear()
+
+
+# ---------------------------------------------------------
+# 벤치마크: python fonts.py
+# 씬 재생성(NPC 폰트 2개 + 게이트 폰트 1개) 비용: SysFont vs 레지스트리
+# ---------------------------------------------------------
+def _bench(rounds: int = 200):
+    import time
+
+    pygame.font.init()
+    name = getattr(S, "FONT_NAME", None)
+    t0 = time.perf_counter()
+    pygame.font.SysFont(name, 18)
+    t_first = (time.perf_counter() - t0) * 1000
+
+    t0 = time.perf_counter()
+    for _ in range(rounds):
+        pygame.font.SysFont(name, 18)
+        pygame.font.SysFont(name, 22)
+        pygame.font.SysFont(name, 18)
+    t_sys = (time.perf_counter() - t0) / rounds * 1000
+
+    t0 = time.perf_counter()
+    for _ in range(rounds):
+        get(18)
+        get(22)
+        get(18)
+    t_reg = (time.perf_counter() - t0) / rounds * 1000
+    print(f"[fonts] first SysFont (system scan) {t_first:.2f}ms")
+    print(f"[fonts] per scene rebuild: SysFont x3 {t_sys:.3f}ms | registry x3 {t_reg:.4f}ms | {stats}")
+
+
+if __name__ == "__main__":
+    _bench()
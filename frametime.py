@@ -0,0 +1,131 @@
+# frametime.py
+# ---------------------------------------------------------
+# 프레임 시간 측정 유틸.
+#
+# clock.tick(S.FPS)가 돌려주는 dt에는 "잠자며 기다린 시간"이 섞여 있어
+# 실제로 얼마나 무거운 프레임이었는지 알 수 없다.
+# pygame.time.Clock.get_rawtime()은 대기 시간을 뺀 "일한 시간(ms)"이므로
+# 이 값을 최근 N프레임 창(window)에 모아 예산(1000 / FPS) 대비 판단한다.
+# ---------------------------------------------------------
+
+from __future__ import annotations
+from collections import deque
+
+import settings as S
+
+
+def frame_budget_ms(fps=None) -> float:
+    """목표 FPS에서 한 프레임에 쓸 수 있는 시간(ms)."""
+    fps = fps or getattr(S, "FPS", 60)
+    return 1000.0 / max(1, fps)
+
+
+class FrameTimeWindow:
+    """최근 size 프레임의 작업 시간(ms) 이동 창."""
+
+    def __init__(self, size: int = 30):
+        self.size = size
+        self._buf: deque[float] = deque(maxlen=size)
+        self._sum = 0.0
+
+    def push(self, ms: float) -> None:
+        if len(self._buf) == self._buf.maxlen:
+            self._sum -= self._buf[0]
+        self._buf.append(ms)
+        self._sum += ms
+
+    def clear(self) -> None:
+        self._buf.clear()
+        self._sum = 0.0
+
+    @property
+    def full(self) -> bool:
+        return len(self._buf) == self._buf.maxlen
+
+    @property
+    def mean(self) -> float:
+        return self._sum / len(self._buf) if self._buf else 0.0
+
+    def percentile(self, q: float) -> float:
+        """q(0~1) 분위수. 창이 작아서 매번 정렬해도 싸다."""
+        if not self._buf:
+            return 0.0
+        xs = sorted(self._buf)
+        i = min(len(xs) - 1, max(0, int(q * (len(xs) - 1) + 0.5)))
+        return xs[i]
+
+
+class Histogram:
+    """
+    고정 폭(bin_ms) 히스토그램. 마지막 칸은 overflow(그 이상 전부).
+    프레임마다 push해도 리스트 인덱스 하나만 증가시키므로 싸다.
+    """
+
+    def __init__(self, bin_ms: float = 1.0, bins: int = 50):
+        self.bin_ms = bin_ms
+        self.counts = [0] * (bins + 1)
+        self.n = 0
+        self._sum = 0.0
+        self._sq = 0.0
+        self.max = 0.0
+
+    def push(self, ms: float) -> None:
+        i = int(ms / self.bin_ms)
+        if i >= len(self.counts):
+            i = len(self.counts) - 1
+        elif i < 0:
+            i = 0
+        self.counts[i] += 1
+        self.n += 1
+        self._sum += ms
+        self._sq += ms * ms
+        if ms > self.max:
+            self.max = ms
+
+    @property
+    def mean(self) -> float:
+        return self._sum / self.n if self.n else 0.0
+
+    @property
+    def stdev(self) -> float:
+        if self.n < 2:
+            return 0.0
+        m = self.mean
+        return max(0.0, self._sq / self.n - m * m) ** 0.5
+
+    def percentile(self, q: float) -> float:
+        """칸 경계 기준 근사 분위수(ms)."""
+        if not self.n:
+            return 0.0
+        need = q * self.n
+        acc = 0
+        for i, c in enumerate(self.counts):
+            acc += c
+            if acc >= need:
+                return (i + 1) * self.bin_ms
+        return len(self.counts) * self.bin_ms
+
+    def to_dict(self) -> dict:
+        return {
+            "bin_ms": self.bin_ms,
+            "counts": list(self.counts),
+            "n": self.n,
+            "mean": round(self.mean, 3),
+            "stdev": round(self.stdev, 3),
+            "p50": self.percentile(0.5),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99),
+            "max": round(self.max, 3),
+        }
+
+    def format(self, width: int = 40) -> str:
+        """콘솔 출력용 막대 그래프(빈 칸은 생략)."""
+        peak = max(self.counts) or 1
+        rows = []
+        for i, c in enumerate(self.counts):
+            if not c:
+                continue
+            lo = i * self.bin_ms
+            label = f">={lo:5.1f}" if i == len(self.counts) - 1 else f"{lo:5.1f}~{lo + self.bin_ms:5.1f}"
+            rows.append(f"  {label}ms | {'#' * max(1, int(c / peak * width))} {c}")
+        return "\n".join(rows)
@@ -0,0 +1,257 @@
+# glyphatlas.py
+# ---------------------------------------------------------
+# 글리프 아틀라스 텍스트 렌더러(선택 기능, settings.GLYPH_ATLAS).
+#
+# font.render는 호출마다 문자열 전체를 FreeType으로 래스터화한다.
+# 한글은 글자 종류가 많아 SDL_ttf 글리프 캐시에도 잘 안 남아서
+# 대사/힌트/HUD 한 줄마다 비싼 호출이 된다.
+#
+# 여기서는
+# - (폰트, 색)마다 글자를 한 번씩만 그려 아틀라스 페이지(512x512)에 선반(shelf) 배치
+#   (색을 나중에 BLEND_RGBA_MULT로 입히는 것보다 색별 아틀라스가 싸다 - UI 색은 몇 개뿐)
+# - 문자열은 아틀라스 sub-rect를 Surface.blits 한 번으로 이어 붙인다
+# - 아틀라스에 없는 글자는 처음 쓰일 때 추가(lazy)
+# - warmup(font)은 대사 DB(dialogue/) / STORY_DATA / UI 문자열에 쓰인 글자를 미리 넣는다
+#   (씬 로딩 중 NPC 생성 시점에 호출 → 대화 중 스파이크 없음)
+#
+# - 합성한 줄은 아틀라스(폰트, 색)마다 문자열 단위 LRU에 보관 → 매 프레임 같은 HUD/힌트 줄은 blit만
+#
+# 커닝은 적용하지 않는다(한글은 커닝 쌍이 거의 없음).
+# 돌려준 surface는 캐시와 공유되므로 받는 쪽에서 수정하지 말 것.
+#
+# 사용 예:
+#
+#     from glyphatlas import render_text
+#     img = render_text(font, "안녕 오늘도 하루가 시작됐네", (235, 235, 240))
+# ---------------------------------------------------------
+
+from __future__ import annotations
+import weakref
+from collections import OrderedDict
+import pygame
+
+import settings as S
+
+PAGE_SIZE = 512
+LINE_CACHE_MAX = 256
+
+# 코드에 직접 쓰인 UI 문자열(대사 DB 밖) - 미리 넣어 둘 글자
+UI_TEXT = (
+    "인벤토리 (E로 닫기) 사진 무기 소모품 불러오는 중... "
+    "F: 대화하기 SPACE: 다음  |  마지막에서 닫힘 번째 만남 · "
+    "카지노: A/D 이동  SPACE 대화  E 인벤  F 워프 "
+    "연구실: WASD 이동(아이작 시점)  SPACE 대화  E 인벤  F 워프 현재 씬: "
+    "연구실로 이동 카지노로 돌아가기 "
+    "0123456789 abcdefghijklmnopqrstuvwxyz ABCDEFGHIJKLMNOPQRSTUVWXYZ .,!?:;()[]-_/'\"~…"
+)
+
+
+class GlyphAtlas:
+    """(폰트, 색) 하나의 글리프 아틀라스."""
+
+    def __init__(self, font, color=(255, 255, 255)):
+        self.font = font
+        self.color = tuple(color[:3])
+        self.height = font.get_height()
+        self.pages: list[pygame.Surface] = []
+        self.glyphs: dict[str, tuple] = {}      # ch -> (page, area Rect, advance)
+        self.lines: OrderedDict = OrderedDict()  # text -> 합성된 줄
+        self._x = self._y = self._row_h = 0
+        self._new_page()
+
+    def _new_page(self) -> None:
+        self.pages.append(pygame.Surface((PAGE_SIZE, PAGE_SIZE), pygame.SRCALPHA))
+        self._x = self._y = self._row_h = 0
+
+    def add(self, ch: str):
+        g = self.glyphs.get(ch)
+        if g is not None:
+            return g
+        img = self.font.render(ch, True, self.color)
+        w, h = img.get_size()
+        try:
+            adv = self.font.metrics(ch)[0][4]
+        except Exception:
+            adv = w
+        # 선반 배치: 줄이 차면 다음 줄, 페이지가 차면 새 페이지
+        if self._x + w > PAGE_SIZE:
+            self._x = 0
+            self._y += self._row_h + 1
+            self._row_h = 0
+        if self._y + h > PAGE_SIZE:
+            self._new_page()
+        page = self.pages[-1]
+        area = pygame.Rect(self._x, self._y, w, h)
+        page.blit(img, area)
+        self._x += w + 1
+        self._row_h = max(self._row_h, h)
+        g = (page, area, adv)
+        self.glyphs[ch] = g
+        return g
+
+    def add_text(self, text: str) -> None:
+        for ch in dict.fromkeys(text):
+            if ch not in self.glyphs and ch not in "\n\t":
+                self.add(ch)
+
+    def render(self, text: str) -> pygame.Surface:
+        """합성 결과를 text 단위 LRU에 캐시."""
+        img = self.lines.get(text)
+        if img is not None:
+            self.lines.move_to_end(text)
+            return img
+        img = self.compose(text)
+        self.lines[text] = img
+        if len(self.lines) > LINE_CACHE_MAX:
+            self.lines.popitem(last=False)
+        return img
+
+    def compose(self, text: str) -> pygame.Surface:
+        """아틀라스 sub-rect를 blits로 이어 붙여 새 surface 생성(캐시 없음)."""
+        glyphs = self.glyphs
+        seq = []
+        x = 0
+        for ch in text:
+            g = glyphs.get(ch) or self.add(ch)
+            # 빈 surface 위 복사라 블렌딩 대신 MAX(겹치는 가장자리만 합쳐짐)
+            seq.append((g[0], (x, 0), g[1], pygame.BLEND_RGBA_MAX))
+            x += g[2]
+        # 마지막 글자 글리프가 advance보다 넓을 수 있음(기울임 등)
+        w = max(1, x, (seq[-1][1][0] + seq[-1][2].w) if seq else 1)
+        out = pygame.Surface((w, self.height), pygame.SRCALPHA)
+        out.blits(seq, doreturn=False)
+        return out
+
+
+_atlases: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def enabled() -> bool:
+    return bool(getattr(S, "GLYPH_ATLAS", False))
+
+
+def atlas_for(font, color) -> GlyphAtlas:
+    by_color = _atlases.get(font)
+    if by_color is None:
+        by_color = _atlases[font] = {}
+    key = tuple(color[:3])
+    a = by_color.get(key)
+    if a is None:
+        a = by_color[key] = GlyphAtlas(font, key)
+    return a
+
+
+def render_text(font, text, color) -> pygame.Surface:
+    """font.render(text, True, color) 대체. 아틀라스가 꺼져 있으면 그대로 font.render."""
+    if not enabled() or not text:
+        return font.render(text, True, color)
+    return atlas_for(font, color).render(text)
+
+
+def _walk_strings(obj, out: list) -> None:
+    if isinstance(obj, str):
+        out.append(obj)
+    elif isinstance(obj, dict):
+        for v in obj.values():
+            _walk_strings(v, out)
+    elif isinstance(obj, (list, tuple)):
+        for v in obj:
+            _walk_strings(v, out)
+
+
+def content_text() -> str:
+    """아틀라스에 미리 넣을 글자들: 대사 DB(캐시 안 거침) + 스토리 + UI 문자열."""
+    texts: list[str] = [UI_TEXT]
+    try:
+        import dialogue_db
+        for npc_id, cfg in dialogue_db.DB.iter_all():
+            texts.append(npc_id)
+            _walk_strings(cfg, texts)
+    except Exception as e:
+        print("[glyphatlas] 대사 DB 읽기 실패:", e)
+    try:
+        from story import STORY_DATA
+        _walk_strings(STORY_DATA, texts)
+        texts += list(STORY_DATA.keys())
+    except Exception as e:
+        print("[glyphatlas] STORY_DATA 읽기 실패:", e)
+    return "".join(dict.fromkeys("".join(texts)))
+
+
+_content_chars = None
+
+
+def warmup(font, *colors) -> None:
+    """(font, 색)별 아틀라스를 만들고 콘텐츠 글자를 미리 넣는다(켜져 있을 때만)."""
+    global _content_chars
+    if not enabled():
+        return
+    if _content_chars is None:
+        _content_chars = content_text()
+    for c in colors:
+        atlas_for(font, c).add_text(_content_chars)
+
+
+# ---------------------------------------------------------
+# 벤치마크: python glyphatlas.py
+# 대표 대사 줄을 font.render vs 아틀라스 합성으로 반복 렌더
+# ---------------------------------------------------------
+def _bench(font_path=None, rounds: int = 300):
+    import time
+
+    pygame.init()
+    pygame.display.set_mode((64, 64))
+    if font_path:
+        font = pygame.font.Font(font_path, 18)
+        name = font_path
+    else:
+        import fonts
+        name = getattr(S, "FONT_NAME", None)
+        font = fonts.get(18)
+
+    lines = [
+        "안녕 오늘도 하루가 시작됐네",
+        "진짜 오늘도 일가고 내일도 일가고",
+        "주 100시간제가 도입된대…",
+        "워니  ·  3번째 만남",
+        "SPACE: 다음  |  마지막에서 닫힘",
+        "카지노: A/D 이동  SPACE 대화  E 인벤  F 워프",
+    ]
+    color = (235, 235, 240)
+
+    t0 = time.perf_counter()
+    chars = content_text()
+    atlas = GlyphAtlas(font, color)
+    atlas.add_text(chars)
+    t_build = (time.perf_counter() - t0) * 1000
+
+    t0 = time.perf_counter()
+    for _ in range(rounds):
+        for s in lines:
+            font.render(s, True, color)
+    t_font = (time.perf_counter() - t0) / (rounds * len(lines)) * 1e6
+
+    t0 = time.perf_counter()
+    for _ in range(rounds):
+        for s in lines:
+            atlas.compose(s)
+    t_compose = (time.perf_counter() - t0) / (rounds * len(lines)) * 1e6
+
+    t0 = time.perf_counter()
+    for _ in range(rounds):
+        for s in lines:
+            atlas.render(s)
+    t_cached = (time.perf_counter() - t0) / (rounds * len(lines)) * 1e6
+
+    # 같은 문자열 폭 비교(커닝 미적용 차이)
+    dw = max(abs(font.size(s)[0] - atlas.compose(s).get_width()) for s in lines)
+    print(f"[glyphatlas] font={name} 18px, {len(chars)} glyphs, "
+          f"{len(atlas.pages)} page(s), build {t_build:.1f}ms")
+    print(f"[glyphatlas] font.render {t_font:.1f}us/line | atlas compose {t_compose:.1f}us/line "
+          f"| atlas cached line {t_cached:.1f}us/line | max width diff {dw}px")
+
+
+if __name__ == "__main__":
+    # python glyphatlas.py [폰트 파일.ttf]  (예: C:/Windows/Fonts/malgun.ttf)
+    import sys
+    _bench(sys.argv[1] if len(sys.argv) > 1 else None)
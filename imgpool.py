@@ -0,0 +1,190 @@
+# imgpool.py
+# ---------------------------------------------------------
+# 내용 해시로 같은 이미지를 surface 하나로 공유하는 풀.
+#
+# map_system 타일 캐시는 경로, Level 사진 캐시는 (경로, w, h) 단위라서
+# 경로만 다르고 내용이 같은 이미지(복사해 둔 타일, 오버라이드 여러 칸 등)를
+# 따로 디코딩해 따로 들고 있었다.
+#
+# 두 단계로 찾는다.
+#   1) 파일 바이트 해시 + 목표 크기 → 디코딩 전에 확인, 같으면 디코딩 생략(decodes_skipped)
+#   2) 픽셀 해시 → 파일은 달라도(형식/경로) 픽셀이 같으면 공유
+#      (Level 사진은 리샘플링 뒤 픽셀, map_system 타일은 32비트로 맞춘 원본 + 목표 크기)
+# 풀은 약한 참조라서, 캐시(LRU 등)가 다 놓으면 surface도 같이 해제된다.
+#
+# 주의: 공유 surface는 여러 곳에서 같이 그린다 → 받은 쪽에서 수정(fill/blit/set_alpha 등) 금지
+#
+# 해시 계산(read, pixel_key)은 워커 스레드에서 해도 되고, 찾기/등록은 메인 스레드에서.
+#
+# 사용 예:
+#
+#     pool = ImagePool("tiles")
+#     fkey, data = pool.read(path, (256, 256))
+#     img = pool.get_file(fkey)               # 같은 파일 + 같은 크기가 살아 있으면 그대로
+#     if img is None:
+#         img = decode(data) ...
+#         img = pool.intern(img, fkey)        # 픽셀이 같은 surface가 있으면 그것
+#     print(pool.report())
+# ---------------------------------------------------------
+
+from __future__ import annotations
+import hashlib
+import weakref
+
+import pygame
+
+
+def _digest(buf) -> bytes:
+    return hashlib.blake2b(buf, digest_size=16).digest()
+
+
+def pixel_key(img) -> tuple:
+    """픽셀 내용 키(크기/포맷 포함)."""
+    if img.get_parent() is not None:
+        # subsurface 버퍼는 부모 pitch 단위라 옆 픽셀까지 섞임 → 자기 영역만 복사해서
+        return (img.get_size(), 32, 0, _digest(pygame.image.tobytes(img, "RGBA")))
+    return (img.get_size(), img.get_bitsize(), img.get_pitch(), _digest(img.get_buffer()))
+
+
+def surface_bytes(img) -> int:
+    return 0 if img is None else img.get_bytesize() * img.get_width() * img.get_height()
+
+
+class ImagePool:
+    def __init__(self, name: str):
+        self.name = name
+        self._by_file: "weakref.WeakValueDictionary" = weakref.WeakValueDictionary()
+        self._by_pixels: "weakref.WeakValueDictionary" = weakref.WeakValueDictionary()
+        self.stats = {"loads": 0, "unique": 0, "shared": 0, "decodes_skipped": 0, "saved_bytes": 0}
+
+    # -------------------------
+    # 1) 파일 바이트
+    # -------------------------
+    def read(self, path: str, size) -> tuple:
+        """파일을 한 번 읽어 (파일 키, 바이트) 반환. 바이트는 그대로 디코딩에 쓴다(BytesIO)."""
+        with open(path, "rb") as f:
+            data = f.read()
+        return (_digest(data), tuple(size)), data
+
+    def _hit(self, img) -> None:
+        self.stats["loads"] += 1
+        self.stats["shared"] += 1
+        self.stats["saved_bytes"] += surface_bytes(img)
+
+    def get_file(self, file_key, skipped: bool = True):
+        """
+        같은 파일 내용 + 같은 목표 크기의 surface가 살아 있으면 반환(디코딩 생략).
+        skipped=False: 이미 디코딩한 뒤(워커 스레드 결과)라 decodes_skipped로는 안 셈.
+        """
+        if file_key is None:
+            return None
+        img = self._by_file.get(file_key)
+        if img is not None:
+            self._hit(img)
+            if skipped:
+                self.stats["decodes_skipped"] += 1
+        return img
+
+    # -------------------------
+    # 2) 픽셀
+    # -------------------------
+    def get_pixels(self, pkey, file_key=None):
+        """픽셀 키가 같은 surface가 살아 있으면 반환(file_key도 그 surface로 등록)."""
+        img = self._by_pixels.get(pkey)
+        if img is not None:
+            self._hit(img)
+            if file_key is not None:
+                self._by_file[file_key] = img
+        return img
+
+    def add(self, img, pkey, file_key=None):
+        self.stats["loads"] += 1
+        self.stats["unique"] += 1
+        self._by_pixels[pkey] = img
+        if file_key is not None:
+            self._by_file[file_key] = img
+        return img
+
+    def intern(self, img, file_key=None):
+        """img와 픽셀이 같은 surface가 있으면 그것을, 없으면 img를 등록해 반환."""
+        if img is None:
+            return None
+        pkey = pixel_key(img)
+        found = self.get_pixels(pkey, file_key)
+        return found if found is not None else self.add(img, pkey, file_key)
+
+    def reset_stats(self) -> None:
+        for k in self.stats:
+            self.stats[k] = 0
+
+    def report(self) -> str:
+        st = self.stats
+        return (f"[imgpool] {self.name}: {st['loads']} loads -> {st['unique']} unique, "
+                f"{st['shared']} shared ({st['decodes_skipped']} decodes skipped), "
+                f"saved {st['saved_bytes'] / 2**20:.2f}MB")
+
+
+# ---------------------------------------------------------
+# 맵별 보고: python imgpool.py
+# - map_system 맵(city 타일 + 오버라이드)과 main.SCENES 맵(Level 사진)을 불러
+#   공유된 수 / 아낀 메모리 출력
+# - 오버라이드 예시: "test codes.py"처럼 모든 칸을 assets/white.png로 바꾼 경우도 같이
+# ---------------------------------------------------------
+def _report_maps():
+    import os
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    pygame.display.set_mode((64, 64))
+    import map_system as M
+    import main
+    from level import Level
+
+    def tiles(label, overrides=None):
+        M.TILE_ATLAS = False
+        M.set_current_map("city", tile_folder="assets/map_city")
+        for (r, c), p in (overrides or {}).items():
+            M.set_tile_override(r, c, p)
+        M.TILE_POOL.reset_stats()
+        table = M._path_table()
+        for r in range(1, M.MAP_ROWS + 1):
+            for c in range(1, M.MAP_COLS + 1):
+                M.load_image_cached(table[r][c])
+        print(M.TILE_POOL.report().replace("tiles:", f"tiles {label}:")
+              + f" | cache {M.cache_bytes() / 2**20:.2f}MB")
+
+    tiles("city")
+    # 절반 칸을 같은 파일의 다른 경로 사본으로(경로 키로는 못 잡는 경우)
+    import tempfile
+    import shutil
+    tmp = tempfile.mkdtemp(prefix="dedup_")
+    copies = {}
+    for r in range(1, 7):
+        for c in range(1, M.MAP_COLS + 1):
+            dst = os.path.join(tmp, f"copy_{r}_{c}.png")
+            shutil.copy("assets/map_city/1-1.png", dst)
+            copies[(r, c)] = dst
+    tiles("city + 72 copied overrides", copies)
+    # 다른 형식으로 다시 저장한 사본(파일 바이트는 다르고 픽셀은 같음 → 픽셀 해시로 공유)
+    reenc = {}
+    src = pygame.image.load("assets/map_city/1-1.png")
+    for c in range(2, M.MAP_COLS + 1):
+        dst = os.path.join(tmp, f"reenc_{c}.bmp")
+        pygame.image.save(src, dst)
+        reenc[(1, c)] = dst
+    tiles("city + 11 re-encoded copies of 1-1", reenc)
+    tiles("city + white.png overrides", {(r, c): "assets/white.png"
+                                        for r in range(1, M.MAP_ROWS + 1) for c in range(1, M.MAP_COLS + 1)})
+
+    from level import PHOTO_POOL
+    for sid, spec in main.SCENES.items():
+        PHOTO_POOL.reset_stats()
+        lv = Level(main.p(spec["map"]))
+        for _ in lv.iter_preload_photos():
+            pass
+        print(PHOTO_POOL.report().replace("photos:", f"photos {sid}:"))
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    _report_maps()
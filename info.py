@@ -10,32 +10,24 @@
 import pygame
 from settings import SCREEN_W, SCREEN_H, FONT_NAME, FPS
 from level import Level
+import fonts
 
-# npc.py의 DB를 그대로 가져와 글자 확인
-try:
-    from npc import DIALOGUE_DB
-except Exception:
-    DIALOGUE_DB = {}
-
-def _sysfont(name, size):
-    try:
-        return pygame.font.SysFont(name, size)
-    except Exception:
-        return pygame.font.SysFont(None, size)
+# 게임과 같은 대사 로더(dialogue/*.json, 보는 NPC 파일만 읽음)
+import dialogue_db
 
 def main():
     pygame.init()
     screen = pygame.display.set_mode((SCREEN_W, SCREEN_H))
     clock = pygame.time.Clock()
-    font = _sysfont(FONT_NAME, 18)
-    big = _sysfont(FONT_NAME, 22)
+    font = fonts.get(18, FONT_NAME)
+    big = fonts.get(22, FONT_NAME)
 
     map_files = ["casino_map.json", "map_lab.json"]
     map_index = 0
 
     level = Level(map_files[map_index])
 
-    npc_keys = list(DIALOGUE_DB.keys())
+    npc_keys = list(dialogue_db.keys())
     npc_i = 0 if npc_keys else -1
 
     camera_x = 0.0
@@ -99,7 +91,7 @@ def main():
         # NPC 대사 프리뷰
         if npc_i != -1:
             key = npc_keys[npc_i]
-            cfg = DIALOGUE_DB.get(key, {})
+            cfg = dialogue_db.load(key)
             lbv = cfg.get("lines_by_visit", [])
 
             # 방문 1세트 앞부분만 미리보기
@@ -34,6 +34,8 @@ main에서 사용 예:
 from __future__ import annotations
 import pygame
 
+import quality as Q
+
 
 class TopdownView:
     def __init__(self,
@@ -91,14 +93,23 @@ class TopdownView:
         tx, ty = self._calc_target(player, level, screen_w, screen_h)
 
         # 부드러운 보간
-        k = min(1.0, dt * self.cam_smooth)
+        k = min(1.0, dt * self.cam_smooth) if Q.current().camera_lerp else 1.0
         self.camera_x += (tx - self.camera_x) * k
         self.camera_y += (ty - self.camera_y) * k
 
     # ---------------------------------------------------------
     # 탑다운 렌더 (레벨 fallback)
     # ---------------------------------------------------------
-    def _draw_level_fallback(self, surf, level):
+    def _to_screen(self, r, scale):
+        """월드 rect → 화면 rect (scale: 내부 해상도 배율)."""
+        return pygame.Rect(
+            int((r.x - self.camera_x) * scale),
+            int((r.y - self.camera_y) * scale),
+            int(r.w * scale),
+            int(r.h * scale),
+        )
+
+    def _draw_level_fallback(self, surf, level, scale=1.0):
         # 바닥
         surf.fill(self.bg_color)
 
@@ -108,13 +119,13 @@ class TopdownView:
         elif hasattr(level, "draw_photos"):
             # draw_photos가 camera_x만 쓰는 버전이면 y는 무시되지만 일단 호출
             try:
-                level.draw_photos(surf, self.camera_x)
+                level.draw_photos(surf, self.camera_x, scale)
             except Exception:
                 pass
 
         # walls
         for r in getattr(level, "walls", []):
-            rr = pygame.Rect(r.x - self.camera_x, r.y - self.camera_y, r.w, r.h)
+            rr = self._to_screen(r, scale)
             pygame.draw.rect(surf, (90, 95, 110), rr)
             pygame.draw.rect(surf, (30, 32, 40), rr, 2)
 
@@ -126,53 +137,52 @@ class TopdownView:
                 r = d["rect"]
             except Exception:
                 continue
-            rr = pygame.Rect(r.x - self.camera_x, r.y - self.camera_y, r.w, r.h)
+            rr = self._to_screen(r, scale)
             pygame.draw.rect(surf, (110, 105, 125), rr)
             pygame.draw.rect(surf, (35, 35, 45), rr, 2)
 
-    def draw_level(self, surf, level):
+    def draw_level(self, surf, level, scale=1.0):
         """Level에 draw_topdown이 있으면 그걸 우선 사용."""
         if hasattr(level, "draw_topdown"):
             level.draw_topdown(surf, self.camera_x, self.camera_y)
         else:
-            self._draw_level_fallback(surf, level)
+            self._draw_level_fallback(surf, level, scale)
 
     # ---------------------------------------------------------
     # 엔티티 렌더 (NPC/게이트)
     # ---------------------------------------------------------
-    def _draw_rect_entity(self, surf, rect_world, color, outline=(20, 20, 30)):
-        rr = pygame.Rect(
-            rect_world.x - self.camera_x,
-            rect_world.y - self.camera_y,
-            rect_world.w,
-            rect_world.h
-        )
-        pygame.draw.rect(surf, color, rr, border_radius=6)
-        pygame.draw.rect(surf, outline, rr, 1, border_radius=6)
+    def _draw_rect_entity(self, surf, rect_world, color, outline=(20, 20, 30), scale=1.0):
+        rr = self._to_screen(rect_world, scale)
+        radius = max(1, int(6 * scale))
+        pygame.draw.rect(surf, color, rr, border_radius=radius)
+        pygame.draw.rect(surf, outline, rr, 1, border_radius=radius)
 
-    def draw_npcs(self, surf, npcs):
+    def draw_npcs(self, surf, npcs, scale=1.0):
         """탑다운에서 NPC는 안전하게 간단 사각형으로 렌더."""
         for npc in npcs:
             if not hasattr(npc, "rect"):
                 continue
-            self._draw_rect_entity(surf, npc.rect, (200, 120, 120))
+            self._draw_rect_entity(surf, npc.rect, (200, 120, 120), scale=scale)
 
-    def draw_gates(self, surf, gates):
+    def draw_gates(self, surf, gates, scale=1.0):
         """탑다운에서 게이트도 간단 렌더."""
         for gate in gates:
             if not hasattr(gate, "rect"):
                 continue
-            self._draw_rect_entity(surf, gate.rect, (120, 220, 255), outline=(10, 30, 50))
+            self._draw_rect_entity(surf, gate.rect, (120, 220, 255), outline=(10, 30, 50), scale=scale)
 
     # ---------------------------------------------------------
     # 플레이어 렌더
     # ---------------------------------------------------------
-    def draw_player(self, surf, player):
+    def draw_player(self, surf, player, scale=1.0):
         # player.draw가 camera_x만 받는 구버전일 수 있어 안전 분기
         if hasattr(player, "draw"):
             try:
-                # 최신 시그니처(draw(surf, camera_x, camera_y))
-                player.draw(surf, self.camera_x, self.camera_y)
+                # 최신 시그니처(draw(surf, camera_x, camera_y, scale))
+                if scale != 1.0:
+                    player.draw(surf, self.camera_x, self.camera_y, scale)
+                else:
+                    player.draw(surf, self.camera_x, self.camera_y)
                 return
             except TypeError:
                 # 구형 시그니처(draw(surf, camera_x))
@@ -183,17 +193,13 @@ class TopdownView:
                     pass
 
         # 최후 fallback
-        rect = pygame.Rect(
-            int(player.pos.x - self.camera_x),
-            int(player.pos.y - self.camera_y),
-            player.w, player.h
-        )
+        rect = self._to_screen(pygame.Rect(int(player.pos.x), int(player.pos.y), player.w, player.h), scale)
         pygame.draw.rect(surf, (120, 160, 255), rect, border_radius=6)
 
     # ---------------------------------------------------------
     # 통합 draw
     # ---------------------------------------------------------
-    def draw(self, surf, level, player, *, npcs=(), gates=()):
+    def draw(self, surf, level, player, *, npcs=(), gates=(), scale=1.0):
         """
         탑다운 씬 1프레임 렌더.
         순서:
@@ -201,11 +207,12 @@ class TopdownView:
           2) 게이트
           3) NPC
           4) 플레이어
+        scale: 내부 해상도 렌더 배율(render_scale). 1이면 기존과 동일.
         """
-        self.draw_level(surf, level)
-        self.draw_gates(surf, gates)
-        self.draw_npcs(surf, npcs)
-        self.draw_player(surf, player)
+        self.draw_level(surf, level, scale)
+        self.draw_gates(surf, gates, scale)
+        self.draw_npcs(surf, npcs, scale)
+        self.draw_player(surf, player, scale)
 
     # ---------------------------------------------------------
     # 외부에서 카메라 값이 필요할 때
@@ -23,6 +23,8 @@ INTERACT_NAME = "F"     # 상호작용(대화, 워프 등)
 JUMP_SPACE_NAME = "SPACE"     # 점프
 JUMP_W_NAME = "W"
 INVENTORY_NAME = "E"    # 인벤토리
+QUICK_SAVE_NAME = "F5"  # 퀵세이브
+QUICK_LOAD_NAME = "F9"  # 퀵로드
 
 # 필요하면 나중에 추가 가능:
 # PAUSE_NAME = "ESC"
@@ -67,6 +69,9 @@ _NAME_TO_KEY = {
     "LEFT": pygame.K_LEFT,
     "RIGHT": pygame.K_RIGHT,
 
+    "F5": pygame.K_F5,
+    "F9": pygame.K_F9,
+
 }
 
 def _key(name: str, fallback):
@@ -89,6 +94,8 @@ JUMP_SPACE = _key(JUMP_SPACE_NAME, pygame.K_SPACE)
 JUMP_W = _key(JUMP_W_NAME, pygame.K_w)
 
 INVENTORY = _key(INVENTORY_NAME, pygame.K_e)
+QUICK_SAVE = _key(QUICK_SAVE_NAME, pygame.K_F5)
+QUICK_LOAD = _key(QUICK_LOAD_NAME, pygame.K_F9)
 
 # 이름 문자열도 UI에 쓸 수 있게 공개
 """__all__ = [
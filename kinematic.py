@@ -0,0 +1,106 @@
+# kinematic.py
+# ---------------------------------------------------------
+# 키네마틱 소품(엘리베이터/움직이는 발판).
+#
+# 맵 JSON의 props 항목에 "path"가 있으면 그 경로(좌상단 좌표 목록)를
+# 일정 속도로 따라 움직인다. 물리 영향은 받지 않고(키네마틱),
+# 매 틱 이동량(dx, dy)과 이전 rect(prev)를 남겨서
+# Level이 충돌 인덱스 갱신 / 탑승자 운반에 쓴다.
+#
+#   {"x": 900, "y": 380, "w": 120, "h": 12, "name": "elevator",
+#    "path": [[900, 380], [900, 200]], "speed": 60, "wait": 1.0, "loop": false}
+#
+# - loop=false : 끝점에서 되돌아옴(왕복, 기본)
+# - loop=true  : 마지막 점 → 첫 점으로 이어서 순환
+# - wait       : 각 경유점에서 멈추는 시간(초)
+# ---------------------------------------------------------
+
+from __future__ import annotations
+import pygame
+
+
+class Mover:
+    __slots__ = ("rect", "prev", "path", "speed", "wait", "loop",
+                 "fx", "fy", "dx", "dy", "_i", "_step", "_wait_t")
+
+    def __init__(self, rect: pygame.Rect, path, speed: float = 60.0, wait: float = 0.0, loop: bool = False):
+        self.rect = rect                     # Level.props의 rect 객체 그대로(제자리 갱신)
+        self.prev = rect.copy()
+        self.path = [(float(p[0]), float(p[1])) for p in path] or [(float(rect.x), float(rect.y))]
+        self.speed = float(speed)
+        self.wait = float(wait)
+        self.loop = bool(loop)
+
+        self.fx, self.fy = self.path[0]      # 소수점 위치(rect는 정수)
+        rect.topleft = (int(round(self.fx)), int(round(self.fy)))
+        self.prev.topleft = rect.topleft
+        self.dx = self.dy = 0
+        self._i = 0                          # 현재 출발 경유점
+        self._step = 1                       # 왕복 방향
+        self._wait_t = 0.0
+
+    def _next_index(self) -> int:
+        n = len(self.path)
+        j = self._i + self._step
+        if self.loop:
+            return j % n
+        if not 0 <= j < n:
+            self._step = -self._step
+            j = self._i + self._step
+        return j
+
+    def update(self, dt: float) -> bool:
+        """경로를 따라 이동. 정수 rect가 움직였으면 True(dx/dy/prev 갱신)."""
+        self.dx = self.dy = 0
+        if len(self.path) < 2 or self.speed <= 0:
+            return False
+
+        budget = self.speed * dt
+        while budget > 0:
+            if self._wait_t > 0:
+                used = min(self._wait_t, budget / self.speed)
+                self._wait_t -= used
+                budget -= used * self.speed
+                continue
+            j = self._next_index()
+            tx, ty = self.path[j]
+            vx, vy = tx - self.fx, ty - self.fy
+            dist = (vx * vx + vy * vy) ** 0.5
+            if dist <= budget:
+                self.fx, self.fy = tx, ty
+                budget -= dist
+                self._i = j
+                self._wait_t = self.wait
+                if dist == 0 and self.wait <= 0:
+                    break  # 같은 점이 연속 → 무한 루프 방지
+            else:
+                k = budget / dist
+                self.fx += vx * k
+                self.fy += vy * k
+                budget = 0
+
+        return self._sync_rect()
+
+    def place(self, fx: float, fy: float) -> bool:
+        """경로 진행 없이 위치만 지정(시뮬 프로세스 스냅샷). update처럼 dx/dy/prev 갱신."""
+        self.dx = self.dy = 0
+        self.fx, self.fy = float(fx), float(fy)
+        return self._sync_rect()
+
+    def _sync_rect(self) -> bool:
+        nx, ny = int(round(self.fx)), int(round(self.fy))
+        r = self.rect
+        if nx == r.x and ny == r.y:
+            return False
+        self.prev.topleft = r.topleft
+        self.dx, self.dy = nx - r.x, ny - r.y
+        r.x, r.y = nx, ny
+        return True
+
+    def to_json(self) -> dict:
+        return {
+            "path": [[int(x), int(y)] for (x, y) in self.path],
+            "speed": self.speed,
+            "wait": self.wait,
+            "loop": self.loop,
+        }
@@ -1,9 +1,16 @@
 # level.py
 from __future__ import annotations
-import os, json
+import os, io, json
 import pygame
 from pygame.math import Vector2 as V2
 import settings as S
+import quality as Q
+from collision import SpatialGrid, min_extent, sweep_x
+from kinematic import Mover
+from imgpool import ImagePool
+
+# 사진 surface 공유 풀(레벨/씬 재빌드 사이에도 같은 내용이면 한 장). 받은 surface는 수정 금지
+PHOTO_POOL = ImagePool("photos")
 
 SCREEN_W = S.SCREEN_W
 SCREEN_H = S.SCREEN_H
@@ -39,6 +46,14 @@ class Level:
         }
         self.wall_cells: set[tuple[int, int]] = set()
 
+        # 충돌 인덱스(rebuild_solid_index에서 생성, 움직인 소품만 갱신)
+        self._solids: list[pygame.Rect] = []
+        self._n_walls = 0
+        self._grid = SpatialGrid(128)
+        self.solid_min_extent = 0
+        self.movers: list[tuple[int, Mover]] = []       # (solids 인덱스, Mover)
+        self.moved: list[tuple[int, Mover]] = []        # 이번 틱에 움직인 것
+
         self.load_map(self.map_file)
 
     # ----------------------------
@@ -87,11 +102,16 @@ class Level:
 
         for p in data.get("props", []):
             r = pygame.Rect(int(p["x"]), int(p["y"]), int(p["w"]), int(p["h"]))
-            self.props.append({
+            d = {
                 "rect": r,
                 "solid": bool(p.get("solid", True)),
                 "name": p.get("name", ""),
-            })
+            }
+            path = p.get("path")
+            if isinstance(path, list) and len(path) >= 2:
+                d["mover"] = Mover(r, path, float(p.get("speed", 60)),
+                                   float(p.get("wait", 0.0)), bool(p.get("loop", False)))
+            self.props.append(d)
 
         for ph in data.get("photos", []):
             self.photos.append({
@@ -105,6 +125,8 @@ class Level:
         self._apply_wall_grid_from_json(data)
         if self.wall_cells:
             self.rebuild_walls_from_grid()
+        else:
+            self.rebuild_solid_index()
 
         print(f"[Level] {self.map_file} 로드 완료")
 
@@ -123,15 +145,7 @@ class Level:
             },
             "ground_segments": [[x, y] for (x, y) in self.ground_segments],
             "walls": [{"x": r.x, "y": r.y, "w": r.w, "h": r.h} for r in self.walls],
-            "props": [
-                {
-                    "x": d["rect"].x, "y": d["rect"].y,
-                    "w": d["rect"].w, "h": d["rect"].h,
-                    "solid": bool(d.get("solid", True)),
-                    "name": d.get("name", ""),
-                }
-                for d in self.props
-            ],
+            "props": [self._prop_to_json(d) for d in self.props],
             "photos": list(self.photos),
             "wall_grid": {
                 "cols": self.wall_grid["cols"],
@@ -147,6 +161,22 @@ class Level:
 
         print(f"[Level] map saved -> {self.map_file}")
 
+    @staticmethod
+    def _prop_to_json(d: dict) -> dict:
+        r = d["rect"]
+        out = {
+            "x": r.x, "y": r.y,
+            "w": r.w, "h": r.h,
+            "solid": bool(d.get("solid", True)),
+            "name": d.get("name", ""),
+        }
+        m = d.get("mover")
+        if m is not None:
+            # 움직이는 소품은 현재 위치 대신 경로 시작점으로 저장
+            out["x"], out["y"] = int(m.path[0][0]), int(m.path[0][1])
+            out.update(m.to_json())
+        return out
+
     # ----------------------------
     # 지면/서포트
     # ----------------------------
@@ -172,10 +202,12 @@ class Level:
 
     def get_support_y(self, world_x: int) -> int:
         best = self.surface_y_rect_x(world_x)
-        for d in self.props:
-            if not d.get("solid", True):
+        # 그 x 세로줄에 걸친 칸의 솔리드 소품만 확인(벽 제외, 움직이는 발판 포함)
+        solids, n_walls = self._solids, self._n_walls
+        for k in self._grid.query(pygame.Rect(int(world_x) - 1, 0, 3, self.world_h)):
+            if k < n_walls:
                 continue
-            r: pygame.Rect = d["rect"]
+            r = solids[k]
             if r.left <= world_x <= r.right and r.top < best:
                 best = r.top
         return best
@@ -184,9 +216,94 @@ class Level:
     # 충돌 대상
     # ----------------------------
     def get_solid_rects(self) -> list[pygame.Rect]:
-        out = list(self.walls)
-        out += [d["rect"] for d in self.props if d.get("solid", True)]
-        return out
+        """
+        벽 + 솔리드 소품 rect 목록(캐시). 매 프레임 새로 만들지 않는다.
+        움직이는 발판은 같은 rect 객체가 제자리에서 바뀌므로 목록은 그대로 유효.
+        받는 쪽에서 목록을 수정하지 말 것.
+        """
+        return self._solids
+
+    def rebuild_solid_index(self) -> None:
+        """벽/소품 구성이 바뀌었을 때(로드, 벽 격자 편집)만 호출."""
+        self._solids = list(self.walls)
+        self._n_walls = len(self._solids)
+        self.movers = []
+        for d in self.props:
+            if not d.get("solid", True):
+                continue
+            if "mover" in d:
+                self.movers.append((len(self._solids), d["mover"]))
+            self._solids.append(d["rect"])
+        self.moved = []
+
+        self._grid.clear()
+        for k, r in enumerate(self._solids):
+            self._grid.insert(k, r)
+        self.solid_min_extent = min_extent(self._solids)
+
+    def solids_near(self, rect: pygame.Rect) -> list[pygame.Rect]:
+        """rect 근처(같은 격자 칸) 솔리드 후보."""
+        solids = self._solids
+        return [solids[k] for k in sorted(self._grid.query(rect))]
+
+    # ----------------------------
+    # 키네마틱 소품(kinematic.py)
+    # ----------------------------
+    def update(self, dt: float) -> None:
+        """움직이는 발판 진행. 움직인 것만 격자 칸을 갱신하고 self.moved에 기록."""
+        moved = self.moved
+        moved.clear()
+        for k, m in self.movers:
+            if m.update(dt):
+                self._grid.move(k, m.rect)
+                moved.append((k, m))
+
+    def place_movers(self, positions) -> None:
+        """
+        update 대신 발판 위치를 그대로 받는다(--sim-process: 발판은 시뮬 프로세스가 진행).
+        positions는 self.movers 순서의 (x, y).
+        """
+        moved = self.moved
+        moved.clear()
+        for (k, m), (x, y) in zip(self.movers, positions):
+            if m.place(x, y):
+                self._grid.move(k, m.rect)
+                moved.append((k, m))
+
+    def carry(self, body) -> None:
+        """
+        이번 틱에 움직인 발판 기준으로 body(pos, w, h)를 옮긴다.
+        - 위에 서 있던 경우(발 == 이전 윗면): 발판 이동량만큼 같이 이동
+        - 발판이 몸을 파고든 경우: 발판이 움직인 방향으로 밀어냄
+        Player.update 전에 호출.
+        """
+        if not self.moved:
+            return
+
+        w, h = body.w, body.h
+        for k, m in self.moved:
+            old, r = m.prev, m.rect
+            x, y = body.pos.x, body.pos.y
+            feet = y + h
+            if abs(feet - old.top) < 1.0 and x + w > old.left and x < old.right:
+                # 탑승자: 가로 이동은 다른 솔리드에 막히면 거기까지만
+                if m.dx:
+                    reach = pygame.Rect(int(x) - abs(m.dx), int(y), w + 2 * abs(m.dx), h)
+                    others = [s for s in self.solids_near(reach) if s is not r]
+                    x, _ = sweep_x(x, y, w, h, m.dx, others)
+                body.pos.x = max(0, min(self.world_w - w, x))
+                body.pos.y = r.top - h
+                continue
+
+            if x + w > r.left and x < r.right and y + h > r.top and y < r.bottom:
+                if m.dy < 0:
+                    body.pos.y = r.top - h
+                elif m.dy > 0:
+                    body.pos.y = r.bottom
+                elif m.dx > 0:
+                    body.pos.x = r.right
+                elif m.dx < 0:
+                    body.pos.x = r.left - w
 
     # ----------------------------
     # 사진
@@ -199,21 +316,36 @@ class Level:
             self._photo_cache[key] = None
             return None
         try:
-            img = pygame.image.load(path).convert_alpha()
-            img = pygame.transform.smoothscale(img, (w, h))
+            # 같은 내용 파일 + 같은 크기가 이미 있으면 디코딩 없이 공유
+            fkey, data = PHOTO_POOL.read(path, (w, h))
+            img = PHOTO_POOL.get_file(fkey)
+            if img is None:
+                img = pygame.image.load(io.BytesIO(data), path).convert_alpha()
+                img = PHOTO_POOL.intern(pygame.transform.smoothscale(img, (w, h)), fkey)
             self._photo_cache[key] = img
             return img
         except Exception:
             self._photo_cache[key] = None
             return None
 
-    def draw_photos(self, surf: pygame.Surface, camera_x: float) -> None:
+    def iter_preload_photos(self):
+        """
+        사진을 한 장씩 미리 디코딩(원래 크기). 한 장 끝날 때마다 yield.
+        비동기 로더(main.load_scene_async)가 사진 사이사이 await 하는 용도.
+        """
         for ph in self.photos:
-            x = int(ph["x"] - camera_x)
-            y = int(ph["y"])
-            w = int(ph["w"])
-            h = int(ph["h"])
-            img = self._load_photo(ph.get("path", ""), w, h)
+            self._load_photo(ph.get("path", ""), int(ph["w"]), int(ph["h"]))
+            yield ph
+
+    def draw_photos(self, surf: pygame.Surface, camera_x: float, scale: float = 1.0) -> None:
+        photos_on = Q.current().photos
+        for ph in self.photos:
+            # scale < 1: 내부 해상도 렌더(render_scale). 축소본도 (path, w, h)로 캐시됨
+            x = int((ph["x"] - camera_x) * scale)
+            y = int(ph["y"] * scale)
+            w = max(1, int(ph["w"] * scale))
+            h = max(1, int(ph["h"] * scale))
+            img = self._load_photo(ph.get("path", ""), w, h) if photos_on else None
             if img:
                 surf.blit(img, (x, y))
             else:
@@ -247,6 +379,7 @@ class Level:
                 x = int(ox + c * cell)
                 y = int(oy + r * cell)
                 self.walls.append(pygame.Rect(x, y, cell, cell))
+        self.rebuild_solid_index()
 
     def wall_cell_from_world(self, wx: float, wy: float):
         cols = self.wall_grid["cols"]
@@ -297,20 +430,37 @@ class Level:
     # 배경/지면 렌더
     # ----------------------------
     def _draw_sky(self, surf):
-        for y in range(SCREEN_H):
-            t = y / max(1, SCREEN_H - 1)
+        # surf 크기 기준(내부 해상도 렌더 시 줄 수도 같이 줄어듦)
+        sw, sh = surf.get_size()
+        if not Q.current().sky_gradient:
+            # 저화질: 중간색 한 번 채우기
+            mid = tuple((a + b) // 2 for a, b in zip(self.sky_top, self.sky_bottom))
+            surf.fill(mid)
+            return
+        for y in range(sh):
+            t = y / max(1, sh - 1)
             r = int(self.sky_top[0] * (1 - t) + self.sky_bottom[0] * t)
             g = int(self.sky_top[1] * (1 - t) + self.sky_bottom[1] * t)
             b = int(self.sky_top[2] * (1 - t) + self.sky_bottom[2] * t)
-            pygame.draw.line(surf, (r, g, b), (0, y), (SCREEN_W, y))
+            pygame.draw.line(surf, (r, g, b), (0, y), (sw, y))
 
-    def _draw_ground(self, surf, camera_x: float):
-        pts = [(int(x - camera_x), int(y)) for (x, y) in self.ground_segments]
-        pts = [(pts[0][0], SCREEN_H)] + pts + [(pts[-1][0], SCREEN_H)]
+    def _draw_ground(self, surf, camera_x: float, scale: float = 1.0):
+        bottom = surf.get_height()
+        pts = [(int((x - camera_x) * scale), int(y * scale)) for (x, y) in self.ground_segments]
+        pts = [(pts[0][0], bottom)] + pts + [(pts[-1][0], bottom)]
         pygame.draw.polygon(surf, GROUND_LIGHT, pts)
-        pygame.draw.lines(surf, GROUND_DARK, False, pts[1:-1], 3)
+        pygame.draw.lines(surf, GROUND_DARK, False, pts[1:-1], max(1, int(3 * scale + 0.5)))
+
+    def _draw_movers(self, surf, camera_x: float, scale: float = 1.0):
+        for _, m in self.movers:
+            r = m.rect
+            rr = pygame.Rect(int((r.x - camera_x) * scale), int(r.y * scale),
+                             max(1, int(r.w * scale)), max(1, int(r.h * scale)))
+            pygame.draw.rect(surf, (150, 140, 170), rr)
+            pygame.draw.rect(surf, GROUND_DARK, rr, max(1, int(2 * scale)))
 
-    def draw(self, surf, camera_x: float):
+    def draw(self, surf, camera_x: float, scale: float = 1.0):
         self._draw_sky(surf)
-        self._draw_ground(surf, camera_x)
-        self.draw_photos(surf, camera_x)
+        self._draw_ground(surf, camera_x, scale)
+        self.draw_photos(surf, camera_x, scale)
+        self._draw_movers(surf, camera_x, scale)
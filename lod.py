@@ -0,0 +1,145 @@
+# lod.py
+# ---------------------------------------------------------
+# NPC 갱신 LOD(level of detail) 스케줄러.
+#
+# 모든 NPC를 매 프레임 갱신하지 않고 거리/가시성 구간(band)별로 주기를 나눈다.
+#   near   : 플레이어 근처(LOD_NEAR_PX 이내) 또는 대화 중 → 매 프레임
+#   screen : 화면 안                                    → LOD_PERIODS["screen"] 프레임마다
+#   far    : 화면 밖                                    → LOD_PERIODS["far"] 프레임마다
+#
+# - 같은 주기 NPC들은 (frame + i) % period 로 프레임마다 나눠서 갱신(한 프레임 몰림 없음)
+# - 건너뛴 프레임의 dt는 NPC마다 누적했다가 갱신할 때 한 번에 넘긴다(애니메이션 시간 보존)
+# - 더 빠른 구간으로 들어오면(멀리 → 근처) 기다리지 않고 그 프레임에 바로 갱신
+#   (새로 생긴 NPC는 구간 차례대로 → 씬 진입 첫 프레임에 전부 몰리지 않음)
+# - counts: 이번 프레임 구간별 갱신 수, totals: 누적(프로파일/오버레이용)
+#
+# 사용 예:
+#
+#     lod = LODScheduler()
+#     for i, ndt in lod.schedule(npcs, player.rect, view_rect, dt, force=talking):
+#         npcs[i].animate(ndt)
+# ---------------------------------------------------------
+
+from __future__ import annotations
+import pygame
+
+import settings as S
+
+BANDS = ("near", "screen", "far")
+_RANK = {b: i for i, b in enumerate(BANDS)}
+
+
+class LODScheduler:
+    def __init__(self, near_px=None, periods=None):
+        self.near_px = float(near_px if near_px is not None else getattr(S, "LOD_NEAR_PX", 240))
+        p = dict(getattr(S, "LOD_PERIODS", {}) if periods is None else periods)
+        self.periods = {"near": 1, "screen": max(1, int(p.get("screen", 4))), "far": max(1, int(p.get("far", 30)))}
+        self.frame = 0
+        self._acc: list[float] = []
+        self._band: list = []
+        self.counts = {b: 0 for b in BANDS}      # 이번 프레임 갱신 수
+        self.members = {b: 0 for b in BANDS}     # 이번 프레임 구간별 NPC 수
+        self.totals = {b: 0 for b in BANDS}      # 누적 갱신 수
+        self.frames = 0
+
+    def reset(self) -> None:
+        """씬이 바뀌어 NPC 목록이 새로 만들어졌을 때."""
+        self._acc.clear()
+        self._band.clear()
+
+    def band_of(self, rect, player_rect, view_rect) -> str:
+        dx = rect.centerx - player_rect.centerx
+        dy = rect.centery - player_rect.centery
+        if dx * dx + dy * dy <= self.near_px * self.near_px:
+            return "near"
+        if view_rect is None or view_rect.colliderect(rect):
+            return "screen"
+        return "far"
+
+    def schedule(self, entities, player_rect, view_rect, dt: float, force=()) -> list:
+        """이번 프레임에 갱신할 (인덱스, 누적 dt) 목록. force에 든 엔티티는 항상 near."""
+        n = len(entities)
+        if len(self._acc) != n:
+            self._acc = [0.0] * n
+            self._band = [None] * n
+        acc, bands, periods = self._acc, self._band, self.periods
+        counts, members = self.counts, self.members
+        for b in BANDS:
+            counts[b] = members[b] = 0
+        frame = self.frame
+        due = []
+        for i, e in enumerate(entities):
+            acc[i] += dt
+            band = "near" if e in force else self.band_of(e.rect, player_rect, view_rect)
+            prev = bands[i]
+            bands[i] = band
+            members[band] += 1
+            period = periods[band]
+            # 처음 보는 NPC는 자기 차례에(첫 프레임 몰림 방지), 빨라진 구간이면 즉시
+            if period == 1 or (frame + i) % period == 0 or (prev is not None and _RANK[band] < _RANK[prev]):
+                due.append((i, acc[i]))
+                acc[i] = 0.0
+                counts[band] += 1
+        for b in BANDS:
+            self.totals[b] += counts[b]
+        self.frame += 1
+        self.frames += 1
+        return due
+
+    def stats(self) -> dict:
+        f = max(1, self.frames)
+        return {
+            "frames": self.frames,
+            "per_frame": {b: round(self.totals[b] / f, 2) for b in BANDS},
+            "last": dict(self.counts),
+            "members": dict(self.members),
+        }
+
+
+def view_rect_side(camera_x: float) -> pygame.Rect:
+    return pygame.Rect(int(camera_x), 0, S.SCREEN_W, S.SCREEN_H)
+
+
+def view_rect_top(camera_x: float, camera_y: float) -> pygame.Rect:
+    return pygame.Rect(int(camera_x), int(camera_y), S.SCREEN_W, S.SCREEN_H)
+
+
+# ---------------------------------------------------------
+# 벤치마크: python lod.py [N]
+# N개 NPC(월드 전체에 흩어짐)를 플레이어가 가로질러 가며 120프레임:
+# 구간별 평균 갱신 수 / 프레임당 최대 갱신 수 / 전부 갱신 대비 비율
+# ---------------------------------------------------------
+def _bench(n: int = 1000, frames: int = 120):
+    import random
+
+    class _E:
+        __slots__ = ("rect",)
+
+        def __init__(self, x, y):
+            self.rect = pygame.Rect(x, y, 32, 56)
+
+    rng = random.Random(1)
+    world_w = 20000
+    ents = [_E(rng.randrange(world_w), rng.randrange(200, 400)) for _ in range(n)]
+    lod = LODScheduler()
+    player = pygame.Rect(0, 300, 32, 56)
+    peak = 0
+    dt_check = [0.0] * n
+    for f in range(frames):
+        player.x = int(f * world_w / frames)
+        view = view_rect_side(max(0, player.x - S.SCREEN_W // 2))
+        due = lod.schedule(ents, player, view, 1 / 60)
+        peak = max(peak, len(due))
+        for i, ndt in due:
+            dt_check[i] += ndt
+    st = lod.stats()
+    total = sum(st["per_frame"].values())
+    # 누적 dt: 마지막 갱신까지 넘긴 시간 + 아직 쌓인 시간 = 전체 시간
+    lost = max(abs(dt_check[i] + lod._acc[i] - frames / 60) for i in range(n))
+    print(f"[lod] N={n}: updates/frame near={st['per_frame']['near']} screen={st['per_frame']['screen']} "
+          f"far={st['per_frame']['far']} | avg {total:.1f} peak {peak} (vs {n} every frame) | dt drift {lost:.2e}s")
+
+
+if __name__ == "__main__":
+    import sys
+    _bench(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
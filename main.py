@@ -7,6 +7,7 @@
 # - SPACE: NPC 대화
 # - E: 인벤토리 토글
 # - F: 워프 게이트 상호작용
+# - F5/F9: 퀵세이브/퀵로드
 # - 연구실 입장 시 TopdownView로 렌더/카메라 전환
 #
 # 개선 포인트
@@ -18,6 +19,10 @@
 
 import os
 import sys
+import asyncio
+from collections import OrderedDict
+import argparse
+import multiprocessing
 import pygame
 
 import settings as S
@@ -25,7 +30,18 @@ from player import Player
 from level import Level
 from npc import NPC
 from isac import TopdownView
+from render_scale import RenderScaler, DynamicResolution
+import quality as Q
+import anim
+from pacing import FramePacer, STRATEGIES as PACING_STRATEGIES
+from simproc import SimProcess
 import key as K
+from glyphatlas import render_text, warmup
+import flags
+import fonts
+from lod import LODScheduler, view_rect_side, view_rect_top
+from worldsim import WorldSim, scene_npc_entries, route_of
+import snapshot
 
 # ------------------------------------------------------------
 # 경로 유틸(Working Directory 이슈 완화)
@@ -48,16 +64,6 @@ def resource_path(relative_path):
         base = os.path.dirname(os.path.abspath(__file__))
     return os.path.join(base, relative_path)
 
-# ------------------------------------------------------------
-# 폰트 유틸
-# ------------------------------------------------------------
-def _sysfont(name, size):
-    try:
-        return pygame.font.SysFont(name, size)
-    except Exception:
-        return pygame.font.SysFont(None, size)
-
-
 class _NoKeys:
     """대화/인벤토리 중 이동 입력 차단용."""
     def __getitem__(self, k):
@@ -80,10 +86,20 @@ class Inventory:
         self.weapon_slots[0] = {"name": "장검"}
         self.weapon_slots[1] = {"name": "단검"}
         self.evience_slots[0] = {"name": "은행의 비밀 장부"}
+        self.sync_flags()
 
         # 선택: 플레이어 아바타 이미지 표시용
         self.avatar_img = None
 
+    def sync_flags(self):
+        """가진 아이템을 flags.STORE의 item:<이름> 플래그로(대사 조건 {"has": ...}용)."""
+        held = {f"item:{it['name']}" for it in self.weapon_slots + self.evience_slots if it}
+        for name in [k for k in flags.STORE.to_dict() if k.startswith("item:")]:
+            if name not in held:
+                flags.STORE.set(name, 0)
+        for name in held:
+            flags.STORE.set(name, 1)
+
     def set_avatar(self, img):
         self.avatar_img = img
 
@@ -96,12 +112,11 @@ class Inventory:
 
         w = int(S.SCREEN_W * 0.6)
         h = int(S.SCREEN_H * 0.6)
-        panel = pygame.Surface((w, h), pygame.SRCALPHA)
-        panel.fill((15, 18, 25, 235))
-        rect = panel.get_rect(center=(S.SCREEN_W // 2, S.SCREEN_H // 2))
-        surf.blit(panel, rect.topleft)
+        rect = pygame.Rect(0, 0, w, h)
+        rect.center = (S.SCREEN_W // 2, S.SCREEN_H // 2)
+        Q.draw_panel(surf, rect, (15, 18, 25, 235))
 
-        title = self.font.render("인벤토리 (E로 닫기)", True, (250, 230, 170))
+        title = render_text(self.font, "인벤토리 (E로 닫기)", (250, 230, 170))
         surf.blit(title, (rect.x + 20, rect.y + 20))
 
         cell, gap = self.cell, self.gap
@@ -117,21 +132,21 @@ class Inventory:
         pygame.draw.rect(surf, (65, 70, 95), avatar_area)
         pygame.draw.rect(surf, (230, 230, 240), avatar_area, 2)
 
-        if self.avatar_img:
+        if self.avatar_img and Q.current().photos:
             try:
-                img = pygame.transform.smoothscale(self.avatar_img, (avatar_area.w, avatar_area.h))
+                img = Q.scale(self.avatar_img, (avatar_area.w, avatar_area.h))
                 surf.blit(img, avatar_area.topleft)
             except Exception:
                 pass
         else:
-            photo_text = self.font.render("사진", True, (230, 230, 240))
+            photo_text = render_text(self.font, "사진", (230, 230, 240))
             surf.blit(photo_text, (
                 avatar_area.centerx - photo_text.get_width() // 2,
                 avatar_area.centery - photo_text.get_height() // 2
             ))
 
         # 2) 무기 2개(각각 2칸 연결)
-        weapon_label = self.font.render("무기", True, (230, 230, 240))
+        weapon_label = render_text(self.font, "무기", (230, 230, 240))
         weapon_origin_x = avatar_area.right + 40
         weapon_origin_y = base_y
         surf.blit(weapon_label, (weapon_origin_x, weapon_origin_y - 26))
@@ -148,14 +163,14 @@ class Inventory:
             pygame.draw.rect(surf, (220, 220, 230), big_rect, 2)
 
             if item and "name" in item:
-                txt = self.font.render(item["name"], True, (235, 235, 245))
+                txt = render_text(self.font, item["name"], (235, 235, 245))
                 surf.blit(txt, (
                     big_rect.centerx - txt.get_width() // 2,
                     big_rect.centery - txt.get_height() // 2
                 ))
 
         # 3) 소모품 5칸
-        consum_label = self.font.render("소모품", True, (230, 230, 240))
+        consum_label = render_text(self.font, "소모품", (230, 230, 240))
         cons_origin_x = weapon_origin_x
         cons_origin_y = rect.bottom - 30 - cell
         surf.blit(consum_label, (cons_origin_x, cons_origin_y - 26))
@@ -170,7 +185,7 @@ class Inventory:
 
             item = self.evience_slots[i] if i < len(self.evience_slots) else None
             if item and "name" in item:
-                txt = self.font.render(item["name"], True, (235, 235, 245))
+                txt = render_text(self.font, item["name"], (235, 235, 245))
                 surf.blit(txt, (c_rect.x + 4, c_rect.y + c_rect.h // 2 - txt.get_height() // 2))
 
 
@@ -178,6 +193,8 @@ class Inventory:
 # 워프 게이트
 # ------------------------------------------------------------
 class WarpGate:
+    __slots__ = ("w", "h", "x", "y", "label", "target_scene", "range", "font", "_rect")
+
     def __init__(self, world_x, level, label, target_scene):
         self.w, self.h = 40, 90
 
@@ -195,20 +212,27 @@ class WarpGate:
         self.label = label
         self.target_scene = target_scene
         self.range = 90
-        self.font = _sysfont(S.FONT_NAME, 18)
+        self.font = fonts.get(18)
+        self._rect = pygame.Rect(int(self.x), int(self.y), self.w, self.h)
 
     @property
     def rect(self):
-        return pygame.Rect(int(self.x), int(self.y), self.w, self.h)
+        # 캐시 Rect: x/y가 바뀐 경우에만 갱신(수정하지 말 것)
+        r = self._rect
+        x, y = int(self.x), int(self.y)
+        if r.x != x or r.y != y:
+            r.x, r.y = x, y
+        return r
 
     def update(self, player_rect, events, *, blocked=False):
         if blocked:
             return False, False
 
         # 2D 거리 기반
-        dx = player_rect.centerx - self.rect.centerx
-        dy = player_rect.centery - self.rect.centery
-        near = (dx * dx + dy * dy) ** 0.5 <= self.range
+        r = self.rect
+        dx = player_rect.centerx - r.centerx
+        dy = player_rect.centery - r.centery
+        near = dx * dx + dy * dy <= self.range * self.range
 
         activated = False
         for e in events:
@@ -217,29 +241,49 @@ class WarpGate:
 
         return near, activated
 
-    def draw_side(self, surf, camera_x):
-        sx = int(self.x - camera_x)
-        sy = int(self.y)
-        r = pygame.Rect(sx, sy, self.w, self.h)
-        pygame.draw.rect(surf, (120, 220, 255), r, border_radius=10)
+    def draw_side(self, surf, camera_x, scale=1.0):
+        sx = int((self.x - camera_x) * scale)
+        sy = int(self.y * scale)
+        r = pygame.Rect(sx, sy, int(self.w * scale), int(self.h * scale))
+        pygame.draw.rect(surf, (120, 220, 255), r, border_radius=max(1, int(10 * scale)))
         pygame.draw.rect(surf, (20, 40, 60), r, 2)
 
     def draw_hint_side(self, surf, camera_x, near):
         if not near:
             return
-        text = self.font.render(f"F: {self.label}", True, (30, 30, 40))
-        box = pygame.Surface((text.get_width() + 10, text.get_height() + 6), pygame.SRCALPHA)
-        box.fill((255, 255, 255, 210))
+        text = render_text(self.font, f"F: {self.label}", (30, 30, 40))
+        box_w, box_h = text.get_width() + 10, text.get_height() + 6
 
-        sx = int(self.rect.centerx - camera_x) - box.get_width() // 2
+        sx = int(self.rect.centerx - camera_x) - box_w // 2
         sy = self.rect.top - 50
-        surf.blit(box, (sx, sy))
+        Q.draw_panel(surf, (sx, sy, box_w, box_h), (255, 255, 255, 210))
         surf.blit(text, (sx + 5, sy + 3))
 
 
 # ------------------------------------------------------------
 # 씬 빌드
 # ------------------------------------------------------------
+# 씬 정의(맵 파일 / 스폰 / NPC / 게이트, npc_sheet는 선택: anim.SHEETS 키).
+# spawn_y가 None이면 사이드뷰 지면에 맞춰 계산.
+# NPC 여러 명은 "npcs": [(id, x), (id, x, sheet), (id, x, sheet, opts), ...] (없으면 "npc" 하나)
+# opts의 route/speed/dwell: 두 지점 순찰(worldsim.Route, 씬을 떠나 있어도 간이 시뮬로 진행)
+SCENES = {
+    "casino": {
+        "map": "casino_map.json",
+        "spawn": (1200, None),
+        "npcs": [("워니", 1400, None, {"route": (1320, 1480), "speed": 35, "dwell": 4.0})],
+        "npc_sheet": "bank_npc",
+        "gate": (2000, "연구실로 이동", "lab"),
+    },
+    "lab": {
+        "map": "map_lab.json",
+        "spawn": (400, 200),
+        "npc": ("상미니", 600),
+        "gate": (300, "카지노로 돌아가기", "casino"),
+    },
+}
+
+
 def _safe_spawn_y_side(level, spawn_x):
     r = pygame.Rect(spawn_x, 0, *S.PLAYER_SIZE)
     if hasattr(level, "surface_y"):
@@ -248,41 +292,38 @@ def _safe_spawn_y_side(level, spawn_x):
     return getattr(S, "GROUND_Y", int(S.SCREEN_H * 0.78)) - S.PLAYER_SIZE[1]
 
 
-def build_scene(scene_id: str):
-    """
-    반환:
-      level, spawn_pos(x,y), npc, gate
-    """
-    if scene_id == "casino":
-        level = Level(p("casino_map.json"))
+def _scene_spec(scene_id: str) -> dict:
+    # fallback: 모르는 id면 카지노
+    return SCENES.get(scene_id, SCENES["casino"])
 
-        spawn_x = 1200
-        spawn_y = _safe_spawn_y_side(level, spawn_x)
-
-        npc = NPC("워니", 1400, level)
-        gate = WarpGate(2000, level, "연구실로 이동", "lab")
-        return level, (spawn_x, spawn_y), npc, gate
 
-    if scene_id == "lab":
-        level = Level(p("map_lab.json"))
+def _populate_scene(level, spec: dict):
+    """레벨 위에 스폰 위치/NPC/게이트 배치."""
+    spawn_x, spawn_y = spec["spawn"]
+    if spawn_y is None:
+        spawn_y = _safe_spawn_y_side(level, spawn_x)
 
-        spawn_x = 400
-        spawn_y = 200
+    npcs = [NPC(npc_id, x, level, sheet=sheet, route=route_of(opts))
+            for npc_id, x, sheet, opts in scene_npc_entries(spec)]
+    gate = WarpGate(spec["gate"][0], level, spec["gate"][1], spec["gate"][2])
+    return (spawn_x, spawn_y), npcs, gate
 
-        npc = NPC("상미니", 600, level)
-        gate = WarpGate(300, level, "카지노로 돌아가기", "casino")
-        return level, (spawn_x, spawn_y), npc, gate
 
-    # fallback
-    return build_scene("casino")
+def build_scene(scene_id: str):
+    """
+    반환:
+      level, spawn_pos(x,y), npcs(list), gate
+    """
+    spec = _scene_spec(scene_id)
+    level = Level(p(spec["map"]))
+    spawn_pos, npcs, gate = _populate_scene(level, spec)
+    return level, spawn_pos, npcs, gate
 
 
 # ------------------------------------------------------------
 # 씬 로드 헬퍼
 # ------------------------------------------------------------
-def load_scene(scene_id, player, top):
-    level, spawn_pos, npc, gate = build_scene(scene_id)
-
+def _place_player(scene_id, player, top, spawn_pos):
     # 스폰 이동
     player.pos.x, player.pos.y = spawn_pos
 
@@ -294,54 +335,234 @@ def load_scene(scene_id, player, top):
     else:
         top.exit(player)
 
-    return level, spawn_pos, npc, gate
 
+def load_scene(scene_id, player, top):
+    level, spawn_pos, npcs, gate = build_scene(scene_id)
+    _place_player(scene_id, player, top, spawn_pos)
+    return level, spawn_pos, npcs, gate
 
-# ------------------------------------------------------------
-# 메인
-# ------------------------------------------------------------
-def main():
-    pygame.init()
-    screen = pygame.display.set_mode((S.SCREEN_W, S.SCREEN_H))
-    pygame.display.set_caption("LLD_GAME")
-    clock = pygame.time.Clock()
-    font = _sysfont(getattr(S, "FONT_NAME", None), 18)
 
-    inventory = Inventory(font)
-    top = TopdownView()
+async def load_scene_async(scene_id, progress=None):
+    """
+    build_scene의 협조적(asyncio) 버전. 렌더 태스크가 계속 돌 수 있게
+    조각마다 await 한다.
+      1) 맵 JSON 읽기/파싱 → 스레드
+      2) 사진 디코딩 → 사진 1장마다 await
+      3) NPC/게이트 생성 → 각각 await
+    progress(done, total)가 있으면 진행도 보고.
+    플레이어 배치는 하지 않는다(완료 후 Game.enter_scene에서).
+    """
+    spec = _scene_spec(scene_id)
+    level = await asyncio.to_thread(Level, p(spec["map"]))
 
-    # 플레이어(초기 값은 카지노 기준)
-    player = Player((0, 0))
+    total = len(level.photos) + 1
+    if progress:
+        progress(0, total)
+    for i, _ in enumerate(level.iter_preload_photos(), 1):
+        if progress:
+            progress(i, total)
+        await asyncio.sleep(0)
 
-    # 첫 씬
-    current_scene = "casino"
-    level, spawn_pos, npc, gate = load_scene(current_scene, player, top)
+    spawn_pos, npcs, gate = _populate_scene(level, spec)
+    if progress:
+        progress(total, total)
+    await asyncio.sleep(0)
+    return level, spawn_pos, npcs, gate
 
-    # 인벤 아바타에 플레이어 스프라이트 연결(있다면)
-    if getattr(player, "sprite", None):
-        inventory.set_avatar(player.sprite)
 
-    # 사이드뷰 카메라
-    player = Player(spawn_pos)
+class _JumpFilteredKeys:
+    """대화 막 끝난 프레임에 SPACE/W 점프만 무시."""
+    def __init__(self, base):
+        self._base = base
 
-    # 사이드뷰 카메라
-    camera_x = 0.0
+    def __getitem__(self, k):
+        if k == K.JUMP_SPACE or k == K.JUMP_W:
+            return False
+        return self._base[k]
 
-    running = True
-    last_talk_active = False  # ✅ 직전 프레임에 대화 중이었는지
-    while running:
-        dt = clock.tick(S.FPS) / 1000.0
-        events = pygame.event.get()
 
+# ------------------------------------------------------------
+# 게임 상태 + 프레임 update/draw
+# - main(동기 루프)과 main_async(asyncio 루프)가 같이 사용
+# ------------------------------------------------------------
+class Game:
+    def __init__(self, font, scaler, sim=None):
+        self.font = font
+        self.scaler = scaler
+        self.running = True
+
+        # 시뮬레이션 프로세스(simproc.SimProcess). None이면 이 프로세스에서 물리/순찰 계산
+        self.sim = sim
+        # 시뮬 프로세스 모드: 순찰을 멈출 NPC 인덱스(대화 중/플레이어 근처)
+        self.held = set()
+
+        self.inventory = Inventory(font)
+        self.top = TopdownView()
+        self.player = Player((0, 0))
+
+        # 인벤 아바타에 플레이어 스프라이트 연결(있다면)
+        if getattr(self.player, "sprite", None):
+            self.inventory.set_avatar(self.player.sprite)
+
+        self.current_scene = None
+        self.level = self.npc = self.gate = None
+        # 씬의 NPC 전부. self.npc는 대화/힌트 대상(대화 중이거나 가까운 NPC)
+        self.npcs = []
+        # NPC 갱신 LOD: 근처 매 프레임 / 화면 안 LOD_PERIODS["screen"] / 화면 밖 LOD_PERIODS["far"]
+        self.lod = LODScheduler()
+        # 언로드된 씬의 NPC 간이 시뮬(위치/순찰 일정만, WORLDSIM_HZ)
+        self.world = WorldSim(SCENES)
+        # 떠난 씬의 NPC 상태(visit_count 등). 다시 들어오면 새로 만든 NPC에 복원
+        self.states = snapshot.SceneStates()
+        # 빌드해 둔 씬(scene_id → (level, spawn_pos, npcs, gate)), 최근 S.SCENE_CACHE개(LRU).
+        # 다시 들어올 때 build_scene(맵 JSON/사진/NPC/게이트) 없이 그대로 쓰고 스냅샷만 적용
+        self.built = OrderedDict()
+
+        # 사이드뷰 카메라
+        self.camera_x = 0.0
+
+        self.last_talk_active = False  # ✅ 직전 프레임에 대화 중이었는지
+        self.near_npc = False
+        self.near_gate = False
+
+        # 워프 요청 처리기. None이면 그 자리에서 동기 로드.
+        # (asyncio 루프는 여기에 로딩 태스크 시작 함수를 넣는다)
+        self.on_warp = None
+        # 비동기 로딩 중이면 {"scene":..., "done":..., "total":..., "t":...}
+        self.loading = None
+
+    # -------------------------
+    # 씬 전환
+    # -------------------------
+    def enter_scene(self, scene_id, built, capture=True):
+        level, spawn_pos, npcs, gate = built
+        # 떠나는 씬 NPC 상태 → 스냅샷 + 간이 시뮬, 들어오는 씬은 스냅샷 → 간이 시뮬 위치 순으로 복원
+        # (capture=False: 퀵로드처럼 저장본 상태를 덮어쓰면 안 될 때)
+        if self.current_scene is not None and capture:
+            self.states.capture(self.current_scene, self.npcs)
+            self.world.store(self.current_scene, self.npcs)
+        self.states.restore(scene_id, npcs)
+        self.world.restore(scene_id, npcs, level)
+        _place_player(scene_id, self.player, self.top, spawn_pos)
+        self.current_scene = scene_id
+        self.level, self.npcs, self.gate = level, npcs, gate
+        self.npc = npcs[0] if npcs else None
+        self._keep_built(scene_id, built)
+        self.lod.reset()
+        flags.STORE.add(f"visits:{scene_id}")
+
+        if self.sim is not None:
+            self.held.clear()
+            self.sim.load_scene(level.map_file, self.player.mode, spawn_pos, npcs)
+
+        # 사이드뷰 카메라 리셋
+        if scene_id == "casino":
+            self.camera_x = 0.0
+
+    def _keep_built(self, scene_id, built):
+        limit = getattr(S, "SCENE_CACHE", 4)
+        if limit <= 0:
+            return
+        cache = self.built
+        cache[scene_id] = built
+        cache.move_to_end(scene_id)
+        while len(cache) > limit:
+            # 지금 씬은 맨 뒤라 안 빠짐. 빠진 씬은 다음에 build_scene + 스냅샷 복원
+            cache.popitem(last=False)
+
+    def scene_built(self, scene_id):
+        """빌드해 둔 씬이 있으면 그것, 없으면 build_scene(동기)."""
+        built = self.built.get(scene_id)
+        return built if built is not None else build_scene(scene_id)
+
+    def warp(self, scene_id):
+        if scene_id in self.built:
+            # 빌드해 둔 씬: 로딩 없이 바로(비동기 루프도 로딩 화면 없음)
+            self.enter_scene(scene_id, self.built[scene_id])
+        elif self.on_warp is not None:
+            self.on_warp(scene_id)
+        else:
+            self.enter_scene(scene_id, build_scene(scene_id))
+
+    # -------------------------
+    # 퀵세이브 / 퀵로드
+    # -------------------------
+    def _quicksave_path(self):
+        name = getattr(S, "QUICKSAVE_FILE", "quicksave.json")
+        return name if os.path.isabs(name) else p(name)
+
+    def quick_save(self, path=None):
+        """지금 씬 상태 + 떠난 씬 스냅샷 + 간이 시뮬 + 플래그를 파일로. 대화/로딩 중엔 안 함."""
+        if self.loading is not None or any(n.talk_active for n in self.npcs):
+            return False
+        self.states.capture(self.current_scene, self.npcs)
+        self.world.store(self.current_scene, self.npcs)
+        data = {
+            "scene": self.current_scene,
+            "player": [round(self.player.pos.x, 2), round(self.player.pos.y, 2)],
+            "scenes": self.states.to_dict(),
+            "world": self.world.to_dict(),
+            "flags": flags.STORE.to_dict(),
+        }
+        return snapshot.write(path or self._quicksave_path(), data)
+
+    def quick_load(self, path=None):
+        """
+        저장 씬이 지금 씬이면 다시 빌드하지 않고 지금 NPC에 복원만.
+        다른 씬이면 빌드해 둔 씬에 복원, 없으면 동기 build_scene(비동기 루프에서도 잠깐 멈춤).
+        """
+        if self.loading is not None:
+            return False
+        data = snapshot.read(path or self._quicksave_path())
+        if data is None:
+            return False
+        scene_id = data["scene"]
+        self.states.load_dict(data.get("scenes"))
+        self.world.load_dict(data.get("world"))
+        if scene_id == self.current_scene:
+            self.states.restore(scene_id, self.npcs)
+            self.world.restore(scene_id, self.npcs, self.level)
+            self.lod.reset()
+        else:
+            self.enter_scene(scene_id, self.scene_built(scene_id), capture=False)
+        # enter_scene의 visits 증가까지 저장본 값으로 덮어씀
+        flags.STORE.load_dict(data.get("flags") or {})
+
+        player = self.player
+        player.pos.x, player.pos.y = data["player"]
+        player.vel.x = player.vel.y = 0
+        self.last_talk_active = False
+        if self.sim is not None:
+            self.held.clear()
+            self.sim.load_scene(self.level.map_file, player.mode, (player.pos.x, player.pos.y), self.npcs)
+        return True
+
+    # -------------------------
+    # 업데이트
+    # -------------------------
+    def update(self, dt, events):
         # -------------------------
         # 기본 이벤트
         # -------------------------
         for e in events:
             if e.type == pygame.QUIT:
-                running = False
-            elif e.type == pygame.KEYDOWN:
+                self.running = False
+            elif e.type == pygame.KEYDOWN and self.loading is None:
                 if e.key == K.INVENTORY:
-                    inventory.toggle()
+                    self.inventory.toggle()
+                elif e.key == K.QUICK_SAVE:
+                    self.quick_save()
+                elif e.key == K.QUICK_LOAD:
+                    self.quick_load()
+
+        # 로딩 중에는 월드 정지(로딩 화면만 움직임)
+        if self.loading is not None:
+            return
+
+        # 다른 씬 NPC 간이 시뮬(프레임당 한 그룹)
+        self.world.update(dt, loaded=self.current_scene)
+
+        inventory, player, gate, level = self.inventory, self.player, self.gate, self.level
 
         # -------------------------
         # 인벤 열림 시 일부 입력 차단
@@ -358,12 +579,39 @@ def main():
             npc_events = filtered
 
         # -------------------------
-        # NPC 업데이트
+        # NPC 업데이트(LOD 스케줄)
+        # - 대화 중인 NPC는 항상 매 프레임, 입력도 그 NPC만 받음
+        # - 근접 판정 범위(NPC.range)는 LOD near 구간 안이라 근처 NPC는 매 프레임 갱신됨
         # -------------------------
-        near_npc = npc.update(player.rect, npc_events)
+        npcs = self.npcs
+        talking = next((n for n in npcs if n.talk_active), None)
+        if player.mode == "topdown":
+            view = view_rect_top(self.top.camera_x, self.top.camera_y)
+        else:
+            view = view_rect_side(self.camera_x)
+        focus, self.near_npc = talking, talking is not None
+        for i, ndt in self.lod.schedule(npcs, player.rect, view, dt, force=(talking,) if talking else ()):
+            n = npcs[i]
+            near = n.update(player.rect, npc_events if talking is None or n is talking else ())
+            if n.talk_active and talking is None:
+                talking = focus = n
+                self.near_npc = True
+            elif near and focus is None:
+                focus, self.near_npc = n, True
+            n.animate(ndt)
+            # 순찰: 대화 중/플레이어 근처면 멈춤. 시뮬 프로세스 모드는 순찰을 시뮬 쪽이 돌림 → 멈출 NPC만 알림
+            stop = near or n.talk_active
+            if self.sim is not None:
+                if stop:
+                    self.held.add(i)
+                else:
+                    self.held.discard(i)
+            elif not stop:
+                n.walk(ndt, level)
+        self.npc = focus or (self.npc if self.npc in npcs else (npcs[0] if npcs else None))
 
         # 이번 프레임 대화 상태
-        talk_active_now = getattr(npc, "talk_active", False)
+        talk_active_now = talking is not None
 
         # 이번 프레임에 SPACE(대화 진행 키)가 눌렸는지
         used_continue_key = any(
@@ -372,31 +620,20 @@ def main():
         )
 
         # ✅ "직전에는 대화 중이었고, 지금은 아니고, 이번 프레임에 SPACE를 눌렀다" = 대화 막 끝난 프레임
-        talk_just_closed = (last_talk_active and not talk_active_now and used_continue_key)
+        talk_just_closed = (self.last_talk_active and not talk_active_now and used_continue_key)
 
         # -------------------------
         # 게이트 업데이트
         # - 인벤/대화 중에는 워프 금지
         # -------------------------
-        warp_blocked = inventory.is_open or getattr(npc, "talk_active", False)
-        near_gate, gate_on = gate.update(player.rect, events, blocked=warp_blocked)
+        warp_blocked = inventory.is_open or talk_active_now
+        self.near_gate, gate_on = gate.update(player.rect, events, blocked=warp_blocked)
 
         # -------------------------
         # 입력 처리
         # -------------------------
         keys = pygame.key.get_pressed()
 
-        # 점프만 막는 키 래퍼
-        class _JumpFilteredKeys:
-            def __init__(self, base):
-                self._base = base
-
-            def __getitem__(self, k):
-                # 대화 막 끝난 프레임에 SPACE/W 점프만 무시
-                if k == K.JUMP_SPACE or k == K.JUMP_W:
-                    return False
-                return self._base[k]
-
         # 1) 대화 중 또는 인벤토리 열림 → 전체 이동/점프 입력 차단
         if talk_active_now or inventory.is_open:
             keys_use = _NoKeys()
@@ -410,58 +647,84 @@ def main():
             keys_use = keys
 
         # -------------------------
-        # 플레이어 업데이트
+        # 움직이는 발판 + 플레이어 업데이트
         # -------------------------
-        player.update(dt, keys_use, level)
+        if self.sim is not None:
+            # 물리는 시뮬 프로세스: 입력 보내고 최신 스냅샷 반영(발판 위치도 스냅샷 것만 씀)
+            self.sim.send_input(keys_use)
+            self.sim.hold(self.held)
+            self.sim.apply(player, level, npcs)
+        else:
+            level.update(dt)
+            level.carry(player)
+            player.update(dt, keys_use, level)
+        player.animate(dt)
+        self.last_talk_active = talk_active_now
 
         # -------------------------
         # 워프 처리
         # -------------------------
         if gate_on:
-            current_scene = gate.target_scene
-            level, spawn_pos, npc, gate = load_scene(current_scene, player, top)
-
-            # 사이드뷰 카메라 리셋
-            if current_scene == "casino":
-                camera_x = 0.0
+            self.warp(gate.target_scene)
+            if self.loading is not None:
+                return
 
         # -------------------------
         # 카메라 업데이트
         # -------------------------
-        if current_scene == "casino":
+        if self.current_scene == "casino":
             target = player.pos.x + player.w / 2 - S.SCREEN_W / 2
-            if getattr(level, "world_w", S.SCREEN_W) > S.SCREEN_W:
-                target = max(0, min(level.world_w - S.SCREEN_W, target))
+            if getattr(self.level, "world_w", S.SCREEN_W) > S.SCREEN_W:
+                target = max(0, min(self.level.world_w - S.SCREEN_W, target))
             else:
                 target = 0
-            camera_x += (target - camera_x) * min(1.0, dt * 8.0)
+            if Q.current().camera_lerp:
+                self.camera_x += (target - self.camera_x) * min(1.0, dt * 8.0)
+            else:
+                self.camera_x = target
         else:
-            top.update(dt, player, level)
-
-        # -------------------------
-        # 렌더
-        # -------------------------
-        if current_scene == "casino":
-            level.draw(screen, camera_x)
-            gate.draw_side(screen, camera_x)
-            npc.draw(screen, camera_x)
-            player.draw(screen, camera_x)
-
-            gate.draw_hint_side(screen, camera_x, near_gate)
-            npc.draw_dialog(screen, camera_x, near_npc, S.SCREEN_W, S.SCREEN_H)
+            self.top.update(dt, player, self.level)
+
+    # -------------------------
+    # 렌더
+    # -------------------------
+    def draw(self, screen):
+        scaler = self.scaler
+        level, player, npc, gate = self.level, self.player, self.npc, self.gate
+        camera_x = self.camera_x
+
+        # 월드는 scaler 내부 surface(scale < 1) 또는 screen에 바로 그린다.
+        world = scaler.begin(screen)
+        scale = scaler.scale
+        if self.current_scene == "casino":
+            level.draw(world, camera_x, scale=scale)
+            gate.draw_side(world, camera_x, scale=scale)
+            for n in self.npcs:
+                n.draw(world, camera_x, scale=scale)
+            player.draw(world, camera_x, scale=scale)
+            scaler.present(screen, world)
+
+            # 여기부터 원래 해상도(UI)
+            if scaler.active:
+                for n in self.npcs:
+                    n.draw_name(screen, camera_x)
+            gate.draw_hint_side(screen, camera_x, self.near_gate)
+            if npc is not None:
+                npc.draw_dialog(screen, camera_x, self.near_npc, S.SCREEN_W, S.SCREEN_H)
 
         else:
             # 연구실 탑다운 렌더
-            top.draw(screen, level, player, npcs=[npc], gates=[gate])
+            self.top.draw(world, level, player, npcs=self.npcs, gates=[gate], scale=scale)
+            scaler.present(screen, world)
 
             # 대화 UI는 화면 고정 방식이므로 camera_x=0으로 유지
             try:
-                npc.draw_dialog(screen, 0, near_npc, S.SCREEN_W, S.SCREEN_H)
+                npc.draw_dialog(screen, 0, self.near_npc, S.SCREEN_W, S.SCREEN_H)
             except Exception:
                 pass
 
         # 인벤 UI
-        inventory.draw(screen)
+        self.inventory.draw(screen)
 
         # -------------------------
         # 도움말
@@ -469,20 +732,180 @@ def main():
         help_lines = [
             "카지노: A/D 이동  SPACE 대화  E 인벤  F 워프",
             "연구실: WASD 이동(아이작 시점)  SPACE 대화  E 인벤  F 워프",
-            f"현재 씬: {current_scene}",
+            f"현재 씬: {self.current_scene}",
         ]
         for i, s in enumerate(help_lines):
-            img = font.render(s, True, (30, 30, 40))
-            box = pygame.Surface((img.get_width() + 10, img.get_height() + 4), pygame.SRCALPHA)
-            box.fill((255, 255, 255, 150))
-            screen.blit(box, (10, 10 + i * 22))
+            img = render_text(self.font, s, (30, 30, 40))
+            Q.draw_panel(screen, (10, 10 + i * 22, img.get_width() + 10, img.get_height() + 4), (255, 255, 255, 150))
             screen.blit(img, (15, 12 + i * 22))
 
-        pygame.display.flip()
-        last_talk_active = talk_active_now
+        if self.loading is not None:
+            self.draw_loading(screen)
+
+    def draw_loading(self, screen):
+        """로딩 화면: 직전 씬 위로 페이드 + 진행 막대 + 점 애니메이션."""
+        ld = self.loading
+        t = ld["t"]
+        fade = min(1.0, t / 0.25)
+        Q.draw_panel(screen, (0, 0, S.SCREEN_W, S.SCREEN_H), (10, 12, 18, int(235 * fade)))
+
+        dots = "." * (1 + int(t * 4) % 3)
+        img = render_text(self.font, f"불러오는 중{dots}", (235, 235, 240))
+        cx, cy = S.SCREEN_W // 2, S.SCREEN_H // 2
+        screen.blit(img, (cx - img.get_width() // 2, cy - 30))
+
+        bar = pygame.Rect(0, 0, 280, 10)
+        bar.center = (cx, cy + 6)
+        pygame.draw.rect(screen, (60, 65, 85), bar, border_radius=4)
+        frac = ld["done"] / ld["total"] if ld["total"] else 0.0
+        if frac > 0:
+            fill = bar.copy()
+            fill.w = max(1, int(bar.w * frac))
+            pygame.draw.rect(screen, (250, 230, 170), fill, border_radius=4)
+
 
+# ------------------------------------------------------------
+# 실행 옵션
+# ------------------------------------------------------------
+def _parse_args(argv=None):
+    ap = argparse.ArgumentParser(description="LLD_GAME")
+    ap.add_argument("--render-scale", type=float, default=getattr(S, "RENDER_SCALE", 1.0),
+                    help="월드 내부 렌더 배율 (0.5~1.0, UI는 원래 해상도)")
+    ap.add_argument("--dynamic-res", action="store_true", default=getattr(S, "DYNAMIC_RES", False),
+                    help="프레임 시간에 맞춰 내부 렌더 배율 자동 조절")
+    ap.add_argument("--quality", choices=["auto"] + Q.TIER_NAMES, default=getattr(S, "QUALITY", "high"),
+                    help="화질 단계 고정. auto면 프레임 시간에 따라 자동 조절")
+    ap.add_argument("--pacing", choices=PACING_STRATEGIES, default=getattr(S, "FRAME_PACING", "sleep"),
+                    help="프레임 페이싱 전략 (sleep / busy / hybrid / vsync)")
+    ap.add_argument("--pacing-stats", nargs="?", const="", default=None, metavar="FILE",
+                    help="종료 시 프레임 간격 지터/입력 지연 히스토그램 출력(FILE 주면 JSON 저장)")
+    ap.add_argument("--async-loop", action="store_true", default=getattr(S, "ASYNC_LOOP", False),
+                    help="asyncio 메인 루프(씬 로딩 중에도 로딩 화면이 계속 그려짐)")
+    ap.add_argument("--sim-process", action="store_true", default=getattr(S, "SIM_PROCESS", False),
+                    help="플레이어/NPC 순찰/움직이는 발판을 별도 프로세스에서 실행(공유 메모리 스냅샷)")
+    return ap.parse_args(argv)
+
+
+def _setup(args):
+    """디스플레이/페이서/스케일러/화질 설정 후 (pacer, screen, game, monitors) 반환."""
+    pygame.init()
+    pacer = FramePacer(args.pacing, S.FPS)
+    screen = pacer.set_mode((S.SCREEN_W, S.SCREEN_H))
+    pygame.display.set_caption("LLD_GAME")
+    font = fonts.get(18)
+    warmup(font, (30, 30, 40), (235, 235, 240))
+
+    # 내부 해상도 렌더(월드만) + 선택적 동적 해상도
+    scaler = RenderScaler(args.render_scale, min_scale=getattr(S, "DYNAMIC_RES_MIN", 0.5))
+    dyn_res = DynamicResolution(scaler) if args.dynamic_res else None
+    # 스프라이트 프레임은 쓸 수 있는 배율만큼 Animator 생성(씬 빌드) 때 미리 → 그리는 중 리샘플링 없음
+    anim.set_bake_scales(scaler.steps() if dyn_res is not None else [scaler.scale])
+
+    # 화질 단계: auto면 high에서 시작해 governor가 조절(동적 해상도와 같이 쓰면 배율 먼저)
+    if args.quality == "auto":
+        governor = Q.QualityGovernor(scaler=scaler if dyn_res is not None else None)
+    else:
+        Q.set_tier(args.quality)
+        governor = None
+    print(f"[quality] tier = {Q.current().name} ({args.quality})")
+
+    monitors = [m for m in (dyn_res, governor) if m is not None]
+    sim = SimProcess() if args.sim_process else None
+    return pacer, screen, Game(font, scaler, sim), monitors
+
+
+def _finish(args, pacer, game):
+    if game.sim is not None:
+        game.sim.close()
+    if args.pacing_stats is not None:
+        pacer.report(args.pacing_stats or None)
     pygame.quit()
 
 
+# ------------------------------------------------------------
+# 메인
+# ------------------------------------------------------------
+def main(argv=None):
+    args = _parse_args(argv)
+    if args.async_loop:
+        asyncio.run(main_async(args))
+        return
+
+    pacer, screen, game, monitors = _setup(args)
+
+    # 첫 씬
+    game.enter_scene("casino", build_scene("casino"))
+
+    while game.running:
+        dt = pacer.tick()
+        for m in monitors:
+            # work_ms: 대기(tick, flip) 시간을 뺀 직전 프레임 작업 시간(ms)
+            m.update(pacer.work_ms)
+        events = pygame.event.get()
+        pacer.mark_input(events)
+
+        game.update(dt, events)
+        game.draw(screen)
+        pacer.present()
+
+    _finish(args, pacer, game)
+
+
+async def main_async(args):
+    """
+    asyncio 메인 루프.
+    - 이 코루틴(update/render 태스크)은 프레임 사이 남는 시간을 await로 양보
+    - 워프 시 load_scene_async를 별도 태스크로 돌리고, 끝나면 씬 교체
+    - 로딩 중에도 로딩 화면(페이드/진행 막대)이 S.FPS로 계속 그려짐
+    """
+    pacer, screen, game, monitors = _setup(args)
+    task = None
+
+    def start_loading(scene_id):
+        nonlocal task
+        ld = {"scene": scene_id, "done": 0, "total": 1, "t": 0.0}
+
+        def progress(done, total):
+            ld["done"], ld["total"] = done, total
+
+        game.loading = ld
+        task = asyncio.create_task(load_scene_async(scene_id, progress))
+
+    game.on_warp = start_loading
+
+    # 첫 씬도 같은 경로로(로딩 화면부터 보임)
+    start_loading("casino")
+
+    while game.running:
+        dt = await pacer.tick_async()
+        for m in monitors:
+            m.update(pacer.work_ms)
+        events = pygame.event.get()
+        pacer.mark_input(events)
+
+        if task is not None and task.done():
+            # 로딩 실패는 그대로 올려보낸다(동기 루프와 같은 동작)
+            game.enter_scene(game.loading["scene"], task.result())
+            game.loading = None
+            task = None
+        elif game.loading is not None:
+            game.loading["t"] += dt
+
+        game.update(dt, events)
+        if game.level is None:
+            # 첫 씬 로딩 중: 그릴 월드가 없으니 로딩 화면만
+            screen.fill((10, 12, 18))
+            game.draw_loading(screen)
+        else:
+            game.draw(screen)
+        pacer.present()
+
+    if task is not None:
+        task.cancel()
+    _finish(args, pacer, game)
+
+
 if __name__ == "__main__":
+    # PyInstaller exe에서 --sim-process 자식 프로세스가 다시 main을 돌지 않게
+    multiprocessing.freeze_support()
     main()
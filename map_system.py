@@ -9,17 +9,33 @@
 4) 타일 오버라이드 API (load_overrides, save_overrides, get_override_meta)
 5) 벽(충돌) API (load_blocks, save_blocks, toggle_block_at_world 등)
 6) 좌표/그리드 유틸 (get_cell_from_world, clamp_to_world)
-7) 렌더링 (load_image_cached, draw_background, draw_blocks_overlay)
+7) 렌더링 (load_image_cached, TileStreamer, draw_background, draw_blocks_overlay)
+   - 셀 → 타일 경로 표는 맵/오버라이드 로드 때 한 번 만든다(set_tile_override는 그 칸만 갱신)
+   - 배경은 MEGACHUNK_TILES x MEGACHUNK_TILES 타일을 미리 합친 메가청크로 그림(프레임당 blit 몇 번)
+     에디터가 타일을 바꾸면 그 칸이 든 청크만 다시 합성
+   - 같은 내용 타일은 surface 하나 공유(imgpool: 파일 바이트 해시면 디코딩 생략, 아니면 픽셀 해시)
+     캐시 예산도 공유 surface는 한 번만 센다
+   - 벽 오버레이(에디터)도 BLOCK_OVERLAY_CHUNK px 월드 청크 surface로 캐시,
+     블록 토글/로드/맵 전환 때 바뀐 청크만 다시 그림
+   - tile_atlas.py로 구운 아틀라스(TILE_ATLAS_DIR/<map>/manifest.json)가 있으면 맵 전환 때
+     페이지 몇 장만 읽고, 타일은 파일 대신 페이지의 부분 영역(subsurface)에서 잘라 쓴다
+   - 타일 이미지 캐시는 TILE_CACHE_MB 예산의 LRU (오래 안 쓴 타일부터 해제)
+   - TILE_STREAMING이면 타일 디코딩/리샘플링은 워커 스레드, 화면 주변 TILE_PREFETCH_RING 칸 미리 로드,
+     아직 안 온 타일은 자리표시(placeholder)로 그림 → 새 타일 줄로 넘어갈 때 프레임 멈춤 없음
 8) 충돌 (_circle_rect_intersect, collides_circle)
 """
 
 from __future__ import annotations
-import os, json
+import os, io, json
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Tuple, Optional, Set
 
 import pygame
 from pygame.math import Vector2 as V2
 
+from imgpool import ImagePool, pixel_key
+
 # ============================================================================
 # 1) 설정/전역상태: settings 안전 임포트 + 기본값
 # ============================================================================
@@ -38,15 +54,38 @@ WORLD_H    = getattr(S, "WORLD_H", MAP_ROWS * TILE_SIZE)
 BG_CLEAR_COLOR = getattr(S, "BG_CLEAR_COLOR", (17, 19, 24))
 BLOCK_SIZE = getattr(S, "BLOCK_SIZE", 32)
 TILE_FOLDER = getattr(S, "TILE_FOLDER", "assets/tiles")  # 기본 타일 폴더
+TILE_CACHE_MB = getattr(S, "TILE_CACHE_MB", 64)          # 타일 이미지 캐시 메모리 예산
+TILE_STREAMING = getattr(S, "TILE_STREAMING", True)      # 워커 스레드 타일 로딩
+TILE_STREAM_WORKERS = getattr(S, "TILE_STREAM_WORKERS", 2)
+TILE_PREFETCH_RING = getattr(S, "TILE_PREFETCH_RING", 1)  # 화면 밖 몇 칸까지 미리 로드
+TILE_UPLOADS_PER_FRAME = getattr(S, "TILE_UPLOADS_PER_FRAME", 8)  # 프레임당 convert 수
+TILE_PLACEHOLDER_COLOR = getattr(S, "TILE_PLACEHOLDER_COLOR", (28, 32, 40))
+MEGACHUNK_TILES = max(1, int(getattr(S, "MEGACHUNK_TILES", 2)))   # 메가청크 한 변 타일 수
+MEGACHUNK_BUILDS_PER_FRAME = getattr(S, "MEGACHUNK_BUILDS_PER_FRAME", 2)
+BLOCK_OVERLAY_CHUNK = getattr(S, "BLOCK_OVERLAY_CHUNK", 512)     # 벽 오버레이 청크 한 변(px, BLOCK_SIZE 배수)
+TILE_ATLAS = getattr(S, "TILE_ATLAS", True)                      # 구운 아틀라스 사용
+TILE_ATLAS_DIR = getattr(S, "TILE_ATLAS_DIR", "assets/atlas")
 
 # 현재 맵 id / 활성 타일 폴더
 CURRENT_MAP_ID: str = "city"
 ACTIVE_TILE_FOLDER: str = TILE_FOLDER
 
-# 타일 오버라이드, 이미지 캐시, 벽 블록, 오버라이드 메타
+# 타일 오버라이드, 이미지 캐시(LRU: 오래된 것이 앞), 벽 블록, 오버라이드 메타
 TILE_OVERRIDE: Dict[Tuple[int, int], str] = {}
-_image_cache: Dict[str, Optional[pygame.Surface]] = {}
+_image_cache: "OrderedDict[str, Optional[pygame.Surface]]" = OrderedDict()
+_cache_bytes = 0
+_cache_refs: Dict[int, int] = {}     # id(surface) -> 캐시 안 참조 수(공유 타일은 예산에 한 번만)
+TILE_POOL = ImagePool("tiles")
+tile_stats = {"hits": 0, "decoded": 0, "evicted": 0, "placeholders": 0, "chunks_built": 0, "blits": 0,
+              "file_opens": 0}
+# 아틀라스: 원본 크기 페이지 surface들 + 타일 경로 → 페이지 subsurface (맵 하나 동안 고정)
+_atlas_pages: list = []
+_atlas_src: Dict[str, pygame.Surface] = {}
+_tile_paths: Optional[list] = None   # [r][c] -> 타일 경로(1-base, None = 다시 만들어야 함)
 BLOCKS: Set[Tuple[int, int]] = set()
+# 벽 오버레이 청크 캐시: (cx, cy) -> surface(블록 없는 청크는 None), alpha가 바뀌면 전부 다시
+_block_chunks: Dict[Tuple[int, int], Optional[pygame.Surface]] = {}
+_block_chunk_alpha: Optional[int] = None
 OVERRIDE_META: dict = {}  # {"map":..., "override_file":..., "tile_folder":...}
 
 
@@ -65,6 +104,10 @@ def _blocks_path(map_id: str) -> str:
     """벽(블록) JSON 경로."""
     return f"map_blocks_{map_id}.json"
 
+def _atlas_manifest_path(map_id: str) -> str:
+    """아틀라스 manifest 경로(tile_atlas.py 출력)."""
+    return _norm(os.path.join(TILE_ATLAS_DIR, map_id, "manifest.json"))
+
 # ============================================================================
 # 3) 맵 전환 API
 # ============================================================================
@@ -72,20 +115,31 @@ def set_current_map(map_id: str, *, tile_folder: Optional[str] = None, autoload:
     """
     현재 맵 지정 + 필요 시 데이터 자동 로드.
     """
-    global CURRENT_MAP_ID, ACTIVE_TILE_FOLDER, TILE_OVERRIDE, BLOCKS, _image_cache, OVERRIDE_META
+    global CURRENT_MAP_ID, ACTIVE_TILE_FOLDER, TILE_OVERRIDE, BLOCKS, OVERRIDE_META, _tile_paths
+    # 떠나는 맵의 내용 공유 결과(아낀 메모리) 보고
+    if TILE_POOL.stats["shared"]:
+        print(TILE_POOL.report().replace("tiles:", f"tiles({CURRENT_MAP_ID}):"))
+    TILE_POOL.reset_stats()
     CURRENT_MAP_ID = map_id
+    _tile_paths = None
     if tile_folder is not None:
         ACTIVE_TILE_FOLDER = tile_folder
 
     # 캐시/상태 초기화
     TILE_OVERRIDE.clear()
-    _image_cache.clear()
+    clear_image_cache()
     BLOCKS.clear()
+    invalidate_blocks_overlay()
     OVERRIDE_META.clear()
 
+    _atlas_pages.clear()
+    _atlas_src.clear()
+
     if autoload:
         load_overrides(CURRENT_MAP_ID)
         load_blocks(CURRENT_MAP_ID)
+        if TILE_ATLAS:
+            load_atlas(CURRENT_MAP_ID)
 
     print(f"[map_system] current map -> {CURRENT_MAP_ID}, tiles={ACTIVE_TILE_FOLDER}")
 
@@ -129,9 +183,10 @@ def load_overrides(map_id: Optional[str] = None) -> None:
     {"_meta": {...}, "overrides": {"r,c": "assets/.../x.png", ...}}
     구형 포맷도 호환 처리.
     """
-    global TILE_OVERRIDE, _image_cache, OVERRIDE_META
+    global TILE_OVERRIDE, OVERRIDE_META, _tile_paths
     TILE_OVERRIDE.clear()
-    _image_cache.clear()
+    clear_image_cache()
+    _tile_paths = None
 
     mid = map_id or CURRENT_MAP_ID
     path = _override_path(mid)
@@ -161,6 +216,19 @@ def load_overrides(map_id: Optional[str] = None) -> None:
         print("[map_system] overrides load error:", e)
         OVERRIDE_META = _ensure_meta_defaults(mid, None)
 
+def set_tile_override(r: int, c: int, path: Optional[str]) -> None:
+    """
+    에디터: (r,c) 타일 교체(path=None이면 기본 타일로 되돌림).
+    경로 표의 그 칸과 그 칸이 든 메가청크만 갱신.
+    """
+    if path:
+        TILE_OVERRIDE[(r, c)] = _norm(path)
+    else:
+        TILE_OVERRIDE.pop((r, c), None)
+    if _tile_paths is not None and 1 <= r <= MAP_ROWS and 1 <= c <= MAP_COLS:
+        _tile_paths[r][c] = _default_tile_path(r, c)
+    invalidate_chunk_at(r, c)
+
 def save_overrides(map_id: Optional[str] = None) -> None:
     """현재 오버라이드 상태를 JSON으로 저장(메타 동기화 포함)."""
     global OVERRIDE_META
@@ -190,6 +258,7 @@ def load_blocks(map_id: Optional[str] = None) -> None:
     """벽(충돌) JSON 로드. 포맷: {"blocks":[[bx,by],...], "_meta":{...}}"""
     global BLOCKS
     BLOCKS.clear()
+    invalidate_blocks_overlay()
     mid = map_id or CURRENT_MAP_ID
     path = _blocks_path(mid)
     if not os.path.exists(path):
@@ -232,6 +301,7 @@ def toggle_block_at_world(world_pos: V2, set_to: Optional[bool] = None) -> None:
     set_to=None: 토글, True: 강제 추가, False: 강제 제거
     """
     bx, by = world_to_block(world_pos)
+    invalidate_blocks_overlay(bx, by)
     if set_to is None:
         if (bx, by) in BLOCKS:
             BLOCKS.remove((bx, by))
@@ -263,85 +333,483 @@ def clamp_to_world(pos: V2) -> V2:
 # ============================================================================
 # 7) 렌더링
 # ============================================================================
+def _surface_bytes(img: Optional[pygame.Surface]) -> int:
+    return 0 if img is None else img.get_bytesize() * img.get_width() * img.get_height()
+
+def _acct_in(img: Optional[pygame.Surface]) -> int:
+    """캐시에 참조 하나 추가 → 예산에 더할 바이트(이미 든 공유 surface면 0)."""
+    if img is None:
+        return 0
+    n = _cache_refs.get(id(img), 0)
+    _cache_refs[id(img)] = n + 1
+    return _surface_bytes(img) if n == 0 else 0
+
+def _acct_out(img: Optional[pygame.Surface]) -> int:
+    """캐시에서 참조 하나 제거 → 예산에서 뺄 바이트(마지막 참조일 때만)."""
+    if img is None:
+        return 0
+    n = _cache_refs.get(id(img), 1) - 1
+    if n > 0:
+        _cache_refs[id(img)] = n
+        return 0
+    _cache_refs.pop(id(img), None)
+    return _surface_bytes(img)
+
+def clear_image_cache() -> None:
+    """타일 캐시 비우기(맵 전환/오버라이드 재로드). 로딩 중이던 타일 결과도 버림."""
+    global _cache_bytes
+    _image_cache.clear()
+    _cache_refs.clear()
+    _cache_bytes = 0
+    STREAMER.clear()
+
+def _cache_put(path: str, img: Optional[pygame.Surface], pinned=()) -> None:
+    """캐시에 넣고 예산(TILE_CACHE_MB) 넘으면 오래된 것부터 해제. pinned(이번 프레임에 보이는 타일)는 유지."""
+    global _cache_bytes
+    if path in _image_cache:
+        _cache_bytes -= _acct_out(_image_cache.pop(path))
+    _image_cache[path] = img
+    _cache_bytes += _acct_in(img)
+
+    budget = int(TILE_CACHE_MB * 1024 * 1024)
+    if _cache_bytes <= budget:
+        return
+    for key in list(_image_cache):
+        if _cache_bytes <= budget:
+            break
+        if key in pinned or key == path:
+            continue
+        _cache_bytes -= _acct_out(_image_cache.pop(key))
+        tile_stats["evicted"] += 1
+
+def cache_bytes() -> int:
+    return _cache_bytes
+
+def load_atlas(map_id: Optional[str] = None) -> int:
+    """
+    구운 아틀라스가 있으면 페이지를 읽어 타일 경로 → 페이지 subsurface 등록(등록 수 반환).
+    타일은 원본 크기 그대로 들어 있고, 처음 쓸 때 _decode_tile이 TILE_SIZE로 리샘플링해
+    보통 타일처럼 LRU 캐시/메가청크로 간다(페이지는 원본 크기라 작음).
+    manifest에 없는 경로(나중에 바꾼 오버라이드 등)는 예전처럼 파일에서 로드된다.
+    타일 원본을 고쳤으면 tile_atlas.py로 다시 구울 것(여기서는 원본 파일을 열지 않음).
+    """
+    _atlas_pages.clear()
+    _atlas_src.clear()
+    mid = map_id or CURRENT_MAP_ID
+    path = _atlas_manifest_path(mid)
+    if not os.path.exists(path):
+        return 0
+    try:
+        tile_stats["file_opens"] += 1
+        with open(path, "r", encoding="utf-8") as f:
+            raw = json.load(f)
+        base = os.path.dirname(path)
+        for name, w, h in raw.get("_meta", {}).get("pages", []):
+            tile_stats["file_opens"] += 1
+            page_path = os.path.join(base, name)
+            if name.endswith(".rgba"):
+                # 원시 RGBA 바이트(압축 해제 없음)
+                with open(page_path, "rb") as f:
+                    frombytes = getattr(pygame.image, "frombytes", None) or pygame.image.fromstring
+                    page = frombytes(f.read(), (w, h), "RGBA")
+            else:
+                page = pygame.image.load(page_path)
+            _atlas_pages.append(page)
+        for p, (pi, x, y, w, h) in raw.get("tiles", {}).items():
+            _atlas_src[_norm(p)] = _atlas_pages[pi].subsurface((x, y, w, h))
+        print(f"[map_system] atlas loaded: {len(_atlas_src)} tiles / {len(_atlas_pages)} pages")
+    except Exception as e:
+        print("[map_system] atlas load error:", e)
+        _atlas_pages.clear()
+        _atlas_src.clear()
+    return len(_atlas_src)
+
+def atlas_bytes() -> int:
+    return sum(_surface_bytes(p) for p in _atlas_pages)
+
+def _decode_tile(path: str, lookup: bool = False) -> tuple:
+    """
+    파일(아틀라스에 있으면 페이지 부분 영역) → TILE_SIZE 리샘플링.
+    반환 (img, 파일 키, 픽셀 키, 완성 여부): 완성이면 TILE_POOL에 이미 있는 공유 surface(디코딩 생략),
+    아니면 convert 전 surface(_finish_tile이 마무리).
+    워커 스레드에서도 호출됨(디스플레이 접근 없음, 아틀라스 페이지는 읽기만).
+    TILE_POOL 찾기/등록은 메인 스레드에서만 → 파일 키로 먼저 찾아 디코딩을 건너뛰는 건
+    lookup=True(메인 스레드의 동기 로드)일 때만. 워커는 해시만 하고 찾기는 _finish_tile에서.
+    """
+    size = (TILE_SIZE, TILE_SIZE)
+    src = _atlas_src.get(path)
+    if src is not None:
+        full = pygame.Surface(src.get_size(), pygame.SRCALPHA, 32)
+        full.blit(src, (0, 0))
+        img = full if src.get_size() == size else pygame.transform.smoothscale(full, size)
+        return img, None, (pixel_key(full), size), False
+    if not os.path.exists(path):
+        print(f"[map_system] 이미지 파일 없음: {path}")
+        return None, None, None, False
+    try:
+        tile_stats["file_opens"] += 1
+        fkey, data = TILE_POOL.read(path, size)
+        if lookup:
+            shared = TILE_POOL.get_file(fkey)
+            if shared is not None:
+                return shared, fkey, None, True
+        img = pygame.image.load(io.BytesIO(data), path)
+        # 한 가지 32비트 RGBA 포맷으로(convert 없이): 팔레트 이미지도 smoothscale 가능,
+        # 파일 형식(PNG/BMP/JPG)이 달라도 같은 픽셀이면 같은 픽셀 키
+        full = pygame.Surface(img.get_size(), pygame.SRCALPHA, 32)
+        full.blit(img, (0, 0))
+        # 픽셀 키는 리샘플링 전 원본 + 목표 크기(같은 원본이면 결과도 같음, 원본이 작아 해시가 쌈)
+        return pygame.transform.smoothscale(full, size), fkey, (pixel_key(full), size), False
+    except Exception as e:
+        print("[map_system] load image err:", path, e)
+        return None, None, None, False
+
+def _finish_tile(res: tuple) -> Optional[pygame.Surface]:
+    """
+    _decode_tile 결과 → 캐시에 넣을 surface(메인 스레드).
+    파일 키나 픽셀이 같은 타일이 있으면 그것(convert 생략).
+    """
+    img, fkey, pkey, final = res
+    if img is None or final:
+        return img
+    # 워커가 이미 디코딩했으므로 decodes_skipped로는 안 셈
+    found = TILE_POOL.get_file(fkey, skipped=False)
+    if found is None:
+        found = TILE_POOL.get_pixels(pkey, fkey)
+    if found is not None:
+        return found
+    # convert_alpha는 디스플레이 포맷이 필요 → 메인 스레드에서
+    try:
+        img = img.convert_alpha()
+    except pygame.error:
+        pass  # 디스플레이 없음(도구/테스트)
+    return TILE_POOL.add(img, pkey, fkey)
+
 def load_image_cached(path: str) -> Optional[pygame.Surface]:
     """
-    경로의 이미지를 캐시 후 반환. 없거나 에러면 None 캐싱.
+    경로의 이미지를 캐시 후 반환(동기). 없거나 에러면 None 캐싱.
     로드 시 TILE_SIZE로 리샘플링(smoothscale).
     """
     path = _norm(path)
     if path in _image_cache:
+        _image_cache.move_to_end(path)
+        tile_stats["hits"] += 1
         return _image_cache[path]
 
-    if not os.path.exists(path):
-        print(f"[map_system] 이미지 파일 없음: {path}")
-        _image_cache[path] = None
-        return None
+    img = _finish_tile(_decode_tile(path, lookup=True))
+    tile_stats["decoded"] += 1
+    _cache_put(path, img)
+    return img
 
-    try:
-        img = pygame.image.load(path).convert_alpha()
-        img = pygame.transform.smoothscale(img, (TILE_SIZE, TILE_SIZE))
-        _image_cache[path] = img
-        return img
-    except Exception as e:
-        print("[map_system] load image err:", path, e)
-        _image_cache[path] = None
+
+class TileStreamer:
+    """
+    타일 백그라운드 로더.
+    - request(path): 워커 스레드에 디코딩 맡김(이미 맡겼으면 무시)
+    - pump(pinned): 끝난 결과를 프레임당 TILE_UPLOADS_PER_FRAME개까지 convert 후 캐시에 넣음
+    - clear(): 맵 전환 시 대기 중 결과 버림(이미 돌고 있는 디코딩은 끝나도 무시됨)
+    스레드 풀은 처음 request할 때 만든다.
+    """
+
+    def __init__(self, workers: int = TILE_STREAM_WORKERS, uploads_per_frame: int = TILE_UPLOADS_PER_FRAME):
+        self.workers = max(1, int(workers))
+        self.uploads_per_frame = max(1, int(uploads_per_frame))
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pending: Dict[str, object] = {}      # path -> Future (요청 순서 유지)
+
+    def request(self, path: str) -> None:
+        if path in self._pending:
+            return
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(self.workers, thread_name_prefix="tile")
+        self._pending[path] = self._pool.submit(_decode_tile, path)
+
+    def is_pending(self, path: str) -> bool:
+        return path in self._pending
+
+    def pump(self, pinned=()) -> int:
+        """끝난 타일을 캐시에 올림. 올린 수."""
+        done = 0
+        for path, fut in list(self._pending.items()):
+            if done >= self.uploads_per_frame:
+                break
+            if not fut.done():
+                continue
+            del self._pending[path]
+            try:
+                res = fut.result()
+            except Exception as e:
+                print("[map_system] tile worker err:", path, e)
+                res = (None, None, None, False)
+            _cache_put(path, _finish_tile(res), pinned)
+            tile_stats["decoded"] += 1
+            done += 1
+        return done
+
+    def clear(self) -> None:
+        for fut in self._pending.values():
+            fut.cancel()
+        self._pending.clear()
+
+    def wait(self) -> None:
+        """대기 중인 타일 전부 끝날 때까지(도구/벤치용)."""
+        while self._pending:
+            for fut in list(self._pending.values()):
+                fut.result()
+            self.pump()
+
+    def shutdown(self) -> None:
+        self.clear()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+
+
+STREAMER = TileStreamer()
+
+def _default_tile_path(r: int, c: int) -> str:
+    path = TILE_OVERRIDE.get((r, c))
+    if not path:
+        path = os.path.join(ACTIVE_TILE_FOLDER, f"{r}-{c}.png")
+    return _norm(path)
+
+def _path_table() -> list:
+    """[r][c] → 타일 경로. 맵/오버라이드가 바뀐 뒤 처음 그릴 때 한 번 만든다."""
+    global _tile_paths
+    if _tile_paths is None:
+        _tile_paths = [[None] * (MAP_COLS + 1)] + [
+            [None] + [_default_tile_path(r, c) for c in range(1, MAP_COLS + 1)]
+            for r in range(1, MAP_ROWS + 1)
+        ]
+    return _tile_paths
+
+def invalidate_tile_paths() -> None:
+    """TILE_OVERRIDE/ACTIVE_TILE_FOLDER를 직접 바꿨을 때(경로 표 + 메가청크 전부 다시)."""
+    global _tile_paths
+    _tile_paths = None
+    for key in [k for k in _image_cache if k.startswith("#chunk:")]:
+        _cache_drop(key)
+
+def _tile_range(camera_offset: V2, ring: int = 0) -> Tuple[int, int, int, int]:
+    """화면(+ring칸)에 걸치는 타일 (start_r, end_r, start_c, end_c), 1-base 포함 범위."""
+    left, top = -camera_offset.x, -camera_offset.y
+    start_c = max(1, int(left // TILE_SIZE) + 1 - ring)
+    end_c   = min(MAP_COLS, int((left + SCREEN_W) // TILE_SIZE) + 1 + ring)
+    start_r = max(1, int(top // TILE_SIZE) + 1 - ring)
+    end_r   = min(MAP_ROWS, int((top + SCREEN_H) // TILE_SIZE) + 1 + ring)
+    return start_r, end_r, start_c, end_c
+
+
+# ----------------------------------------------------------------------------
+# 메가청크: (cr, cc) 0-base 청크 = 타일 r ∈ [cr*N+1, cr*N+N], c ∈ [cc*N+1, cc*N+N]
+# 합친 surface는 타일과 같은 LRU 캐시("#chunk:cr,cc" 키, 같은 메모리 예산)에 들어간다.
+# 청크가 생기면 낱장 타일은 더 안 쓰이므로 LRU에서 자연히 밀려난다.
+# ----------------------------------------------------------------------------
+def _chunk_key(cr: int, cc: int) -> str:
+    return f"#chunk:{cr},{cc}"
+
+def _chunk_cells(cr: int, cc: int):
+    n = MEGACHUNK_TILES
+    return (range(cr * n + 1, min(MAP_ROWS, cr * n + n) + 1),
+            range(cc * n + 1, min(MAP_COLS, cc * n + n) + 1))
+
+def _cache_drop(key: str) -> None:
+    global _cache_bytes
+    if key in _image_cache:
+        _cache_bytes -= _acct_out(_image_cache.pop(key))
+
+def invalidate_chunk_at(r: int, c: int) -> None:
+    """(r,c) 타일이 든 메가청크만 버림 → 다음 프레임에 다시 합성."""
+    n = MEGACHUNK_TILES
+    _cache_drop(_chunk_key((r - 1) // n, (c - 1) // n))
+
+def _build_chunk(cr: int, cc: int, paths: list, streaming: bool, pinned=()) -> Optional[pygame.Surface]:
+    """
+    청크의 타일이 전부 준비됐으면 합성해 캐시에 넣고 반환.
+    스트리밍 중 아직 안 온 타일이 있으면 요청만 하고 None(그동안은 낱장/자리표시로 그림).
+    """
+    rows, cols = _chunk_cells(cr, cc)
+    cache = _image_cache
+    tiles = {}
+    for r in rows:
+        for c in cols:
+            path = paths[r][c]
+            if path in cache:
+                tiles[(r, c)] = cache[path]
+            elif streaming:
+                STREAMER.request(path)
+            else:
+                tiles[(r, c)] = load_image_cached(path)
+    if len(tiles) < len(rows) * len(cols):
         return None
 
-def draw_background(surf: pygame.Surface, camera_offset: V2) -> None:
+    # 배경색 위에 타일 합성 → 불투명 surface(투명 타일도 화면과 같은 결과)
+    chunk = pygame.Surface((len(cols) * TILE_SIZE, len(rows) * TILE_SIZE))
+    chunk.fill(BG_CLEAR_COLOR)
+    for (r, c), img in tiles.items():
+        if img is not None:
+            chunk.blit(img, ((c - 1 - cc * MEGACHUNK_TILES) * TILE_SIZE, (r - 1 - cr * MEGACHUNK_TILES) * TILE_SIZE))
+    try:
+        chunk = chunk.convert()
+    except pygame.error:
+        pass
+    _cache_put(_chunk_key(cr, cc), chunk, pinned)
+    tile_stats["chunks_built"] += 1
+    return chunk
+
+def draw_background(surf: pygame.Surface, camera_offset: V2, *, streaming: Optional[bool] = None) -> None:
     """
-    화면에 보이는 범위만 타일을 그린다.
-    - 오버라이드 우선, 없으면 ACTIVE_TILE_FOLDER/{r}-{c}.png
+    화면에 보이는 범위만 그린다.
+    - 화면에 걸친 메가청크를 한 장씩 blit (없으면 프레임당 MEGACHUNK_BUILDS_PER_FRAME개까지 합성)
+    - 아직 합성 못 한 청크는 그 청크의 보이는 타일을 낱장으로(스트리밍 중이면 자리표시)
+    - 타일 경로: 오버라이드 우선, 없으면 ACTIVE_TILE_FOLDER/{r}-{c}.png (경로 표에 미리 계산)
+    - streaming(기본 TILE_STREAMING): 캐시에 없는 타일은 워커에 맡김,
+      화면 둘레 TILE_PREFETCH_RING칸도 미리 요청. False면 그 자리에서 로드
     - 월드 외곽 라인 렌더
     """
-    surf.fill(BG_CLEAR_COLOR)
-
-    top_left_world = -camera_offset
-    bottom_right_world = V2(SCREEN_W, SCREEN_H) - camera_offset
-
-    start_c = max(1, int(top_left_world.x // TILE_SIZE) + 1)
-    end_c   = min(MAP_COLS, int(bottom_right_world.x // TILE_SIZE) + 1)
-    start_r = max(1, int(top_left_world.y // TILE_SIZE) + 1)
-    end_r   = min(MAP_ROWS, int(bottom_right_world.y // TILE_SIZE) + 1)
-
-    for r in range(start_r, end_r + 1):
-        for c in range(start_c, end_c + 1):
-            path = TILE_OVERRIDE.get((r, c))
-            if not path:
-                path = os.path.join(ACTIVE_TILE_FOLDER, f"{r}-{c}.png")
-            img = load_image_cached(path)
-            if img is None:
+    if streaming is None:
+        streaming = TILE_STREAMING
+
+    paths = _path_table()
+    start_r, end_r, start_c, end_c = _tile_range(camera_offset)
+    ox, oy = camera_offset.x, camera_offset.y
+    cache = _image_cache
+    n = MEGACHUNK_TILES
+    span = n * TILE_SIZE
+    chunk_rows = range((start_r - 1) // n, (end_r - 1) // n + 1)
+    chunk_cols = range((start_c - 1) // n, (end_c - 1) // n + 1)
+
+    pinned = {_chunk_key(cr, cc) for cr in chunk_rows for cc in chunk_cols}
+    if streaming:
+        pinned.update(paths[r][c] for r in range(start_r, end_r + 1) for c in range(start_c, end_c + 1))
+        STREAMER.pump(pinned)
+
+    # 1) 청크 준비(캐시 → 없으면 합성)
+    builds = MEGACHUNK_BUILDS_PER_FRAME
+    plan = []
+    for cr in chunk_rows:
+        for cc in chunk_cols:
+            key = _chunk_key(cr, cc)
+            img = cache.get(key)
+            if img is not None:
+                cache.move_to_end(key)
+                tile_stats["hits"] += 1
+            elif builds > 0:
+                img = _build_chunk(cr, cc, paths, streaming, pinned)
+                if img is not None:
+                    builds -= 1
+            plan.append((cr, cc, img))
+
+    # 화면이 월드 안이고 청크가 전부 있으면 청크가 화면을 다 덮음 → fill 생략
+    inside = ox <= 0 and oy <= 0 and -ox + SCREEN_W <= WORLD_W and -oy + SCREEN_H <= WORLD_H
+    if not inside or any(img is None for _, _, img in plan):
+        surf.fill(BG_CLEAR_COLOR)
+
+    # 2) 그리기
+    blits = 0
+    for cr, cc, img in plan:
+        if img is not None:
+            surf.blit(img, (cc * span + ox, cr * span + oy))
+            blits += 1
+            continue
+        rows, cols = _chunk_cells(cr, cc)
+        for r in rows:
+            if r < start_r or r > end_r:
                 continue
-            world_x = (c - 1) * TILE_SIZE
-            world_y = (r - 1) * TILE_SIZE
-            surf.blit(img, V2(world_x, world_y) + camera_offset)
+            for c in cols:
+                if c < start_c or c > end_c:
+                    continue
+                path = paths[r][c]
+                world_x = (c - 1) * TILE_SIZE
+                world_y = (r - 1) * TILE_SIZE
+                if path in cache:
+                    cache.move_to_end(path)
+                    tile = cache[path]
+                elif not streaming:
+                    tile = load_image_cached(path)
+                else:
+                    STREAMER.request(path)
+                    tile_stats["placeholders"] += 1
+                    pygame.draw.rect(surf, TILE_PLACEHOLDER_COLOR, (world_x + ox, world_y + oy, TILE_SIZE, TILE_SIZE))
+                    continue
+                if tile is not None:
+                    surf.blit(tile, (world_x + ox, world_y + oy))
+                    blits += 1
+    tile_stats["blits"] += blits
+
+    # 화면 둘레 미리 요청(보이는 타일 요청 뒤라 워커 큐에서 뒤 순서)
+    # 예산이 화면+둘레를 못 담으면 미리 받은 타일끼리 서로 밀어내므로 생략
+    if streaming and TILE_PREFETCH_RING > 0:
+        pr0, pr1, pc0, pc1 = _tile_range(camera_offset, TILE_PREFETCH_RING)
+        need = (pr1 - pr0 + 1) * (pc1 - pc0 + 1) * TILE_SIZE * TILE_SIZE * 4
+        if need <= TILE_CACHE_MB * 1024 * 1024:
+            for r in range(pr0, pr1 + 1):
+                for c in range(pc0, pc1 + 1):
+                    if start_r <= r <= end_r and start_c <= c <= end_c:
+                        continue
+                    path = paths[r][c]
+                    if path not in cache and _chunk_key((r - 1) // n, (c - 1) // n) not in cache:
+                        STREAMER.request(path)
 
     # 월드 외곽 테두리
     rect_screen = pygame.Rect(0, 0, WORLD_W, WORLD_H)
     rect_screen.topleft = camera_offset
     pygame.draw.rect(surf, (50, 58, 70), rect_screen, 1)
 
-def draw_blocks_overlay(surf: pygame.Surface, camera_offset: V2, *, alpha: int = 120) -> None:
-    """에디터: 화면에 보이는 블록(벽)만 붉은 반투명으로 오버레이."""
-    view = pygame.Rect(-camera_offset.x, -camera_offset.y, SCREEN_W, SCREEN_H)
-    overlay = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
+def invalidate_blocks_overlay(bx: Optional[int] = None, by: Optional[int] = None) -> None:
+    """벽 오버레이 캐시 무효화. (bx, by)를 주면 그 블록이 든 청크만, 없으면 전부(BLOCKS를 직접 바꿨을 때)."""
+    if bx is None or by is None:
+        _block_chunks.clear()
+        return
+    per = max(1, BLOCK_OVERLAY_CHUNK // BLOCK_SIZE)
+    _block_chunks.pop((bx // per, by // per), None)
+
+def _build_block_chunk(cx: int, cy: int, alpha: int) -> Optional[pygame.Surface]:
+    """청크 하나의 블록을 월드 좌표 기준 surface에 그림. 블록이 없으면 None(blit 생략)."""
+    per = max(1, BLOCK_OVERLAY_CHUNK // BLOCK_SIZE)
+    bx_end = min(int(WORLD_W // BLOCK_SIZE), cx * per + per - 1)
+    by_end = min(int(WORLD_H // BLOCK_SIZE), cy * per + per - 1)
+    cells = [(bx, by) for by in range(cy * per, by_end + 1) for bx in range(cx * per, bx_end + 1)
+             if (bx, by) in BLOCKS]
+    if not cells:
+        return None
     color_fill = (220, 60, 60, alpha)
     color_line = (240, 90, 90)
+    chunk = pygame.Surface((per * BLOCK_SIZE, per * BLOCK_SIZE), pygame.SRCALPHA)
+    for bx, by in cells:
+        rect = pygame.Rect((bx - cx * per) * BLOCK_SIZE, (by - cy * per) * BLOCK_SIZE, BLOCK_SIZE, BLOCK_SIZE)
+        pygame.draw.rect(chunk, color_fill, rect)
+        pygame.draw.rect(chunk, color_line, rect, 1)
+    return chunk
 
-    bx0 = max(0, int(view.left  // BLOCK_SIZE))
-    by0 = max(0, int(view.top   // BLOCK_SIZE))
-    bx1 = min(int(WORLD_W // BLOCK_SIZE), int(view.right  // BLOCK_SIZE))
-    by1 = min(int(WORLD_H // BLOCK_SIZE), int(view.bottom // BLOCK_SIZE))
-
-    for by in range(by0, by1 + 1):
-        for bx in range(bx0, bx1 + 1):
-            if (bx, by) in BLOCKS:
-                rx = bx * BLOCK_SIZE + camera_offset.x
-                ry = by * BLOCK_SIZE + camera_offset.y
-                rect = pygame.Rect(rx, ry, BLOCK_SIZE, BLOCK_SIZE)
-                pygame.draw.rect(overlay, color_fill, rect)
-                pygame.draw.rect(overlay, color_line, rect, 1)
-
-    surf.blit(overlay, (0, 0))
+def draw_blocks_overlay(surf: pygame.Surface, camera_offset: V2, *, alpha: int = 120) -> None:
+    """
+    에디터: 화면에 보이는 블록(벽)만 붉은 반투명으로 오버레이.
+    블록은 BLOCK_OVERLAY_CHUNK px 청크 surface로 캐시 → 프레임당 보이는 청크 수만큼 blit
+    (블록 없는 청크는 blit도 없음). 청크는 처음 보일 때/무효화된 뒤에만 다시 그린다.
+    """
+    global _block_chunk_alpha
+    if alpha != _block_chunk_alpha:
+        _block_chunks.clear()
+        _block_chunk_alpha = alpha
+
+    span = max(1, BLOCK_OVERLAY_CHUNK // BLOCK_SIZE) * BLOCK_SIZE
+    left, top = -camera_offset.x, -camera_offset.y
+    cx0 = max(0, int(left // span))
+    cy0 = max(0, int(top // span))
+    cx1 = min(int(WORLD_W // span), int((left + SCREEN_W) // span))
+    cy1 = min(int(WORLD_H // span), int((top + SCREEN_H) // span))
+
+    ox, oy = camera_offset.x, camera_offset.y
+    for cy in range(cy0, cy1 + 1):
+        for cx in range(cx0, cx1 + 1):
+            key = (cx, cy)
+            if key in _block_chunks:
+                chunk = _block_chunks[key]
+            else:
+                chunk = _block_chunks[key] = _build_block_chunk(cx, cy, alpha)
+            if chunk is not None:
+                surf.blit(chunk, (cx * span + ox, cy * span + oy))
 
 
 # ============================================================================
@@ -372,3 +840,102 @@ def collides_circle(pos: V2, radius: float) -> bool:
                 if _circle_rect_intersect(pos.x, pos.y, radius, rx, ry, BLOCK_SIZE, BLOCK_SIZE):
                     return True
     return False
+
+
+# ============================================================================
+# 9) 벤치마크: python map_system.py
+#    임시 폴더에 MAP_ROWS x MAP_COLS 타일(PNG) 생성 → 카메라가 맵을 대각선으로 훑으며
+#    동기 로드 vs 스트리밍: 프레임 최악 시간 / 자리표시 프레임 수 / 캐시 메모리
+# ============================================================================
+def _bench(frames: int = 240):
+    import time
+    import tempfile
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_W, SCREEN_H))
+    global ACTIVE_TILE_FOLDER
+    tmp = tempfile.mkdtemp(prefix="tiles_")
+    src = pygame.Surface((512, 512))
+    for r in range(1, MAP_ROWS + 1):
+        for c in range(1, MAP_COLS + 1):
+            src.fill(((r * 20) % 256, (c * 20) % 256, 120))
+            pygame.draw.circle(src, (240, 240, 240), (256, 256), 200, 8)
+            pygame.image.save(src, os.path.join(tmp, f"{r}-{c}.png"))
+    ACTIVE_TILE_FOLDER = tmp
+
+    def run(streaming: bool):
+        clear_image_cache()
+        for k in tile_stats:
+            tile_stats[k] = 0
+        worst = 0.0
+        t_all = time.perf_counter()
+        for f in range(frames):
+            t = f / (frames - 1)
+            cam = V2(-t * (WORLD_W - SCREEN_W), -t * (WORLD_H - SCREEN_H))
+            t0 = time.perf_counter()
+            draw_background(screen, cam, streaming=streaming)
+            worst = max(worst, time.perf_counter() - t0)
+            time.sleep(1 / 240)   # 워커가 돌 시간(실제 게임의 프레임 대기)
+        avg = ((time.perf_counter() - t_all) / frames - 1 / 240) * 1000
+        STREAMER.wait()
+        mode = "streaming" if streaming else "sync     "
+        print(f"[map_system] {mode}: avg {avg:.2f}ms worst {worst * 1000:.2f}ms | "
+              f"placeholders {tile_stats['placeholders']} decoded {tile_stats['decoded']} "
+              f"evicted {tile_stats['evicted']} | cache {cache_bytes() / 2**20:.1f}MB "
+              f"(budget {TILE_CACHE_MB}MB)")
+
+    run(False)
+    run(True)
+
+    # 정지 화면 비용: 메가청크 크기별 프레임 시간 / blit 수
+    global MEGACHUNK_TILES
+    cam = V2(-TILE_SIZE * 1.5, -TILE_SIZE * 1.5)
+    for n in (1, 2, 4):
+        MEGACHUNK_TILES = n
+        clear_image_cache()
+        invalidate_tile_paths()
+        for _ in range(8):
+            draw_background(screen, cam, streaming=False)
+        tile_stats["blits"] = 0
+        t0 = time.perf_counter()
+        for _ in range(300):
+            draw_background(screen, cam, streaming=False)
+        ms = (time.perf_counter() - t0) / 300 * 1000
+        print(f"[map_system] steady megachunk {n}x{n}: {ms:.3f}ms/frame, {tile_stats['blits'] / 300:.1f} blits/frame")
+
+    # 에디터 수정: 바뀐 칸의 청크만 다시 합성
+    built = tile_stats["chunks_built"]
+    set_tile_override(3, 3, os.path.join(tmp, "1-1.png"))
+    draw_background(screen, cam, streaming=False)
+    print(f"[map_system] override edit -> chunks rebuilt: {tile_stats['chunks_built'] - built}")
+
+    # 벽 오버레이: 첫 프레임(청크 생성 = 예전의 매 프레임 비용 수준) vs 캐시된 프레임, 토글 뒤
+    import random
+    rng = random.Random(5)
+    BLOCKS.clear()
+    for _ in range(1500):
+        BLOCKS.add((rng.randrange(WORLD_W // BLOCK_SIZE), rng.randrange(WORLD_H // BLOCK_SIZE)))
+    invalidate_blocks_overlay()
+    t0 = time.perf_counter()
+    draw_blocks_overlay(screen, cam)
+    cold = (time.perf_counter() - t0) * 1000
+    t0 = time.perf_counter()
+    for _ in range(300):
+        draw_blocks_overlay(screen, cam)
+    warm = (time.perf_counter() - t0) / 300 * 1000
+    toggle_block_at_world(V2(-cam.x + 40, -cam.y + 40))
+    t0 = time.perf_counter()
+    draw_blocks_overlay(screen, cam)
+    edit = (time.perf_counter() - t0) * 1000
+    print(f"[map_system] blocks overlay ({len(BLOCKS)} blocks): cold {cold:.2f}ms | cached {warm:.3f}ms/frame | "
+          f"after toggle {edit:.2f}ms | chunks cached {len(_block_chunks)}")
+    STREAMER.shutdown()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    import sys
+    if len(sys.argv) > 1:
+        TILE_CACHE_MB = float(sys.argv[1])   # 예산 줄여서 해제 동작 확인: python map_system.py 4
+    _bench()
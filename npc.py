@@ -4,7 +4,9 @@
 # 방문횟수별 대사 + 선택지 지원.
 #
 # 핵심 기능
-# 1) DIALOGUE_DB에서 npc_id로 대사 로드
+# 1) dialogue_db에서 npc_id의 대사만 로드(dialogue/*.json)
+#    → dialogue_graph로 한 번 컴파일(정수 노드 id, 전이는 배열)
+#    → 노드/규칙 조건은 flags.STORE 플래그로 판정(플래그가 바뀔 때만 재계산)
 # 2) 방문 1~4: 순서대로
 # 3) 방문 5 이상: 3~4 세트 중 랜덤 (존재할 때)
 # 4) 대사 노드가 dict면 선택지 처리
@@ -21,83 +23,39 @@
 # ---------------------------------------------------------
 
 from __future__ import annotations
-import random
 from code import interact
 from key import INTERACT_NAME
 import pygame
 from pygame.math import Vector2 as V2
 import settings as S
 import key as K   # ✅ 추가
-
-
-def _sysfont(name, size):
-    try:
-        return pygame.font.SysFont(name, size)
-    except Exception:
-        return pygame.font.SysFont(None, size)
-
-
-def _wrap_text(text, font, max_w):
-    # 안전한 문자열 처리
-    s = "" if text is None else str(text)
-    words = s.split(" ")
-    lines, cur = [], ""
-    for w in words:
-        test = (cur + " " + w).strip()
-        if font.size(test)[0] <= max_w or not cur:
-            cur = test
-        else:
-            lines.append(cur)
-            cur = w
-    if cur:
-        lines.append(cur)
-    return lines
+import quality as Q
+from anim import Animator
+from textlayout import wrap
+import dialogue_db
+from dialogue_graph import graph_for
+import flags
+import fonts
+from glyphatlas import render_text, warmup
 
 
 # ---------------------------------------------------------
-# NPC 대사 DB
+# NPC 대사 DB: dialogue/ 폴더의 외부 파일(dialogue_db.py, 지연 로딩)
+# DIALOGUE_DB는 예전 이름 호환용(get/keys/[] 지원)
 # ---------------------------------------------------------
-DIALOGUE_DB = {
-    "워니": {
-        "lines_by_visit": [
-            [
-                "안녕 오늘도 하루가 시작됐네",
-                "진짜 오늘도 일가고 내일도 일가고",
-                {
-                    "text": "주 100시간제가 도입된대…",
-                    "choices": [
-                        {"label": "헉… 괜찮아?", "next": ["괜찮진 않은데 버텨야지…"]},
-                        {"label": "그만둬!", "next": ["그건… 현실적으로 쉽지 않다…"]},
-                    ],
-                },
-            ],
-            ["왜 뭐 할말 있어??"],
-            ["음 이제 말 그만 걸어줄레??"],
-            ["나 이제 일 가야해"],
-        ]
-    },
-
-    "상미니": {
-        "lines_by_visit": [
-            ["원희야", "그림", "화이팅이다"],
-            [
-                {
-                    "text": "퀄리티 기대 할께!",
-                    "choices": [
-                        {"label": "고마워!", "next": ["기대는 좋은 힘이지 ㅎㅎ"]},
-                        {"label": "부담돼…", "next": ["부담 느끼지 말고 너 페이스로!"]},
-                    ],
-                }
-            ],
-            ["음 이제 말 그만 걸어줄레??"],
-            ["아 좀 가라고;;"],
-        ]
-    },
-}
-
+DIALOGUE_DB = dialogue_db.DB
 
 class NPC:
-    def __init__(self, npc_id: str, world_x: int, level, sprite_path=None):
+    # __slots__: 인스턴스 __dict__ 없이(NPC가 많아도 메모리/속성 접근 비용 작게)
+    __slots__ = (
+        "npc_id", "name", "w", "h", "pos",
+        "graph", "node", "visit_count", "talk_active",
+        "range", "font", "big",
+        "sprite", "_scaled_sprites", "anim",
+        "_choice_rects", "_rect", "_dialog_cache", "_hint_img", "route",
+    )
+
+    def __init__(self, npc_id: str, world_x: int, level, sprite_path=None, sheet=None, route=None):
         self.npc_id = npc_id
         self.name = npc_id
 
@@ -114,19 +72,21 @@ class NPC:
 
         self.pos = V2(world_x, base_y - self.h)
 
-        cfg = DIALOGUE_DB.get(npc_id, {})
-        self.lines_by_visit = cfg.get("lines_by_visit", [["..."]])
-
-        self.active_lines = []
+        # 컴파일된 대사 그래프(같은 npc_id끼리 공유) + 현재 노드 id(-1 = 대화 없음)
+        self.graph = graph_for(npc_id)
+        self.node = -1
         self.visit_count = 0
-        self._idx = 0
         self.talk_active = False
 
         # 근접 범위(px)
         self.range = 90
 
-        self.font = _sysfont(getattr(S, "FONT_NAME", None), 18)
-        self.big = _sysfont(getattr(S, "FONT_NAME", None), 22)
+        # 공유 폰트(fonts 레지스트리): 워프로 NPC를 다시 만들어도 SysFont 스캔/생성 없음
+        self.font = fonts.get(18)
+        self.big = fonts.get(22)
+        # 글리프 아틀라스(GLYPH_ATLAS=True일 때): 대사 본문/제목 색만 미리, 나머지는 쓰일 때 추가
+        warmup(self.font, (235, 235, 240))
+        warmup(self.big, (250, 230, 170))
 
         # 스프라이트
         self.sprite = None
@@ -136,142 +96,158 @@ class NPC:
                 self.sprite = pygame.transform.smoothscale(img, (self.w, self.h))
             except Exception:
                 self.sprite = None
+        self._scaled_sprites = {}
+
+        # 스프라이트 시트 애니메이션(anim.py SHEETS 키). 프레임은 같은 시트 NPC끼리 공유
+        self.anim = None
+        if sheet:
+            try:
+                self.anim = Animator(sheet, (self.w, self.h))
+            except Exception as e:
+                print(f"[npc] sheet load error ({sheet}):", e)
+                self.anim = None
 
         # 선택지 버튼(rect, choice_dict) 저장용
         self._choice_rects = []
 
+        # 대화창 캐시: _dialog_key → (합성 surface, 선택지 rect 목록)
+        self._dialog_cache = {}
+        self._hint_img = None
+
+        self._rect = pygame.Rect(int(self.pos.x), int(self.pos.y), self.w, self.h)
+
+        # 순찰 일정(worldsim.Route, 없으면 제자리). 씬이 언로드되면 worldsim이 같은 규칙으로 이어서 진행
+        self.route = route
+
     @property
     def rect(self):
-        return pygame.Rect(int(self.pos.x), int(self.pos.y), self.w, self.h)
+        """캐시 Rect: 위치가 바뀐 경우에만 갱신(수정하지 말 것)."""
+        r = self._rect
+        x, y = int(self.pos.x), int(self.pos.y)
+        if r.x != x or r.y != y:
+            r.x, r.y = x, y
+        return r
 
     # ---------------------------
-    # 방문 횟수별 세트 선택
+    # 대화 진행(노드 id 전이만, 구조 검사는 컴파일 때 끝남)
     # ---------------------------
-    def _select_lines_for_visit(self, visit: int):
-        sets = self.lines_by_visit or [["..."]]
-
-        # 5 이상일 때 3~4번 중 랜덤(존재할 때)
-        if visit >= 5 and len(sets) >= 4:
-            return list(random.choice([sets[2], sets[3]]))
-
-        idx = min(max(visit - 1, 0), len(sets) - 1)
-        return list(sets[idx])
-
     def _start_conversation(self):
         self.visit_count += 1
-        self.active_lines = self._select_lines_for_visit(self.visit_count) or ["..."]
-        self._idx = 0
-        self.talk_active = True
-
-    def _current_node(self):
-        if not self.active_lines:
-            return "..."
-        return self.active_lines[min(self._idx, len(self.active_lines) - 1)]
-
-    # ---------------------------
-    # 선택지 적용
-    # ---------------------------
-    def _apply_choice(self, choice: dict):
-        if not isinstance(choice, dict):
+        flags.STORE.add(f"talks:{self.npc_id}")
+        self._goto(self.graph.entry_for_visit(self.visit_count))
+
+    def _goto(self, n: int):
+        """n으로 이동(조건이 거짓인 노드는 건너뜀). 갈 곳이 없으면(-1) 대화 종료."""
+        g = self.graph
+        n = g.resolve(n)
+        if n < 0:
             self.talk_active = False
             return
+        self.node = n
+        self.talk_active = True
+        if g.node_set[n]:
+            flags.STORE.update(g.node_set[n])
 
-        nxt = choice.get("next")
-
-        # next가 리스트면 그걸 새 대사 세트로
-        if isinstance(nxt, list) and nxt:
-            self.active_lines = list(nxt)
-            self._idx = 0
-            self.talk_active = True
-            return
-
-        # next가 문자열이면 한 줄짜리 응답
-        if isinstance(nxt, str) and nxt:
-            self.active_lines = [nxt]
-            self._idx = 0
-            self.talk_active = True
-            return
-
-        # next가 없으면 대화 종료
-        self.talk_active = False
+    def _apply_choice(self, cid: int):
+        self._goto(self.graph.choice_target[cid])
 
     # ---------------------------
     # 2D 거리 기반 근접 판정
     # ---------------------------
     def _is_near(self, player_rect: pygame.Rect) -> bool:
-        dx = player_rect.centerx - self.rect.centerx
-        dy = player_rect.centery - self.rect.centery
-        return (dx * dx + dy * dy) ** 0.5 <= self.range
+        r = self.rect
+        dx = player_rect.centerx - r.centerx
+        dy = player_rect.centery - r.centery
+        return dx * dx + dy * dy <= self.range * self.range
 
     # ---------------------------
     # 업데이트(입력 처리)
     # ---------------------------
     def update(self, player_rect: pygame.Rect, events):
         near = self._is_near(player_rect)
-        node = self._current_node()
-
-        # 현재 노드에 선택지가 있는지
-        has_choices = isinstance(node, dict) and isinstance(node.get("choices", None), list) and len(node.get("choices")) > 0
+        g = self.graph
 
         for e in events:
+            # 마우스 선택지 클릭(버튼 rect는 draw_dialog가 화면 좌표로 저장)
+            if e.type == pygame.MOUSEBUTTONDOWN:
+                if e.button == 1 and self.talk_active and g.has_choices[self.node]:
+                    for r, cid in self._choice_rects:
+                        if r.collidepoint(e.pos):
+                            self._apply_choice(cid)
+                            break
+                continue
+
             if e.type != pygame.KEYDOWN:
-                # 아래 로직은 키 입력만 처리
                 continue
 
-            # 1) 대화 시작: F (INTERACT)
+            # 1) 대화 시작: F (INTERACT). 이미 대화 중이면 무시
             if e.key == K.INTERACT and near:
                 if not self.talk_active:
                     self._start_conversation()
-                    node = self._current_node()
-                    has_choices = isinstance(node, dict) and isinstance(node.get("choices", None), list) and len(
-                        node.get("choices")) > 0
-                # 이미 대화 중일 때 F는 무시
                 continue
 
-            # 2) 대화 진행: SPACE (CONTINUE_TALK)
-            if e.key == K.CONTINUE_TALK and self.talk_active:
-                # 선택지가 있는 노드에서는 SPACE로 넘기지 않음
-                if has_choices:
-                    continue
-                self._idx += 1
-                if self._idx >= len(self.active_lines):
-                    self.talk_active = False
+            if not self.talk_active:
                 continue
 
-            # 3) 선택지 키보드 1~9
-            if self.talk_active and has_choices and (pygame.K_1 <= e.key <= pygame.K_9):
-                ci = e.key - pygame.K_1
-                choices = node.get("choices", [])
-                if 0 <= ci < len(choices):
-                    self._apply_choice(choices[ci])
-                    node = self._current_node()
+            # 2) 대화 진행: SPACE (CONTINUE_TALK). 선택지 노드에서는 넘기지 않음
+            if e.key == K.CONTINUE_TALK:
+                if not g.has_choices[self.node]:
+                    self._goto(g.nxt[self.node])
                 continue
 
-            # 키보드 선택지 1~9
-            if e.type == pygame.KEYDOWN and self.talk_active and has_choices:
-                if pygame.K_1 <= e.key <= pygame.K_9:
-                    ci = e.key - pygame.K_1
-                    choices = node.get("choices", [])
-                    if 0 <= ci < len(choices):
-                        self._apply_choice(choices[ci])
-                        node = self._current_node()
-
-            # 마우스 선택지 클릭
-            if e.type == pygame.MOUSEBUTTONDOWN and e.button == 1 and self.talk_active and has_choices:
-                mx, my = e.pos
-                for r, choice in self._choice_rects:
-                    if r.collidepoint(mx, my):
-                        self._apply_choice(choice)
-                        break
+            # 3) 선택지 키보드 1~9
+            if g.has_choices[self.node] and pygame.K_1 <= e.key <= pygame.K_9:
+                cs = g.choices[self.node]
+                ci = e.key - pygame.K_1
+                if ci < len(cs):
+                    self._apply_choice(cs[ci])
 
         return near
 
     # ---------------------------
     # 그리기(사이드 기준)
     # ---------------------------
-    def draw(self, surf, camera_x: float):
-        sx = int(self.pos.x - camera_x)
-        sy = int(self.pos.y)
+    def animate(self, dt: float):
+        """대화 상태와 무관하게 idle 클립 타이머만 진행."""
+        if self.anim:
+            self.anim.play("idle")
+            self.anim.update(dt)
+
+    def walk(self, dt: float, level=None):
+        """순찰 일정대로 x 이동 + 발밑 지면에 맞춤(대화/근접 중에는 Game이 호출 안 함)."""
+        r = self.route
+        if r is None:
+            return
+        x = r.step(self.pos.x, dt)
+        if x != self.pos.x:
+            self.pos.x = x
+            if level is not None and hasattr(level, "get_support_y"):
+                self.pos.y = level.get_support_y(int(x)) - self.h
+
+    def draw(self, surf, camera_x: float, scale: float = 1.0):
+        sx = int((self.pos.x - camera_x) * scale)
+        sy = int(self.pos.y * scale)
+
+        if self.anim:
+            facing = self.route.dir if self.route is not None else 1
+            surf.blit(self.anim.image(facing, scale), (sx, sy))
+            if scale == 1.0:
+                self.draw_name(surf, camera_x)
+            return
+
+        if scale != 1.0:
+            # 내부 해상도 렌더: 몸체만 축소해서 그리고,
+            # 이름표는 원래 해상도 화면에 draw_name으로 따로 그린다.
+            body = pygame.Rect(sx, sy, int(self.w * scale), int(self.h * scale))
+            if self.sprite:
+                img = self._scaled_sprites.get(scale)
+                if img is None:
+                    img = pygame.transform.smoothscale(self.sprite, body.size)
+                    self._scaled_sprites[scale] = img
+                surf.blit(img, body.topleft)
+            else:
+                pygame.draw.rect(surf, (210, 120, 120), body, border_radius=max(1, int(6 * scale)))
+            return
 
         if self.sprite:
             surf.blit(self.sprite, (sx, sy))
@@ -279,82 +255,69 @@ class NPC:
             body = pygame.Rect(sx, sy, self.w, self.h)
             pygame.draw.rect(surf, (210, 120, 120), body, border_radius=6)
 
+        self.draw_name(surf, camera_x)
+
+    def draw_name(self, surf, camera_x: float):
+        sx = int(self.pos.x - camera_x)
+        sy = int(self.pos.y)
+
         # 이름표
-        name_img = self.big.render(self.name, True, (40, 30, 35))
-        box = pygame.Surface((name_img.get_width() + 10, name_img.get_height() + 4), pygame.SRCALPHA)
-        box.fill((255, 255, 255, 160))
-        surf.blit(box, (sx + self.w // 2 - box.get_width() // 2, sy - box.get_height() - 6))
-        surf.blit(name_img, (sx + self.w // 2 - name_img.get_width() // 2, sy - box.get_height() - 4))
+        name_img = render_text(self.big, self.name, (40, 30, 35))
+        box_w, box_h = name_img.get_width() + 10, name_img.get_height() + 4
+        if Q.current().name_tag_bg:
+            Q.draw_panel(surf, (sx + self.w // 2 - box_w // 2, sy - box_h - 6, box_w, box_h), (255, 255, 255, 160))
+        surf.blit(name_img, (sx + self.w // 2 - name_img.get_width() // 2, sy - box_h - 4))
 
     # ---------------------------
     # 대화 UI (화면 고정)
     # - camera_x는 힌트 위치 계산용
+    # - 대화창은 (노드, 제목, 화면 크기, 화질) 단위로 한 번만 합성해서 캐시.
+    #   노드가 바뀔 때만 새로 만들고, 그동안 다음 노드/선택지 결과를
+    #   프레임당 하나씩 미리 만들어 둔다(SPACE로 넘길 때 렌더 스파이크 없음).
     # ---------------------------
-    def draw_dialog(self, surf, camera_x: float, near: bool, screen_w: int, screen_h: int):
-        # 선택지 rect 캐시 초기화
-        self._choice_rects = []
-
-        # 1) 근접 + 미대화 상태면 힌트
-
-        if near and not self.talk_active:
-            hint = self.font.render(f"{INTERACT_NAME}: 대화하기", True, (30, 30, 40))
-            box = pygame.Surface((hint.get_width() + 10, hint.get_height() + 6), pygame.SRCALPHA)
-            box.fill((255, 255, 255, 180))
-            sx = int(self.rect.centerx - camera_x) - box.get_width() // 2
-            sy = self.rect.top - 70
-            surf.blit(box, (sx, sy))
-            surf.blit(hint, (sx + 5, sy + 4))
-            return
-
-
-        if not self.talk_active:
-            return
-
-        # 2) 하단 패널
-        box_h = 170
-        panel = pygame.Surface((screen_w, box_h), pygame.SRCALPHA)
-        panel.fill((18, 20, 24, 235))
-        surf.blit(panel, (0, screen_h - box_h))
-
-        title = f"{self.name}  ·  {self.visit_count}번째 만남"
-        name_img = self.big.render(title, True, (250, 230, 170))
-        surf.blit(name_img, (16, screen_h - box_h + 10))
-
-        # 3) 현재 노드 해석 (✅ choices 항상 정의)
-        node = self._current_node()
+    DIALOG_BOX_H = 170
+    DIALOG_CACHE_MAX = 16
+
+    def _dialog_key(self, node, screen_w, screen_h, visit=None):
+        visit = self.visit_count if visit is None else visit
+        return (node, visit, screen_w, screen_h, Q.current().alpha_panels)
+
+    def _compose_dialog(self, node, screen_w, screen_h, visit):
+        """대화창 전체(패널+제목+본문+선택지/힌트)를 surface 하나로 합성."""
+        box_h = self.DIALOG_BOX_H
+        top = screen_h - box_h
+        bg = (18, 20, 24, 235)
+        if Q.current().alpha_panels:
+            box = pygame.Surface((screen_w, box_h), pygame.SRCALPHA)
+            box.fill(bg)
+        else:
+            box = pygame.Surface((screen_w, box_h))
+            box.fill(bg[:3])
 
-        text = "..."
-        choices = []
+        title = f"{self.name}  ·  {visit}번째 만남"
+        box.blit(render_text(self.big, title, (250, 230, 170)), (16, 10))
 
-        if isinstance(node, dict):
-            text = node.get("text", "...")
-            c = node.get("choices", [])
-            choices = c if isinstance(c, list) else []
-        else:
-            text = "" if node is None else str(node)
+        g = self.graph
+        text, choices = g.text[node], g.choices[node]
 
-        # 4) 본문 렌더
-        x0, y0 = 16, screen_h - box_h + 44
+        # 본문
         max_w = screen_w - 32
-        for i, ln in enumerate(_wrap_text(text, self.font, max_w)):
-            line_img = self.font.render(ln, True, (235, 235, 240))
-            surf.blit(line_img, (x0, y0 + i * 22))
+        for i, ln in enumerate(wrap(text, self.font, max_w)):
+            box.blit(render_text(self.font, ln, (235, 235, 240)), (16, 44 + i * 22))
 
-        # 5) 선택지 렌더
+        # 선택지(버튼 rect는 화면 좌표로 같이 저장 → 클릭 판정용)
+        rects = []
         if choices:
             btn_pad_x = 10
             gap = 8
 
             # 아래쪽에서 위로 쌓이게 배치
-            btn_y = screen_h - 36
+            btn_y = box_h - 36
             cur_x = 16
 
-            for i, ch in enumerate(choices):
-                if not isinstance(ch, dict):
-                    continue
-
-                label = ch.get("label", f"선택 {i+1}")
-                txt = self.font.render(f"{i+1}. {label}", True, (30, 30, 40))
+            for i, cid in enumerate(choices):
+                label = g.choice_label[cid]
+                txt = render_text(self.font, f"{i+1}. {label}", (30, 30, 40))
 
                 bw = txt.get_width() + btn_pad_x * 2
                 bh = txt.get_height() + 8
@@ -365,13 +328,63 @@ class NPC:
                     btn_y -= (bh + 6)
 
                 rect_btn = pygame.Rect(cur_x, btn_y, bw, bh)
-                pygame.draw.rect(surf, (245, 245, 250), rect_btn, border_radius=6)
-                pygame.draw.rect(surf, (30, 30, 50), rect_btn, 1, border_radius=6)
-                surf.blit(txt, (rect_btn.x + btn_pad_x, rect_btn.y + 4))
+                pygame.draw.rect(box, (245, 245, 250), rect_btn, border_radius=6)
+                pygame.draw.rect(box, (30, 30, 50), rect_btn, 1, border_radius=6)
+                box.blit(txt, (rect_btn.x + btn_pad_x, rect_btn.y + 4))
 
-                self._choice_rects.append((rect_btn, ch))
+                rects.append((rect_btn.move(0, top), cid))
                 cur_x += bw + gap
-
         else:
-            hint = self.font.render("SPACE: 다음  |  마지막에서 닫힘", True, (200, 200, 210))
-            surf.blit(hint, (screen_w - hint.get_width() - 12, screen_h - hint.get_height() - 8))
+            hint = render_text(self.font, "SPACE: 다음  |  마지막에서 닫힘", (200, 200, 210))
+            box.blit(hint, (screen_w - hint.get_width() - 12, box_h - hint.get_height() - 8))
+
+        return box, rects
+
+    def _dialog_entry(self, node, screen_w, screen_h, visit=None):
+        visit = self.visit_count if visit is None else visit
+        key = self._dialog_key(node, screen_w, screen_h, visit)
+        entry = self._dialog_cache.get(key)
+        if entry is None:
+            entry = self._compose_dialog(node, screen_w, screen_h, visit)
+            if len(self._dialog_cache) >= self.DIALOG_CACHE_MAX:
+                self._dialog_cache.pop(next(iter(self._dialog_cache)))
+            self._dialog_cache[key] = entry
+        return entry
+
+    def _prefetch_one(self, nodes, screen_w, screen_h, visit=None) -> None:
+        """아직 캐시에 없는 노드를 프레임당 최대 1개만 합성."""
+        for nxt in nodes:
+            if nxt < 0:
+                continue
+            if self._dialog_key(nxt, screen_w, screen_h, visit) not in self._dialog_cache:
+                self._dialog_entry(nxt, screen_w, screen_h, visit)
+                return
+
+    def draw_dialog(self, surf, camera_x: float, near: bool, screen_w: int, screen_h: int):
+        # 1) 근접 + 미대화 상태면 힌트
+        if near and not self.talk_active:
+            self._choice_rects = []
+            if self._hint_img is None:
+                self._hint_img = render_text(self.font, f"{INTERACT_NAME}: 대화하기", (30, 30, 40))
+            hint = self._hint_img
+            box_w, box_h = hint.get_width() + 10, hint.get_height() + 6
+            sx = int(self.rect.centerx - camera_x) - box_w // 2
+            sy = self.rect.top - 70
+            Q.draw_panel(surf, (sx, sy, box_w, box_h), (255, 255, 255, 180))
+            surf.blit(hint, (sx + 5, sy + 4))
+            # F로 대화를 시작할 때 첫 화면도 미리 준비
+            v = self.visit_count + 1
+            self._prefetch_one(self.graph.entry_candidates(v), screen_w, screen_h, v)
+            return
+
+        if not self.talk_active:
+            self._choice_rects = []
+            return
+
+        # 2) 현재 노드 대화창(캐시) + 다음 노드 미리 합성
+        node = self.node
+        box, rects = self._dialog_entry(node, screen_w, screen_h)
+        surf.blit(box, (0, screen_h - self.DIALOG_BOX_H))
+        self._choice_rects = rects
+        g = self.graph
+        self._prefetch_one([g.resolve(n) for n in g.successors(node)], screen_w, screen_h)
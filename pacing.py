@@ -0,0 +1,228 @@
+# pacing.py
+# ---------------------------------------------------------
+# 프레임 페이싱(프레임 간격 맞추기) + 지터/입력 지연 통계.
+#
+# clock.tick(S.FPS)는 OS sleep 정밀도에 의존해서 프레임 간격이 들쭉날쭉하고
+# (카지노 카메라 보간이 떨려 보임), 입력 → 화면 표시까지 지연도 늘어난다.
+# 머신마다 제일 나은 방식을 데이터로 고를 수 있게 전략을 선택 가능하게 한다.
+#
+# 전략
+#   - "sleep"  : clock.tick(fps)            (기존 방식, CPU 거의 안 씀)
+#   - "busy"   : clock.tick_busy_loop(fps)  (정확하지만 코어 하나를 태움)
+#   - "hybrid" : 마감 spin_ms 전까지 sleep, 나머지는 perf_counter로 spin
+#   - "vsync"  : set_mode(..., vsync=1) 후 flip이 모니터 주기에 맞춰 대기
+#
+# 통계
+#   - interval : present(flip) 사이 간격(ms) 히스토그램 → 지터 = 목표 간격과의 차이
+#   - latency  : 입력 이벤트 발생 시점 → 그 프레임 present까지(ms) 히스토그램
+#                이벤트에 SDL 시각(timestamp)이 없는 pygame이면 event.get으로 꺼낸 시점부터
+#                (= poll->present, 큐에서 기다린 시간 빠짐)로 재고 보고서에도 그렇게 표시
+#   - work_ms  : tick이 끝난 시점 → present의 flip 직전(ms). tick 대기와 flip(vsync) 대기 제외
+#
+# 사용 예(main):
+#
+#     pacer = FramePacer("hybrid", S.FPS)
+#     screen = pacer.set_mode((S.SCREEN_W, S.SCREEN_H))
+#     while running:
+#         dt = pacer.tick()
+#         events = pygame.event.get()
+#         pacer.mark_input(events)
+#         ...
+#         pacer.present()          # display.flip 포함
+#     pacer.report()
+# ---------------------------------------------------------
+
+from __future__ import annotations
+import json
+import time
+import asyncio
+import pygame
+
+import settings as S
+from frametime import Histogram
+
+STRATEGIES = ("sleep", "busy", "hybrid", "vsync")
+
+# 입력 지연 측정 대상 이벤트
+_INPUT_EVENTS = (pygame.KEYDOWN, pygame.KEYUP, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP)
+
+
+class FramePacer:
+    def __init__(self, strategy: str = "sleep", fps=None, *, spin_ms: float = 2.0):
+        if strategy not in STRATEGIES:
+            raise ValueError(f"[pacing] 알 수 없는 전략: {strategy} (가능: {', '.join(STRATEGIES)})")
+        self.strategy = strategy
+        self.fps = fps or getattr(S, "FPS", 60)
+        self.period = 1.0 / max(1, self.fps)
+        self.spin_ms = spin_ms
+
+        self.clock = pygame.time.Clock()
+        self.work_ms = 0.0           # 대기(tick, flip) 시간을 뺀 직전 프레임 작업 시간
+
+        self._frame_start = None     # 직전 tick이 끝난 시각(perf_counter)
+        self._work_end = None        # 직전 present에서 flip 직전 시각
+        self._deadline = None        # hybrid: 다음 프레임 마감 시각
+        self._last_present = None
+        self._input_t = None         # 이번 프레임 첫 입력 시각(perf_counter 기준)
+        self._input_src = None       # "event"(SDL 이벤트 시각) / "poll"(event.get 시각)
+
+        self.interval = Histogram(bin_ms=1.0, bins=50)
+        self.jitter = Histogram(bin_ms=0.25, bins=40)
+        self.latency = Histogram(bin_ms=1.0, bins=80)
+
+    # ---------------------------------------------------------
+    # 디스플레이
+    # ---------------------------------------------------------
+    def set_mode(self, size, flags: int = 0):
+        """전략에 맞춰 디스플레이 생성. vsync 실패 시 sleep으로 되돌림."""
+        if self.strategy == "vsync":
+            try:
+                # pygame 2: vsync는 SCALED/OPENGL 창에서만 요청 가능
+                return pygame.display.set_mode(size, flags | pygame.SCALED, vsync=1)
+            except pygame.error as e:
+                print(f"[pacing] vsync 사용 불가({e}) → sleep 전략으로 대체")
+                self.strategy = "sleep"
+        return pygame.display.set_mode(size, flags)
+
+    # ---------------------------------------------------------
+    # 프레임 경계
+    # ---------------------------------------------------------
+    def tick(self) -> float:
+        """다음 프레임까지 기다리고 dt(초)를 반환. clock.tick 대체."""
+        now = time.perf_counter()
+        self._update_work_ms()
+
+        if self.strategy == "sleep":
+            ms = self.clock.tick(self.fps)
+        elif self.strategy == "busy":
+            ms = self.clock.tick_busy_loop(self.fps)
+        elif self.strategy == "hybrid":
+            self._wait_hybrid(now)
+            ms = self.clock.tick()
+        else:
+            # vsync: flip이 이미 기다렸으므로 여기선 측정만
+            ms = self.clock.tick()
+            self._check_vsync()
+
+        self._frame_start = time.perf_counter()
+        return ms / 1000.0
+
+    async def tick_async(self) -> float:
+        """
+        asyncio 루프용 tick. 남는 시간을 asyncio.sleep으로 양보해서
+        그 사이 로딩 같은 다른 태스크가 돌 수 있게 한다(전략과 무관하게 마감 기준).
+        """
+        now = time.perf_counter()
+        self._update_work_ms()
+
+        if self._deadline is None or now - self._deadline > self.period:
+            self._deadline = now
+        target = self._deadline + self.period
+        delay = target - now
+        if delay > 0:
+            await asyncio.sleep(delay)
+        self._deadline = target
+        ms = self.clock.tick()
+
+        self._frame_start = time.perf_counter()
+        return ms / 1000.0
+
+    def _update_work_ms(self) -> None:
+        # 직전 프레임: tick 끝 → flip 직전. vsync면 flip이 주기만큼 막히므로 그 뒤 시각을 쓰면 안 됨
+        if self._frame_start is not None and self._work_end is not None and self._work_end >= self._frame_start:
+            self.work_ms = (self._work_end - self._frame_start) * 1000.0
+
+    def _wait_hybrid(self, now: float) -> None:
+        if self._deadline is None or now - self._deadline > self.period:
+            # 첫 프레임 또는 한 프레임 이상 밀림 → 따라잡기 폭주 없이 기준 재설정
+            self._deadline = now
+        target = self._deadline + self.period
+        sleep_s = target - now - self.spin_ms / 1000.0
+        if sleep_s > 0:
+            time.sleep(sleep_s)
+        while time.perf_counter() < target:
+            pass
+        self._deadline = target
+
+    def _check_vsync(self) -> None:
+        """
+        드라이버가 vsync 요청을 조용히 무시하면 제한 없이 돌게 된다.
+        처음 60프레임 간격이 목표보다 확연히 짧으면 hybrid로 전환.
+        """
+        iv = self.interval
+        if iv.n == 60 and iv.mean < self.period * 1000.0 * 0.75:
+            print(f"[pacing] vsync 미적용으로 보임(평균 {iv.mean:.1f}ms) → hybrid 전략으로 대체")
+            self.strategy = "hybrid"
+
+    def mark_input(self, events) -> None:
+        """
+        이번 프레임 첫 입력 이벤트의 발생 시각 기록.
+        이벤트에 timestamp(SDL 이벤트 시각, get_ticks와 같은 ms 시계)가 있으면 그것을
+        perf_counter 기준으로 옮기고, 없으면 지금(event.get으로 꺼낸 시점)을 쓴다.
+        """
+        for e in events:
+            if e.type not in _INPUT_EVENTS:
+                continue
+            now = time.perf_counter()
+            ts = getattr(e, "timestamp", None)
+            if ts is not None:
+                age = max(0.0, (pygame.time.get_ticks() - ts) / 1000.0)
+                self._input_t, self._input_src = now - age, "event"
+            else:
+                self._input_t, self._input_src = now, "poll"
+            return
+
+    def present(self) -> None:
+        """display.flip + 간격/지연 기록. flip 직전까지를 이번 프레임 작업 시간으로."""
+        self._work_end = time.perf_counter()
+        pygame.display.flip()
+        t = time.perf_counter()
+
+        if self._last_present is not None:
+            ms = (t - self._last_present) * 1000.0
+            self.interval.push(ms)
+            self.jitter.push(abs(ms - self.period * 1000.0))
+        self._last_present = t
+
+        if self._input_t is not None:
+            self.latency.push((t - self._input_t) * 1000.0)
+            self._input_t = None
+
+    # ---------------------------------------------------------
+    # 결과
+    # ---------------------------------------------------------
+    def stats(self) -> dict:
+        return {
+            "strategy": self.strategy,
+            "fps": self.fps,
+            "interval_ms": self.interval.to_dict(),
+            "jitter_ms": self.jitter.to_dict(),
+            self._latency_key(): self.latency.to_dict(),
+        }
+
+    def _latency_key(self) -> str:
+        # 이벤트 시각이 없으면 큐 대기가 빠진 값이라 이름부터 다르게
+        return "poll_to_present_ms" if self._input_src == "poll" else "input_latency_ms"
+
+    def report(self, path: str | None = None) -> None:
+        """콘솔 요약 출력 + (path가 있으면) JSON 저장."""
+        iv, jt, lt = self.interval, self.jitter, self.latency
+        print(f"[pacing] strategy={self.strategy} frames={iv.n} target={self.period * 1000.0:.2f}ms")
+        print(f"[pacing] interval mean={iv.mean:.2f} sd={iv.stdev:.2f} p95={iv.percentile(0.95):.1f} max={iv.max:.1f}")
+        print(f"[pacing] jitter   mean={jt.mean:.2f} p95={jt.percentile(0.95):.2f} p99={jt.percentile(0.99):.2f}")
+        if lt.n:
+            if self._input_src == "poll":
+                label, note = "poll->present", " (이벤트 시각 없음: event.get 시점부터, 큐 대기 제외)"
+            else:
+                label, note = "input->present", ""
+            print(f"[pacing] {label} mean={lt.mean:.2f} p95={lt.percentile(0.95):.1f} (n={lt.n}){note}")
+        if iv.n:
+            print(iv.format())
+
+        if path:
+            try:
+                with open(path, "w", encoding="utf-8") as f:
+                    json.dump(self.stats(), f, ensure_ascii=False, indent=2)
+                print(f"[pacing] stats saved -> {path}")
+            except Exception as e:
+                print("[pacing] stats save error:", e)
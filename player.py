@@ -6,6 +6,8 @@ import pygame
 from pygame.math import Vector2 as V2
 import settings as S
 import key as K   # ✅ 추가
+from collision import sweep_x, sweep_y, min_extent, substeps_for
+from anim import Animator
 
 
 class Player:
@@ -13,8 +15,19 @@ class Player:
     mode:
       - "side"    : 사이드뷰 (A/D + 점프)
       - "topdown" : 아이작식 탑다운 (WASD)
+
+    __slots__ 레이아웃: 엔티티 수백 개를 매 프레임 갱신해도
+    인스턴스 __dict__ 없이 속성 접근/메모리가 작게 유지된다.
     """
 
+    __slots__ = (
+        "pos", "vel", "w", "h", "facing", "mode",
+        "top_speed", "accel", "friction", "max_speed",
+        "gravity", "jump_speed", "on_ground",
+        "anim", "_last_x", "_last_y",
+        "sprite", "_scaled_sprites", "_rect",
+    )
+
     def __init__(self, start_pos):
         self.pos = V2(start_pos)
         self.vel = V2(0, 0)
@@ -38,19 +51,42 @@ class Player:
         self.jump_speed = getattr(S, "PLAYER_JUMP_SPEED", 750)  # 점프 초기 속도
         self.on_ground = False                                  # 바닥 접지 여부
 
+        # 스프라이트 시트 애니메이션(anim.py) - 실패하면 단일 사진으로
+        self.anim = None
+        sheet_id = getattr(S, "PLAYER_SHEET", None)
+        if sheet_id:
+            try:
+                self.anim = Animator(sheet_id, (self.w, self.h))
+            except Exception:
+                self.anim = None  # 시트 없음 / 디스플레이 없음(시뮬 프로세스)
+        self._last_x, self._last_y = self.pos.x, self.pos.y
+
         # 플레이어 사진/스프라이트
         self.sprite = None
         sprite_path = getattr(S, "PLAYER_SPRITE", None)
-        if sprite_path:
+        if self.anim:
+            self.sprite = self.anim.image(1)  # 인벤토리 아바타 등 정지 이미지
+        elif sprite_path:
             try:
                 img = pygame.image.load(sprite_path).convert_alpha()
                 self.sprite = pygame.transform.smoothscale(img, (self.w, self.h))
             except Exception:
                 self.sprite = None
+        self._scaled_sprites = {}
+
+        self._rect = pygame.Rect(int(self.pos.x), int(self.pos.y), self.w, self.h)
 
     @property
     def rect(self):
-        return pygame.Rect(int(self.pos.x), int(self.pos.y), self.w, self.h)
+        """
+        위치가 바뀐 경우에만 좌표를 고치는 캐시 Rect(매번 새로 만들지 않음).
+        같은 객체가 계속 돌아오므로 받는 쪽에서 수정하면 안 된다(필요하면 .copy()).
+        """
+        r = self._rect
+        x, y = int(self.pos.x), int(self.pos.y)
+        if r.x != x or r.y != y:
+            r.x, r.y = x, y
+        return r
 
     # ---------------------------------------------------------
     # 탑다운 충돌 이동(축 분리) - 기존 그대로 사용
@@ -142,40 +178,34 @@ class Player:
         # --- 중력 ---
         self.vel.y += self.gravity * dt
 
-        # --- 수평 이동 + 충돌 ---
-        old_x = self.pos.x
-        self.pos.x += self.vel.x * dt
-
-        ww = getattr(level, "world_w", S.SCREEN_W)
-        self.pos.x = max(0, min(ww - self.w, self.pos.x))
-
-        r = self.rect
-        for s in solids:
-            if r.colliderect(s):
-                if self.pos.x > old_x:
-                    self.pos.x = s.left - self.w
-                elif self.pos.x < old_x:
-                    self.pos.x = s.right
-                self.vel.x = 0
-                r = self.rect
-
-        # --- 수직 이동 + 충돌 ---
+        # --- 이동 + 연속 충돌(swept AABB, collision.py) ---
+        # 축별로 이동 경로 전체를 검사하므로 긴 프레임에서도 얇은 물체를 통과하지 않는다.
+        # 이동량이 가장 얇은 물체에 비해 크면 하위 스텝으로 나눠 모서리 오차를 줄인다.
         self.on_ground = False  # 일단 공중으로 보고, 바닥/벽과 닿으면 True로 세팅
-        old_y = self.pos.y
-        self.pos.y += self.vel.y * dt
-        r = self.rect
-
-        # 블록들과 수직 충돌
-        for s in solids:
-            if r.colliderect(s):
-                if self.vel.y > 0:  # 아래로 떨어지는 중(바닥 충돌)
-                    self.pos.y = s.top - self.h
-                    self.vel.y = 0
-                    self.on_ground = True
-                elif self.vel.y < 0:  # 위로 점프 중(천장 충돌)
-                    self.pos.y = s.bottom
-                    self.vel.y = 0
-                r = self.rect
+        ww = getattr(level, "world_w", S.SCREEN_W)
+        smallest = getattr(level, "solid_min_extent", None)
+        if smallest is None:
+            smallest = min_extent(solids)
+        steps = substeps_for(self.vel.x * dt, self.vel.y * dt, smallest) if solids else 1
+        sdt = dt / steps
+
+        for _ in range(steps):
+            # 수평
+            if self.vel.x:
+                nx = max(0, min(ww - self.w, self.pos.x + self.vel.x * sdt))
+                nx, hit = sweep_x(self.pos.x, self.pos.y, self.w, self.h, nx - self.pos.x, solids)
+                self.pos.x = nx
+                if hit:
+                    self.vel.x = 0
+
+            # 수직
+            if self.vel.y:
+                ny, hit = sweep_y(self.pos.x, self.pos.y, self.w, self.h, self.vel.y * sdt, solids)
+                if hit:
+                    if self.vel.y > 0:  # 아래로 떨어지는 중(바닥 충돌)
+                        self.on_ground = True
+                    self.vel.y = 0      # 위로 점프 중이면 천장 충돌
+                self.pos.y = ny
 
         # --- 레벨에서 제공하는 바닥(suface_y) 기준 스냅(플랫 지면용) ---
         if hasattr(level, "surface_y"):
@@ -197,29 +227,65 @@ class Player:
                 self.vel.y = 0
 
     # ---------------------------------------------------------
-    # 그리기
+    # 애니메이션
     # ---------------------------------------------------------
-    def draw(self, surf, camera_x=0.0, camera_y=0.0):
-        x = int(self.pos.x - camera_x)
-        y = int(self.pos.y - camera_y)
+    def animate(self, dt):
+        """물리 이후 호출: 상태(점프/걷기/정지)로 클립을 고르고 타이머 진행."""
+        if not self.anim:
+            return
+        x, y = self.pos.x, self.pos.y
+        moved = abs(x - self._last_x) > 0.1 or abs(y - self._last_y) > 0.1
+        self._last_x, self._last_y = x, y
+        if self.mode == "side" and not self.on_ground:
+            self.anim.play("jump")
+        elif moved:
+            self.anim.play("walk")
+        else:
+            self.anim.play("idle")
+        self.anim.update(dt)
 
-        # 스프라이트가 있으면 사진으로 그리기
-        if self.sprite:
+    # ---------------------------------------------------------
+    # 그리기
+    # ---------------------------------------------------------
+    def _sprite_at(self, scale, facing=1):
+        """
+        배율/방향별 스프라이트(1회 생성 후 캐시).
+        왼쪽 이미지도 미리 만들어 두므로 그리기 중에는 transform이 없다.
+        """
+        key = (scale, facing < 0)
+        img = self._scaled_sprites.get(key)
+        if img is None:
             img = self.sprite
-            if self.facing < 0:
+            if scale != 1.0:
+                size = (max(1, int(self.w * scale)), max(1, int(self.h * scale)))
+                img = pygame.transform.smoothscale(img, size)
+            if facing < 0:
                 img = pygame.transform.flip(img, True, False)
-            surf.blit(img, (x, y))
+            self._scaled_sprites[key] = img
+        return img
+
+    def draw(self, surf, camera_x=0.0, camera_y=0.0, scale=1.0):
+        x = int((self.pos.x - camera_x) * scale)
+        y = int((self.pos.y - camera_y) * scale)
+
+        # 시트 애니메이션 / 사진
+        if self.anim:
+            surf.blit(self.anim.image(self.facing, scale), (x, y))
+            return
+        if self.sprite:
+            surf.blit(self._sprite_at(scale, self.facing), (x, y))
             return
 
         # 스프라이트 없으면 기본 박스 렌더
-        body = pygame.Rect(x, y, self.w, self.h)
-        pygame.draw.rect(surf, (120, 160, 255), body, border_radius=6)
+        w, h = int(self.w * scale), int(self.h * scale)
+        body = pygame.Rect(x, y, w, h)
+        pygame.draw.rect(surf, (120, 160, 255), body, border_radius=max(1, int(6 * scale)))
 
-        eye_x = body.centerx + self.facing * (self.w // 4)
+        eye_x = body.centerx + self.facing * (w // 4)
         pygame.draw.line(
             surf,
             (30, 40, 60),
-            (eye_x, body.centery - 6),
-            (eye_x, body.centery + 6),
+            (eye_x, body.centery - int(6 * scale)),
+            (eye_x, body.centery + int(6 * scale)),
             2,
         )
@@ -0,0 +1,134 @@
+# quality.py
+# ---------------------------------------------------------
+# 화질 단계(tier) + 프레임 시간 기반 자동 조절(governor).
+#
+# 개발 PC에서는 싸지만 키오스크에서는 비싼 효과들을 단계별로 끈다.
+#   - alpha_panels : SRCALPHA 반투명 박스(대화창/힌트/도움말/인벤토리)
+#   - name_tag_bg  : NPC 이름표 배경
+#   - sky_gradient : 하늘 그라데이션(줄 단위 draw.line)
+#   - photos       : 레벨 사진/인벤토리 아바타
+#   - smooth_scale : smoothscale 대신 scale 사용 여부
+#   - camera_lerp  : 카메라 부드러운 보간(끄면 즉시 스냅)
+#
+# 그리는 쪽은 current()로 현재 단계를 읽기만 한다(map_system처럼 모듈 전역 상태).
+# ---------------------------------------------------------
+
+from __future__ import annotations
+import pygame
+
+from frametime import FrameTimeWindow, frame_budget_ms
+
+
+class QualityTier:
+    def __init__(self, name, *, alpha_panels=True, name_tag_bg=True, sky_gradient=True,
+                 photos=True, smooth_scale=True, camera_lerp=True):
+        self.name = name
+        self.alpha_panels = alpha_panels
+        self.name_tag_bg = name_tag_bg
+        self.sky_gradient = sky_gradient
+        self.photos = photos
+        self.smooth_scale = smooth_scale
+        self.camera_lerp = camera_lerp
+
+    def __repr__(self):
+        return f"QualityTier({self.name!r})"
+
+
+# 높은 화질 → 낮은 화질 순서(governor는 이 순서로 내려가고 올라온다)
+TIERS = [
+    QualityTier("high"),
+    QualityTier("medium", smooth_scale=False, name_tag_bg=False),
+    QualityTier("low", smooth_scale=False, name_tag_bg=False,
+                alpha_panels=False, sky_gradient=False),
+    QualityTier("minimal", smooth_scale=False, name_tag_bg=False,
+                alpha_panels=False, sky_gradient=False, photos=False, camera_lerp=False),
+]
+TIER_NAMES = [t.name for t in TIERS]
+
+_current = TIERS[0]
+
+
+def current() -> QualityTier:
+    return _current
+
+
+def set_tier(name: str) -> QualityTier:
+    """이름으로 단계 지정. 모르는 이름이면 ValueError."""
+    global _current
+    for t in TIERS:
+        if t.name == name:
+            _current = t
+            return t
+    raise ValueError(f"[quality] 알 수 없는 단계: {name} (가능: {', '.join(TIER_NAMES)})")
+
+
+# ---------------------------------------------------------
+# 그리기 헬퍼
+# ---------------------------------------------------------
+def draw_panel(surf, rect, rgba):
+    """
+    반투명 박스. alpha_panels가 꺼져 있으면 같은 색 불투명 rect로 대신
+    (SRCALPHA surface 할당 + 알파 블렌딩 생략).
+    """
+    rect = pygame.Rect(rect)
+    if _current.alpha_panels and len(rgba) == 4 and rgba[3] < 255:
+        box = pygame.Surface(rect.size, pygame.SRCALPHA)
+        box.fill(rgba)
+        surf.blit(box, rect.topleft)
+    else:
+        pygame.draw.rect(surf, rgba[:3], rect)
+
+
+def scale(img, size, dest=None):
+    """현재 단계에 맞는 스케일 함수(smoothscale 또는 scale)."""
+    fn = pygame.transform.smoothscale if _current.smooth_scale else pygame.transform.scale
+    if dest is not None:
+        return fn(img, size, dest)
+    return fn(img, size)
+
+
+# ---------------------------------------------------------
+# 자동 조절
+# ---------------------------------------------------------
+class QualityGovernor:
+    """
+    최근 프레임 작업 시간을 S.FPS 예산과 비교해 단계를 오르내린다.
+
+    - 창 평균 > 예산 * high : 한 단계 내림
+    - 창 평균 < 예산 * low  : 한 단계 올림
+    - 변경 후 창을 비워서, 바뀐 단계의 시간이 다시 모일 때까지 기다림
+    - scaler(render_scale.RenderScaler, --dynamic-res와 같이 쓸 때)가 있으면 둘이 같은 신호에
+      동시에 반응해 서로 흔들지 않게 한 쪽만 움직인다:
+      내릴 때는 배율이 바닥(min_scale)까지 내려간 뒤에만, 올릴 때는 배율이 1.0으로 돌아온 뒤에만
+    """
+
+    def __init__(self, *, fps=None, window: int = 60, high: float = 0.95, low: float = 0.5, scaler=None):
+        self.budget = frame_budget_ms(fps)
+        self.window = FrameTimeWindow(window)
+        self.high = high
+        self.low = low
+        self.scaler = scaler
+
+    def update(self, work_ms: float) -> bool:
+        self.window.push(work_ms)
+        if not self.window.full:
+            return False
+
+        i = TIERS.index(_current)
+        mean = self.window.mean
+        sc = self.scaler
+        if mean > self.budget * self.high and i < len(TIERS) - 1:
+            if sc is not None and sc.scale > sc.min_scale:
+                return False   # 동적 해상도가 먼저 내림
+            nxt = TIERS[i + 1]
+        elif mean < self.budget * self.low and i > 0:
+            if sc is not None and sc.scale < 1.0:
+                return False   # 동적 해상도가 먼저 올림
+            nxt = TIERS[i - 1]
+        else:
+            return False
+
+        print(f"[quality] {_current.name} -> {nxt.name} (avg {mean:.1f}ms / {self.budget:.1f}ms)")
+        set_tier(nxt.name)
+        self.window.clear()
+        return True
@@ -0,0 +1,129 @@
+# render_scale.py
+# ---------------------------------------------------------
+# 내부 해상도 렌더 + 동적 해상도 조절.
+#
+# 월드(레벨/게이트/NPC/플레이어)는 SCREEN_W*scale x SCREEN_H*scale 크기의
+# 내부 surface에 그리고, 한 번의 scale 단계로 화면 크기에 맞춰 올린다.
+# 대화창/인벤토리/도움말 같은 UI는 그 뒤에 원래 해상도의 screen에 그린다.
+#
+# pygame.SCALED는 창 전체(UI 포함)를 같은 배율로 늘리기 때문에
+# "UI는 원래 해상도" 조건을 못 지킨다 → 명시적 scale 단계를 사용.
+#
+# 사용 예(main):
+#
+#     scaler = RenderScaler(S.RENDER_SCALE)
+#     dyn = DynamicResolution(scaler) if S.DYNAMIC_RES else None
+#
+#     world = scaler.begin(screen)
+#     level.draw(world, camera_x, scale=scaler.scale)
+#     ...
+#     scaler.present(screen, world)
+#     # 이후 UI는 screen에 직접
+#
+#     dyn.update(pacer.work_ms)
+# ---------------------------------------------------------
+
+from __future__ import annotations
+import pygame
+
+import settings as S
+import quality as Q
+from frametime import FrameTimeWindow, frame_budget_ms
+
+
+def _quantize(scale: float, step: float) -> float:
+    """surface 재할당이 너무 잦지 않게 배율을 step 단위로 맞춘다."""
+    return round(round(scale / step) * step, 4)
+
+
+class RenderScaler:
+    """월드용 내부 surface를 관리하고 화면으로 올려 그린다."""
+
+    def __init__(self, scale: float = 1.0, *, min_scale: float = 0.5, step: float = 0.05,
+                 smooth: bool = True):
+        self.min_scale = min_scale
+        self.step = step
+        self.smooth = smooth
+        self.scale = 1.0
+        self._surfaces: dict[tuple[int, int], pygame.Surface] = {}
+        self.set_scale(scale)
+
+    @property
+    def size(self) -> tuple[int, int]:
+        return (max(1, int(S.SCREEN_W * self.scale)), max(1, int(S.SCREEN_H * self.scale)))
+
+    @property
+    def active(self) -> bool:
+        """scale이 1이면 내부 surface 없이 screen에 바로 그린다."""
+        return self.scale < 1.0
+
+    def steps(self) -> list:
+        """동적 해상도가 갈 수 있는 배율 전부(min_scale ~ 1.0, step 단위). 스프라이트 미리 굽기용."""
+        lo = _quantize(self.min_scale, self.step)
+        n = int(round((1.0 - lo) / self.step))
+        return sorted({_quantize(lo + i * self.step, self.step) for i in range(n + 1)} | {1.0, self.scale})
+
+    def set_scale(self, scale: float) -> bool:
+        """배율 변경. 실제로 바뀌었으면 True."""
+        s = _quantize(max(self.min_scale, min(1.0, scale)), self.step)
+        if s == self.scale:
+            return False
+        self.scale = s
+        return True
+
+    def begin(self, screen: pygame.Surface) -> pygame.Surface:
+        """이번 프레임 월드를 그릴 surface 반환."""
+        if not self.active:
+            return screen
+        size = self.size
+        surf = self._surfaces.get(size)
+        if surf is None:
+            # 같은 배율로 돌아오는 경우가 많아 크기별로 재사용
+            surf = pygame.Surface(size).convert()
+            self._surfaces[size] = surf
+        return surf
+
+    def present(self, screen: pygame.Surface, world: pygame.Surface) -> None:
+        """내부 surface를 screen 크기로 올려 그린다(할당 없이 dest에 직접)."""
+        if world is screen:
+            return
+        if self.smooth and Q.current().smooth_scale:
+            pygame.transform.smoothscale(world, screen.get_size(), screen)
+        else:
+            pygame.transform.scale(world, screen.get_size(), screen)
+
+
+class DynamicResolution:
+    """
+    측정된 프레임 작업 시간으로 RenderScaler.scale을 조절해 S.FPS를 유지.
+
+    - 최근 창 평균이 예산 * high 를 넘으면 한 단계 내림
+    - 예산 * low 아래로 여유가 있으면 한 단계 올림
+    - 변경 후에는 창을 비우고 다시 모일 때까지 기다림(진동 방지)
+    """
+
+    def __init__(self, scaler: RenderScaler, *, fps=None, window: int = 30,
+                 high: float = 0.95, low: float = 0.6):
+        self.scaler = scaler
+        self.budget = frame_budget_ms(fps)
+        self.window = FrameTimeWindow(window)
+        self.high = high
+        self.low = low
+
+    def update(self, work_ms: float) -> bool:
+        """work_ms: 대기(tick, flip) 시간을 뺀 직전 프레임 작업 시간. 배율이 바뀌면 True."""
+        self.window.push(work_ms)
+        if not self.window.full:
+            return False
+
+        mean = self.window.mean
+        changed = False
+        if mean > self.budget * self.high:
+            changed = self.scaler.set_scale(self.scaler.scale - self.scaler.step)
+        elif mean < self.budget * self.low:
+            changed = self.scaler.set_scale(self.scaler.scale + self.scaler.step)
+
+        if changed:
+            self.window.clear()
+            print(f"[render_scale] scale -> {self.scaler.scale:.2f} (avg {mean:.1f}ms / {self.budget:.1f}ms)")
+        return changed
@@ -38,4 +38,65 @@ PLAYER_GRAVITY = 2000       # 숫자 키우면 더 빨리 떨어짐
 PLAYER_JUMP_SPEED = 500     # 숫자 키우면 더 높이 점프
 # settings.py
 
-PLAYER_SPRITE = "assets/characters/player.png"
\ No newline at end of file
+PLAYER_SPRITE = "assets/characters/player.png"
+
+# 내부 해상도 렌더(render_scale.py)
+# - RENDER_SCALE < 1.0 이면 월드를 작은 surface에 그린 뒤 화면 크기로 확대
+# - DYNAMIC_RES = True 면 프레임 시간에 맞춰 배율을 자동 조절(MIN ~ 1.0)
+# - UI(대화/인벤토리/도움말)는 항상 원래 해상도
+RENDER_SCALE = 1.0
+DYNAMIC_RES = False
+DYNAMIC_RES_MIN = 0.5
+
+# 화질 단계(quality.py): high / medium / low / minimal 고정, 또는 "auto"(프레임 시간으로 자동 조절)
+QUALITY = "high"
+
+# 프레임 페이싱(pacing.py): "sleep" / "busy" / "hybrid" / "vsync"
+FRAME_PACING = "sleep"
+
+# asyncio 메인 루프(main.main_async): 씬 로딩 중에도 로딩 화면이 계속 그려짐
+ASYNC_LOOP = False
+
+# 시뮬레이션 프로세스 분리(simproc.py): 물리를 별도 코어에서 SIM_HZ로 실행
+SIM_PROCESS = False
+SIM_HZ = 120
+
+# 스프라이트 시트 애니메이션(anim.py SHEETS 키). 없거나 로드 실패면 PLAYER_SPRITE 사용
+PLAYER_SHEET = "player"
+
+# 글리프 아틀라스 텍스트 렌더(glyphatlas.py): 글자를 (폰트, 색)별 아틀라스에 한 번만 그리고 줄은 blits로 합성
+# 한글 폰트에서 font.render가 병목일 때 켜기. python glyphatlas.py [폰트.ttf] 로 비교 측정
+GLYPH_ATLAS = False
+
+# 대사 DB(dialogue_db.py): dialogue/index.json + NPC/챕터별 json, 최근 읽은 파일만 캐시
+DIALOGUE_DIR = "dialogue"
+DIALOGUE_CACHE_FILES = 8
+
+# 폰트 레지스트리(fonts.py): 찾은 폰트 파일 경로를 저장해 다음 실행에서 시스템 폰트 스캔 생략
+# None이면 저장 안 함
+FONT_CACHE_FILE = "font_cache.json"
+
+# NPC 갱신 LOD(lod.py): near 반경(px) 안은 매 프레임, 화면 안/밖은 주기(프레임)마다
+LOD_NEAR_PX = 240
+LOD_PERIODS = {"screen": 4, "far": 30}
+
+# 언로드된 씬 NPC 간이 시뮬(worldsim.py): NPC 한 명당 초당 진행 횟수
+WORLDSIM_HZ = 4
+
+# 퀵세이브 파일(snapshot.py, F5 저장 / F9 불러오기). 상대 경로면 게임 폴더 기준
+QUICKSAVE_FILE = "quicksave.json"
+# 떠난 씬의 (Level, NPC, 게이트)를 최근 몇 개까지 들고 있을지. 다시 워프하면 build_scene 없이 재사용
+# (0이면 매번 새로 빌드, 상태는 snapshot으로만 복원)
+SCENE_CACHE = 4
+
+# 타일맵(map_system.py) 타일 로딩: 워커 스레드 스트리밍 + 이미지 캐시 메모리 예산(MB)
+TILE_STREAMING = True
+TILE_CACHE_MB = 64
+TILE_PREFETCH_RING = 1
+# 배경 메가청크(타일 N x N을 한 장으로 합성) 한 변 타일 수
+MEGACHUNK_TILES = 2
+# 에디터 벽 오버레이 캐시 청크 한 변(px)
+BLOCK_OVERLAY_CHUNK = 512
+# 구운 타일 아틀라스(tile_atlas.py 출력) 사용 / 위치
+TILE_ATLAS = True
+TILE_ATLAS_DIR = "assets/atlas"
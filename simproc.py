@@ -0,0 +1,301 @@
+# simproc.py
+# ---------------------------------------------------------
+# 시뮬레이션/렌더 프로세스 분리(선택 기능, main --sim-process).
+#
+# 플레이어 물리, NPC 순찰(worldsim.Route), 움직이는 발판(kinematic.Mover)은 별도 프로세스에서
+# 고정 주기(SIM_HZ)로 돌리고, 매 틱 엔티티 상태를 multiprocessing.shared_memory 더블 버퍼에 쓴다.
+# 렌더 프로세스(main)는 가장 최근 스냅샷만 읽어서 그린다.
+# NPC가 대화 중/플레이어 근처라 멈춰야 하는지는 main이 판단해서 hold(인덱스 목록)로 보낸다.
+# 발판은 시뮬 쪽만 진행하고 위치를 스냅샷으로 받는다(두 프로세스가 따로 돌리면 시계가 달라서
+# 그려지는 발판과 플레이어를 태우는 발판이 어긋남).
+# 입력(키 상태 비트마스크)과 씬 명령은 Queue로 시뮬 쪽에 보낸다.
+#
+# 공유 메모리 레이아웃(전부 little-endian)
+#   [0:8]   u64 seq   : 발행 횟수. 읽을 슬롯 = seq % 2
+#   [8:...] 슬롯 0, 슬롯 1
+#   슬롯    = d gen, d count, d movers, 엔티티 * 6d, 발판 * (x, y, 0, 0, 0, 0)
+#             엔티티 0    = 플레이어 (x, y, vx, vy, facing, flags)
+#             엔티티 1..  = NPC(씬 NPC 순서) (x, y, route_wait, 0, route_dir, 0)
+#             (엔티티 + 발판 <= MAX_ENTITIES)
+#
+# 쓰기: (seq + 1) % 2 슬롯에 쓴 뒤 seq += 1
+# 읽기: seq 읽기 → 슬롯 복사 → seq 다시 읽기. 그 사이 한 번이라도 발행됐으면 다시 읽는다.
+#       (s1+1을 발행한 직후 s1+2를 위해 우리가 읽던 슬롯 s1%2를 채우기 시작할 수 있으므로,
+#        seq가 1만 늘어도 찢어진 스냅샷일 수 있음)
+# ---------------------------------------------------------
+
+from __future__ import annotations
+import time
+import queue
+import struct
+import multiprocessing as mp
+from multiprocessing import shared_memory
+
+import pygame
+
+import settings as S
+import key as K
+
+MAX_ENTITIES = 256
+FIELDS = 6                      # x, y, vx, vy, facing, flags
+FLAG_ON_GROUND = 1
+
+_SEQ = struct.Struct("<Q")
+_SLOT_HEAD = struct.Struct("<3d")  # gen, count, movers
+_ENTITY = struct.Struct(f"<{FIELDS}d")
+_SLOT_BYTES = _SLOT_HEAD.size + MAX_ENTITIES * _ENTITY.size
+SHM_BYTES = _SEQ.size + 2 * _SLOT_BYTES
+
+# 키 → 비트(Player.update가 보는 키만)
+_KEY_BITS = (
+    (pygame.K_a, 1),
+    (pygame.K_d, 2),
+    (pygame.K_w, 4),
+    (pygame.K_s, 8),
+    (K.JUMP_SPACE, 16),
+    (K.JUMP_W, 32),
+)
+
+
+def keys_to_mask(keys) -> int:
+    mask = 0
+    for k, bit in _KEY_BITS:
+        if keys[k]:
+            mask |= bit
+    return mask
+
+
+class _MaskKeys:
+    """비트마스크를 pygame.key.get_pressed()처럼 보이게."""
+    def __init__(self, mask: int):
+        self.mask = mask
+
+    def __getitem__(self, k):
+        for kk, bit in _KEY_BITS:
+            if kk == k:
+                return bool(self.mask & bit)
+        return False
+
+
+# ---------------------------------------------------------
+# 더블 버퍼
+# ---------------------------------------------------------
+def _slot_offset(i: int) -> int:
+    return _SEQ.size + i * _SLOT_BYTES
+
+
+def publish(buf, seq: int, gen: int, entities, movers=()) -> int:
+    """entities: [(x, y, vx, vy, facing, flags), ...], movers: [(x, y), ...](발판 순서). 새 seq 반환."""
+    nxt = seq + 1
+    off = _slot_offset(nxt % 2)
+    n = min(len(entities), MAX_ENTITIES)
+    m = min(len(movers), MAX_ENTITIES - n)
+    _SLOT_HEAD.pack_into(buf, off, gen, n, m)
+    off += _SLOT_HEAD.size
+    for i in range(n):
+        _ENTITY.pack_into(buf, off + i * _ENTITY.size, *entities[i])
+    off += n * _ENTITY.size
+    for i in range(m):
+        x, y = movers[i]
+        _ENTITY.pack_into(buf, off + i * _ENTITY.size, x, y, 0.0, 0.0, 0.0, 0.0)
+    _SEQ.pack_into(buf, 0, nxt)
+    return nxt
+
+
+def read_latest(buf, *, retries: int = 4):
+    """(seq, gen, entities, movers). 아직 발행 전이거나 retries번 모두 쓰기와 겹쳤으면 None(다음 프레임에 다시)."""
+    for _ in range(retries):
+        s1 = _SEQ.unpack_from(buf, 0)[0]
+        if s1 == 0:
+            return None
+        off = _slot_offset(s1 % 2)
+        gen, n, m = _SLOT_HEAD.unpack_from(buf, off)
+        off += _SLOT_HEAD.size
+        ents = [_ENTITY.unpack_from(buf, off + i * _ENTITY.size) for i in range(int(n))]
+        off += int(n) * _ENTITY.size
+        movers = [_ENTITY.unpack_from(buf, off + i * _ENTITY.size)[:2] for i in range(int(m))]
+        if _SEQ.unpack_from(buf, 0)[0] == s1:
+            return s1, int(gen), ents, movers
+    return None
+
+
+def npc_spec(n) -> tuple:
+    """NPC → 시뮬 프로세스로 보낼 (x, y, h, route). route = (a, b, speed, dwell, dir, wait) 또는 None."""
+    r = getattr(n, "route", None)
+    route = None if r is None else (r.a, r.b, r.speed, r.dwell, r.dir, r.wait)
+    return (float(n.pos.x), float(n.pos.y), int(n.h), route)
+
+
+# ---------------------------------------------------------
+# 시뮬레이션 프로세스
+# ---------------------------------------------------------
+def _sim_main(shm_name: str, cmd_q, hz: int):
+    # 자식 프로세스: 디스플레이 없이 Level/Player/Route만 사용
+    from level import Level
+    from player import Player
+    from worldsim import Route
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    buf = shm.buf
+    seq = 0
+    gen = 0
+    level = None
+    player = None
+    npcs: list[list] = []       # [x, y, h, Route 또는 None]
+    held = frozenset()          # 멈춘 NPC 인덱스(main이 판단)
+    keys = _MaskKeys(0)
+
+    period = 1.0 / max(1, hz)
+    last = time.perf_counter()
+    try:
+        while True:
+            # 1) 명령/입력 비우기(입력은 최신 것만 의미 있음)
+            while True:
+                try:
+                    cmd = cmd_q.get_nowait()
+                except queue.Empty:
+                    break
+                kind = cmd[0]
+                if kind == "quit":
+                    return
+                if kind == "input":
+                    keys = _MaskKeys(cmd[1])
+                elif kind == "hold":
+                    held = frozenset(cmd[1])
+                elif kind == "scene":
+                    _, gen, map_file, mode, spawn, specs = cmd
+                    level = Level(map_file)
+                    player = Player(spawn)
+                    player.mode = mode
+                    npcs = []
+                    for x, y, h, rt in specs:
+                        r = None
+                        if rt is not None:
+                            r = Route(rt[0], rt[1], rt[2], rt[3])
+                            r.dir, r.wait = rt[4], rt[5]
+                        npcs.append([x, y, h, r])
+                    held = frozenset()
+                    last = time.perf_counter()
+
+            # 2) 고정 주기 물리
+            now = time.perf_counter()
+            dt = min(now - last, 0.1)
+            last = now
+            if player is not None:
+                level.update(dt)
+                level.carry(player)
+                player.update(dt, keys, level)
+                ents = [(player.pos.x, player.pos.y, player.vel.x, player.vel.y, player.facing,
+                         FLAG_ON_GROUND if player.on_ground else 0)]
+                # NPC 순찰(NPC.walk와 같은 규칙: Route.step + 발밑 지면에 맞춤)
+                for i, st in enumerate(npcs):
+                    x, y, h, r = st
+                    if r is None:
+                        ents.append((x, y, 0.0, 0.0, 1, 0))
+                        continue
+                    if i not in held:
+                        nx = r.step(x, dt)
+                        if nx != x:
+                            st[0] = x = nx
+                            st[1] = y = level.get_support_y(int(nx)) - h
+                    ents.append((x, y, r.wait, 0.0, r.dir, 0))
+                seq = publish(buf, seq, gen, ents, [(m.fx, m.fy) for _, m in level.movers])
+
+            spare = period - (time.perf_counter() - now)
+            if spare > 0:
+                time.sleep(spare)
+    finally:
+        del buf
+        shm.close()
+
+
+# ---------------------------------------------------------
+# 렌더 프로세스 쪽 핸들
+# ---------------------------------------------------------
+class SimProcess:
+    """
+    사용 예(main.Game):
+
+        sim = SimProcess()
+        sim.load_scene(level.map_file, player.mode, spawn_pos, npcs)
+        ...
+        sim.send_input(keys_use)
+        sim.hold(held)                  # 대화 중/근처라 멈출 NPC 인덱스
+        sim.apply(player, level, npcs)  # 발판/NPC 위치도(level.update, n.walk는 부르지 않음)
+        ...
+        sim.close()
+    """
+
+    def __init__(self, hz=None):
+        self.hz = hz or getattr(S, "SIM_HZ", 120)
+        self.shm = shared_memory.SharedMemory(create=True, size=SHM_BYTES)
+        _SEQ.pack_into(self.shm.buf, 0, 0)
+        self.cmd_q = mp.Queue()
+        self.proc = mp.Process(target=_sim_main, args=(self.shm.name, self.cmd_q, self.hz), daemon=True)
+        self.proc.start()
+        self.gen = 0
+        self.last_seq = 0
+        self._last_mask = None
+        self._last_hold = None
+        print(f"[simproc] started pid={self.proc.pid} hz={self.hz}")
+
+    def load_scene(self, map_file, mode, spawn, npcs=()):
+        """씬 교체(NPC는 지금 위치/순찰 상태 그대로 넘김). 이전 씬 스냅샷은 gen으로 걸러낸다."""
+        self.gen += 1
+        self._last_hold = None
+        self.cmd_q.put(("scene", self.gen, map_file, mode, tuple(spawn), [npc_spec(n) for n in npcs]))
+
+    def hold(self, indices) -> None:
+        """순찰을 멈출 NPC 인덱스(대화 중/플레이어 근처). 바뀌었을 때만 보냄."""
+        key = tuple(sorted(indices))
+        if key != self._last_hold:
+            self.cmd_q.put(("hold", key))
+            self._last_hold = key
+
+    def send_input(self, keys) -> None:
+        mask = keys_to_mask(keys)
+        if mask != self._last_mask:
+            self.cmd_q.put(("input", mask))
+            self._last_mask = mask
+
+    def read(self):
+        """현재 씬의 최신 (엔티티 목록, 발판 위치 목록). 새 스냅샷이 없으면 None."""
+        snap = read_latest(self.shm.buf)
+        if snap is None:
+            return None
+        seq, gen, ents, movers = snap
+        if gen != self.gen or seq == self.last_seq:
+            return None
+        self.last_seq = seq
+        return ents, movers
+
+    def apply(self, player, level=None, npcs=()) -> bool:
+        """최신 스냅샷을 플레이어(+ level이 있으면 발판 위치, NPC 위치/순찰 상태)에 반영. 반영했으면 True."""
+        snap = self.read()
+        if snap is None or not snap[0]:
+            return False
+        ents, movers = snap
+        if level is not None:
+            level.place_movers(movers)
+        x, y, vx, vy, facing, flags = ents[0]
+        player.pos.x, player.pos.y = x, y
+        player.vel.x, player.vel.y = vx, vy
+        player.facing = int(facing)
+        player.on_ground = bool(int(flags) & FLAG_ON_GROUND)
+        for n, e in zip(npcs, ents[1:]):
+            n.pos.x, n.pos.y = e[0], e[1]
+            r = getattr(n, "route", None)
+            if r is not None:
+                r.wait, r.dir = e[2], 1 if e[4] > 0 else -1
+        return True
+
+    def close(self) -> None:
+        try:
+            self.cmd_q.put(("quit",))
+            self.proc.join(timeout=1.0)
+            if self.proc.is_alive():
+                self.proc.terminate()
+        finally:
+            self.shm.close()
+            self.shm.unlink()
+            print("[simproc] stopped")
@@ -0,0 +1,169 @@
+# snapshot.py
+# ---------------------------------------------------------
+# 씬별 엔티티 상태 스냅샷 + 퀵세이브 파일.
+#
+# build_scene은 워프마다 NPC/WarpGate를 새로 만들어서, 카지노에 돌아오면
+# NPC.visit_count 같은 상태가 0으로 돌아갔다.
+# 씬을 떠날 때 엔티티 상태를 작은 튜플로 떠 두고(capture), 다시 들어올 때
+# 새로 만든 NPC에 덮어쓴다(restore).
+#
+# NPC 한 명 = (npc_id, x, y, visit_count, route_dir, route_wait)
+#   - 씬 정의의 NPC 순서가 인덱스. id가 다르면(씬 정의가 바뀐 저장본) 그 NPC는 건너뜀
+#   - 대화 상태는 저장 안 함(워프/퀵세이브는 대화 중엔 막혀 있음) → restore는 대화 닫힌 상태로
+#   - WarpGate는 위치/라벨이 씬 정의 그대로라 저장할 상태가 없음
+#   - 언로드 씬의 위치는 worldsim이 계속 움직이므로, 들어올 때는 이 스냅샷 다음에 world.restore
+#
+# main.Game은 빌드해 둔 씬(Level/NPC/게이트)을 S.SCENE_CACHE개까지 들고 있다가 다시 들어올 때 재사용하고
+# (build_scene 없음), 캐시에서 빠진 씬만 새로 빌드한 뒤 이 스냅샷으로 복원한다.
+#
+# 같은 스냅샷을 퀵세이브에도 쓴다(write/read, JSON).
+# 저장 씬이 지금 씬과 같으면 다시 빌드하지 않고 지금 NPC에 restore만(맵/사진 로드 없음).
+#
+# 사용 예:
+#
+#     states = SceneStates()
+#     states.capture("casino", npcs)        # 씬을 떠날 때
+#     states.restore("casino", new_npcs)    # 다시 들어올 때(처음이면 False)
+#     write("quicksave.json", {"scenes": states.to_dict(), ...})
+# ---------------------------------------------------------
+
+from __future__ import annotations
+import os
+import json
+
+FORMAT = 1
+
+
+def capture_npcs(npcs) -> tuple:
+    out = []
+    for n in npcs:
+        r = getattr(n, "route", None)
+        out.append((n.npc_id, round(float(n.pos.x), 2), round(float(n.pos.y), 2), int(n.visit_count),
+                    r.dir if r is not None else 1, round(r.wait, 3) if r is not None else 0.0))
+    return tuple(out)
+
+
+def apply_npcs(rec, npcs) -> int:
+    """rec → npcs(같은 인덱스, 같은 id만). 적용한 NPC 수."""
+    done = 0
+    for n, ent in zip(npcs, rec):
+        npc_id, x, y, visits, d, wait = ent
+        if n.npc_id != npc_id:
+            continue
+        n.pos.x, n.pos.y = float(x), float(y)
+        n.visit_count = int(visits)
+        n.talk_active = False
+        n.node = -1
+        r = getattr(n, "route", None)
+        if r is not None:
+            r.dir = 1 if d > 0 else -1
+            r.wait = float(wait)
+        done += 1
+    return done
+
+
+class SceneStates:
+    """씬 id → NPC 상태 튜플."""
+
+    def __init__(self):
+        self.scenes: dict[str, tuple] = {}
+        self.captures = 0
+        self.restores = 0
+
+    def capture(self, scene_id: str, npcs) -> None:
+        self.scenes[scene_id] = capture_npcs(npcs)
+        self.captures += 1
+
+    def restore(self, scene_id: str, npcs) -> bool:
+        """저장된 상태가 있으면 npcs에 적용하고 True(처음 들어가는 씬이면 False)."""
+        rec = self.scenes.get(scene_id)
+        if rec is None:
+            return False
+        apply_npcs(rec, npcs)
+        self.restores += 1
+        return True
+
+    def to_dict(self) -> dict:
+        return {sid: [list(e) for e in rec] for sid, rec in self.scenes.items()}
+
+    def load_dict(self, data: dict) -> None:
+        """저장본으로 통째로 교체."""
+        self.scenes = {sid: tuple(tuple(e) for e in rec) for sid, rec in (data or {}).items()}
+
+
+# -------------------------
+# 퀵세이브 파일
+# -------------------------
+def write(path: str, data: dict) -> bool:
+    """임시 파일에 쓰고 교체(쓰다가 죽어도 이전 저장본은 남음)."""
+    data = dict(data, format=FORMAT)
+    tmp = path + ".tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp, path)
+        print(f"[snapshot] saved -> {path}")
+        return True
+    except Exception as e:
+        print("[snapshot] save error:", e)
+        return False
+
+
+def read(path: str):
+    if not os.path.exists(path):
+        print(f"[snapshot] 저장본 없음: {path}")
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except Exception as e:
+        print("[snapshot] load error:", e)
+        return None
+    if data.get("format") != FORMAT:
+        print(f"[snapshot] 저장본 형식 다름({data.get('format')} != {FORMAT})")
+        return None
+    return data
+
+
+# ---------------------------------------------------------
+# 벤치마크: python snapshot.py
+# 카지노로 워프해 돌아오는 비용(Game.warp 전체): 씬 캐시 없이(S.SCENE_CACHE = 0, build_scene + 스냅샷)
+# vs 빌드해 둔 씬 재사용(기본), 그리고 두 경우 모두 visit_count가 워프 왕복 후에도 남는지
+# ---------------------------------------------------------
+def _bench(rounds: int = 20):
+    import time
+    import pygame
+    import settings as S
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    pygame.display.set_mode((S.SCREEN_W, S.SCREEN_H))
+    import main
+
+    def warp_back(cache: int) -> tuple:
+        S.SCENE_CACHE = cache
+        game = main.Game(pygame.font.Font(None, 18), None)
+        game.enter_scene("casino", main.build_scene("casino"))
+        game.npcs[0].visit_count = 3
+        t = 0.0
+        for _ in range(rounds):
+            game.warp("lab")
+            t0 = time.perf_counter()
+            game.warp("casino")
+            t += time.perf_counter() - t0
+        return t / rounds * 1000, game.npcs[0].visit_count == 3, game
+
+    keep = getattr(S, "SCENE_CACHE", 4)
+    t_build, ok_build, _ = warp_back(0)
+    t_cached, ok_cached, game = warp_back(max(1, keep))
+    S.SCENE_CACHE = keep
+    size = len(json.dumps(game.states.to_dict(), ensure_ascii=False))
+    ok = ok_build and ok_cached
+    print(f"[snapshot] warp back to casino: rebuild {t_build:.3f}ms | cached scene {t_cached:.3f}ms | "
+          f"snapshot {size} bytes | visit_count kept: {'PASS' if ok else 'FAIL'}")
+    pygame.quit()
+    return ok
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(0 if _bench() else 1)
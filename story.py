@@ -1,6 +1,10 @@
 # story_demo.py
 import pygame
 
+from textlayout import wrap
+from glyphatlas import render_text
+import fonts
+
 # ---------- 기본 설정 ----------
 SCREEN_W, SCREEN_H = 960, 540
 FONT_NAME = "malgungothic"  # 윈도우: 맑은 고딕. 없으면 시스템 폰트로 대체됨.
@@ -64,24 +68,8 @@ STORY_DATA = {
 
 # ---------- 유틸 ----------
 def wrap_text(text, font, max_width):
-    lines = []
-    for raw_line in text.split("\n"):
-        if raw_line.strip() == "":
-            lines.append("")
-            continue
-        words = raw_line.split(" ")
-        cur = ""
-        for w in words:
-            test = w if cur == "" else cur + " " + w
-            if font.size(test)[0] <= max_width:
-                cur = test
-            else:
-                if cur:
-                    lines.append(cur)
-                cur = w
-        if cur:
-            lines.append(cur)
-    return lines
+    # textlayout 공용 줄바꿈(폭 캐시 + 이진 탐색, 한글은 글자 단위로 끊김)
+    return list(wrap(text, font, max_width))
 
 class Button:
     def __init__(self, rect: pygame.Rect, label: str, font: pygame.font.Font):
@@ -113,15 +101,10 @@ class StoryView:
         self.selected_key = list(STORY_DATA.keys())[0]
         self.scroll = 0
 
-        # 폰트
-        try:
-            self.title_font = pygame.font.SysFont(FONT_NAME, 24)
-            self.item_font = pygame.font.SysFont(FONT_NAME, 18)
-            self.body_font = pygame.font.SysFont(FONT_NAME, 18)
-        except:
-            self.title_font = pygame.font.SysFont(None, 24)
-            self.item_font = pygame.font.SysFont(None, 18)
-            self.body_font = pygame.font.SysFont(None, 18)
+        # 폰트(공용 레지스트리, 없으면 기본 폰트로 대체)
+        self.title_font = fonts.get(24, FONT_NAME)
+        self.item_font = fonts.get(18, FONT_NAME)
+        self.body_font = fonts.get(18, FONT_NAME)
 
         # 버튼 생성
         self.buttons = []
@@ -207,7 +190,7 @@ class StoryView:
             x = content_rect.x + 12
             y_start = content_rect.y + 12 - self.scroll
             for i, line in enumerate(self._cached_lines):
-                img = self.body_font.render(line, True, (235, 235, 240))
+                img = render_text(self.body_font, line, (235, 235, 240))
                 surf.blit(img, (x, y_start + i * self._line_height))
 
 def main():
@@ -4,6 +4,9 @@ import pygame
 from pygame.math import Vector2 as V2
 import math
 
+from textlayout import wrap
+import fonts
+
 """
 LoL-style 카메라 고정 + 맵 끝 제한 + 셀별 이미지 맵 + 인게임 에디터 (Pygame)
 플레이어는 화면 중앙에 고정되고, 우클릭으로 이동합니다.
@@ -141,21 +144,9 @@ class DialogManager:
 
 
 def draw_multiline(surf, text, font, color, pos, max_width=800, line_spacing=6):
-    words = list(text)
-    # 글자 단위로 줄바꿈(한글 호환용). 필요시 단어 단위로 개선 가능.
-    lines = []
-    cur = ""
-    for ch in words:
-        candidate = cur + ch
-        if font.size(candidate)[0] <= max_width:
-            cur = candidate
-        else:
-            lines.append(cur)
-            cur = ch
-    if cur:
-        lines.append(cur)
+    # textlayout 공용 줄바꿈(한글은 글자 단위, 영문은 단어 단위)
     x, y = pos
-    for ln in lines:
+    for ln in wrap(text, font, max_width):
         img = font.render(ln, True, color)
         surf.blit(img, (x, y))
         y += img.get_height() + line_spacing
@@ -262,8 +253,8 @@ def main():
     move_target = None
     player_facing = V2(1, 0)  # 기본적으로 오른쪽 바라봄
 
-    font = pygame.font.SysFont(FONT_NAME, 18)
-    big_font = pygame.font.SysFont(FONT_NAME, 22)
+    font = fonts.get(18, FONT_NAME)
+    big_font = fonts.get(22, FONT_NAME)
 
     editor_mode = False
     editing_cell = None
@@ -0,0 +1,274 @@
+# textlayout.py
+# ---------------------------------------------------------
+# 공용 텍스트 줄바꿈(레이아웃).
+#
+# 기존 npc._wrap_text / utils.draw_multiline / story.wrap_text / tem.draw_multiline 은
+# 단어를 하나 붙일 때마다 font.size(지금까지 문자열)를 다시 재서
+# 줄 길이 L이면 측정이 O(L)번, 측정 하나도 O(L) → 긴 대사에서 O(L^2).
+# 또 공백에서만 끊어서 띄어쓰기 없는 긴 한국어 문장은 화면 밖으로 넘쳤다.
+#
+# 여기서는
+# - 폰트별 글자 폭(advance)을 캐시(FontMetrics). 처음 보는 글자만 font.metrics로 한 번에 잰다
+# - 문단마다 누적 폭(prefix) 배열을 만들고, 한 줄에 들어가는 끝을 이진 탐색(bisect)
+# - 끊을 수 있는 위치: 공백 뒤 + 한글(및 CJK) 글자 사이. 영문/숫자 단어는 통째로 유지,
+#   단어 하나가 줄보다 길면 글자 단위로 강제 분할
+# - 닫는 문장부호(. , ! ? … 」 ’ 등)는 줄 맨 앞에 오지 않게
+# - 결과는 (text, font, max_w) 단위로 메모이즈(LRU)
+#
+# 사용 예:
+#
+#     from textlayout import wrap, draw_wrapped
+#     for i, ln in enumerate(wrap(text, font, 600)):
+#         ...
+#     y = draw_wrapped(surf, text, font, (235, 235, 240), (20, 400), 600)
+# ---------------------------------------------------------
+
+from __future__ import annotations
+import weakref
+from bisect import bisect_right
+from collections import OrderedDict
+
+from glyphatlas import render_text
+
+# 줄 맨 앞에 오면 안 되는 문자(바로 앞에서 끊지 않음)
+_NO_LINE_START = set(".,!?;:)]}…」』’”〉》、。·~")
+
+LAYOUT_CACHE_MAX = 512
+
+
+def _is_cjk(ch: str) -> bool:
+    """글자 단위로 끊어도 되는 문자(한글 음절/자모, 한자, 가나)."""
+    o = ord(ch)
+    return (
+        0xAC00 <= o <= 0xD7A3      # 한글 음절
+        or 0x1100 <= o <= 0x11FF   # 한글 자모
+        or 0x3130 <= o <= 0x318F   # 한글 호환 자모
+        or 0x3040 <= o <= 0x30FF   # 가나
+        or 0x4E00 <= o <= 0x9FFF   # 한자
+    )
+
+
+class FontMetrics:
+    """폰트 하나의 글자 폭 캐시."""
+
+    def __init__(self, font):
+        self.font = font
+        self.adv: dict[str, int] = {}
+
+    def _learn(self, text: str) -> None:
+        missing = "".join(dict.fromkeys(ch for ch in text if ch not in self.adv))
+        if not missing:
+            return
+        try:
+            ms = self.font.metrics(missing)
+        except Exception:
+            ms = None
+        for i, ch in enumerate(missing):
+            m = ms[i] if ms and i < len(ms) else None
+            self.adv[ch] = m[4] if m else self.font.size(ch)[0]
+
+    def prefix(self, text: str) -> list[int]:
+        """prefix[i] = text[:i] 의 폭(글자 폭 합)."""
+        self._learn(text)
+        adv = self.adv
+        out = [0] * (len(text) + 1)
+        acc = 0
+        for i, ch in enumerate(text):
+            acc += adv[ch]
+            out[i + 1] = acc
+        return out
+
+    def width(self, text: str) -> int:
+        self._learn(text)
+        adv = self.adv
+        return sum(adv[ch] for ch in text)
+
+
+_metrics: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_layouts: OrderedDict = OrderedDict()
+_stats = {"hit": 0, "miss": 0}
+
+
+def metrics_for(font) -> FontMetrics:
+    m = _metrics.get(font)
+    if m is None:
+        m = FontMetrics(font)
+        _metrics[font] = m
+    return m
+
+
+def _break_ok(text: str) -> list[bool]:
+    """ok[b]: text[b-1]과 text[b] 사이에서 끊어도 되는지."""
+    n = len(text)
+    ok = [False] * (n + 1)
+    for b in range(1, n):
+        a, c = text[b - 1], text[b]
+        if c in _NO_LINE_START:
+            continue
+        if a == " " and c != " ":
+            ok[b] = True
+        elif (_is_cjk(a) or _is_cjk(c)) and a != " " and c != " ":
+            ok[b] = True
+    return ok
+
+
+def _wrap_para(para: str, fm: FontMetrics, max_w: int) -> list[str]:
+    n = len(para)
+    pre = fm.prefix(para)
+    ok = _break_ok(para)
+    font = fm.font
+    lines = []
+    i = 0
+    while i < n:
+        # 줄 앞 공백 건너뛰기
+        while i < n and para[i] == " ":
+            i += 1
+        if i >= n:
+            break
+
+        # i에서 시작해 폭 max_w 안에 들어가는 가장 긴 끝 j
+        j = bisect_right(pre, pre[i] + max_w) - 1
+        # 줄 끝 공백은 폭에 안 쳐도 되므로 이어지는 공백까지 포함
+        while j < n and para[j] == " ":
+            j += 1
+
+        if j >= n:
+            b = n
+        elif ok[j]:
+            b = j
+        else:
+            b = j - 1
+            while b > i and not ok[b]:
+                b -= 1
+            if b <= i:
+                b = max(i + 1, j)    # 끊을 곳이 없으면(긴 단어) 글자 단위로 강제 분할
+
+        line = para[i:b].rstrip(" ")
+        # 커닝/대체 글리프로 실제 폭이 넘치면 이전 끊김 위치로 후퇴(보통 0회)
+        while b - i > 1 and font.size(line)[0] > max_w:
+            nb = b - 1
+            while nb > i and not ok[nb]:
+                nb -= 1
+            b = nb if nb > i else b - 1
+            line = para[i:b].rstrip(" ")
+        lines.append(line)
+        i = b
+    return lines
+
+
+def wrap(text, font, max_w: int) -> tuple[str, ...]:
+    """
+    text를 max_w(px) 폭으로 줄바꿈한 줄 목록(튜플, 캐시됨).
+    '\\n'은 강제 줄바꿈, 빈 문단은 빈 줄로 남긴다.
+    """
+    s = "" if text is None else str(text)
+    max_w = max(1, int(max_w))
+    key = (s, id(font), max_w)
+    hit = _layouts.get(key)
+    if hit is not None and hit[0] is font:
+        _layouts.move_to_end(key)
+        _stats["hit"] += 1
+        return hit[1]
+
+    _stats["miss"] += 1
+    fm = metrics_for(font)
+    out = []
+    for para in s.split("\n"):
+        if not para.strip():
+            out.append("")
+            continue
+        out.extend(_wrap_para(para, fm, max_w))
+    lines = tuple(out)
+
+    _layouts[key] = (font, lines)
+    if len(_layouts) > LAYOUT_CACHE_MAX:
+        _layouts.popitem(last=False)
+    return lines
+
+
+def draw_wrapped(surf, text, font, color, pos, max_w: int, line_h=None) -> int:
+    """줄바꿈해서 그리기. line_h 기본값은 font.get_linesize(). 다음 y를 반환."""
+    x, y = pos
+    step = font.get_linesize() if line_h is None else line_h
+    for ln in wrap(text, font, max_w):
+        if ln:
+            surf.blit(render_text(font, ln, color), (x, y))
+        y += step
+    return y
+
+
+def cache_stats() -> dict:
+    return {"layouts": len(_layouts), "fonts": len(_metrics), **_stats}
+
+
+# ---------------------------------------------------------
+# 자체 점검: python textlayout.py
+# - 모든 줄이 max_w 이내인지(font.size 기준), 글자가 빠지거나 늘지 않는지
+# - 띄어쓰기 없는 긴 한국어 문장도 화면 안에서 끊기는지
+# - 기존 방식(단어마다 font.size) 대비 시간
+# ---------------------------------------------------------
+def _selfcheck():
+    import time
+    import fonts
+
+    font = fonts.get(18)
+
+    samples = [
+        "안녕 오늘도 하루가 시작됐네",
+        "주100시간제가도입된대그래서오늘도일하고내일도일하고모레도일해야한대정말로그렇대",
+        "Hello world, this is a fairly long English sentence that should wrap on spaces only.",
+        "세이렌은 바람보다 빠른 섬이다. 거래와 정보가 뒤섞여 하루에도 수천 번의 돈의 흐름이 바뀐다.\n\n"
+        "마이로는 그 흐름을 읽는 자다. Supercalifragilisticexpialidociousword!",
+        "",
+    ]
+    ok = True
+    for max_w in (120, 300, 600):
+        for s in samples:
+            lines = wrap(s, font, max_w)
+            for ln in lines:
+                if font.size(ln)[0] > max_w and len(ln) > 1:
+                    ok = False
+                    print(f"  overflow w={max_w}: {ln!r}")
+            if "".join(lines).replace(" ", "") != s.replace("\n", "").replace(" ", ""):
+                ok = False
+                print(f"  text changed w={max_w}: {s[:20]!r}")
+
+    # 기존 방식(npc._wrap_text와 같은 알고리즘)과 비교
+    def legacy(text, max_w):
+        words = text.split(" ")
+        lines, cur = [], ""
+        for w in words:
+            test = (cur + " " + w).strip()
+            if font.size(test)[0] <= max_w or not cur:
+                cur = test
+            else:
+                lines.append(cur)
+                cur = w
+        if cur:
+            lines.append(cur)
+        return lines
+
+    long_text = " ".join(samples[:4]) * 3
+    t0 = time.perf_counter()
+    for _ in range(200):
+        legacy(long_text, 600)
+    t_old = (time.perf_counter() - t0) / 200 * 1000
+
+    _layouts.clear()
+    t0 = time.perf_counter()
+    wrap(long_text, font, 600)
+    t_new_cold = (time.perf_counter() - t0) * 1000
+    t0 = time.perf_counter()
+    for _ in range(200):
+        wrap(long_text, font, 600)
+    t_new = (time.perf_counter() - t0) / 200 * 1000
+    print(f"  {len(long_text)} chars: legacy {t_old:.3f}ms/call, "
+          f"layout cold {t_new_cold:.3f}ms, cached {t_new:.4f}ms/call")
+    print(f"  cache: {cache_stats()}")
+    print("textlayout selfcheck:", "PASS" if ok else "FAIL")
+    return ok
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(0 if _selfcheck() else 1)
@@ -0,0 +1,170 @@
+# tile_atlas.py
+# ---------------------------------------------------------
+# 맵 타일 아틀라스 굽기(오프라인 도구).
+#
+# assets/map_city/{r}-{c}.png 처럼 타일이 칸마다 파일 하나라서, 맵을 열 때
+# 파일 144개를 하나씩 열고 디코딩했다.
+# 여기서 맵의 타일(+ 오버라이드 타일)을 원본 크기 그대로 몇 장의 페이지 PNG에 선반(shelf) 방식으로
+# 채우고, manifest.json에 "타일 경로 → (페이지, x, y, w, h)"를 적어 둔다.
+# 실행 중에는 map_system.load_atlas가 페이지만 읽고 타일은 페이지의 부분 영역에서 잘라 쓴다.
+#
+# - 원본 크기로 굽는다: TILE_SIZE로 미리 키워 구우면 페이지가 커져서(city 118x62 → 256x256,
+#   디스크 9MB / 디코딩 36MB) 파일 144개보다 오히려 느렸다. 리샘플링은 실행 중 처음 쓸 때 한 번
+# - 페이지 형식: raw(기본, RGBA 바이트 그대로 → 읽기 = 파일 읽기 + frombytes, zlib 해제 없음)
+#   또는 png(디스크 절반, 대신 디코딩 시간은 타일 파일 144개와 비슷)
+# - 같은 경로를 가리키는 칸은 한 번만 굽는다
+# - 없는 파일은 manifest에서 빠짐(실행 중에도 예전처럼 "없음" 처리)
+# - 출력: TILE_ATLAS_DIR/<map_id>/page_0.rgba(.png), page_1..., manifest.json
+# - 타일/오버라이드를 바꾸면 다시 구울 것
+#
+# 사용 예:
+#
+#     python tile_atlas.py city assets/map_city            # 굽기
+#     python tile_atlas.py city assets/map_city --bench    # 굽고 로드 시간/파일 열기 수 비교
+#     python tile_atlas.py city assets/map_city --format png
+# ---------------------------------------------------------
+
+from __future__ import annotations
+import os
+import json
+import argparse
+
+import pygame
+
+import map_system as M
+
+PAGE_SIZE = 2048
+FORMAT = 1
+
+
+def _map_paths() -> list:
+    """현재 맵(오버라이드 포함) 칸들이 쓰는 타일 경로(중복 없이, 칸 순서)."""
+    table = M._path_table()
+    seen = {}
+    for r in range(1, M.MAP_ROWS + 1):
+        for c in range(1, M.MAP_COLS + 1):
+            seen.setdefault(table[r][c], None)
+    return list(seen)
+
+
+def _shelf_pack(sizes, page_size: int) -> list:
+    """(w, h) 목록 → [(page, x, y)]. 높이 순으로 선반에 채우고, 페이지가 차면 다음 페이지."""
+    order = sorted(range(len(sizes)), key=lambda i: -sizes[i][1])
+    out = [None] * len(sizes)
+    page, x, y, shelf_h = 0, 0, 0, 0
+    for i in order:
+        w, h = sizes[i]
+        if x + w > page_size:
+            x, y, shelf_h = 0, y + shelf_h, 0
+        if y + h > page_size:
+            page, x, y, shelf_h = page + 1, 0, 0, 0
+        out[i] = (page, x, y)
+        x += w
+        shelf_h = max(shelf_h, h)
+    return out
+
+
+def pack(map_id: str, tile_folder: str, page_size: int = PAGE_SIZE, fmt: str = "raw") -> dict:
+    """map_id 맵의 타일을 아틀라스로 굽고(M.TILE_ATLAS_DIR/<map_id>) manifest(dict) 반환."""
+    M.TILE_ATLAS = False   # 굽는 동안 예전 아틀라스를 읽지 않게
+    M.set_current_map(map_id, tile_folder=tile_folder)
+    out_dir = os.path.dirname(M._atlas_manifest_path(map_id))
+    os.makedirs(out_dir, exist_ok=True)
+
+    tiles = []
+    for path in _map_paths():
+        if not os.path.exists(path):
+            continue
+        try:
+            img = pygame.image.load(path)
+        except Exception as e:
+            print("[tile_atlas] load err:", path, e)
+            continue
+        if img.get_width() > page_size or img.get_height() > page_size:
+            print(f"[tile_atlas] 페이지보다 큰 타일 건너뜀(파일로 로드됨): {path}")
+            continue
+        tiles.append((path, img))
+
+    places = _shelf_pack([img.get_size() for _, img in tiles], page_size)
+    n_pages = max((p for p, _, _ in places), default=-1) + 1
+    pages, entries = [], {}
+    for pi in range(n_pages):
+        mine = [(t, pl) for t, pl in zip(tiles, places) if pl[0] == pi]
+        pw = max(pl[1] + t[1].get_width() for t, pl in mine)
+        ph = max(pl[2] + t[1].get_height() for t, pl in mine)
+        page = pygame.Surface((pw, ph), pygame.SRCALPHA, 32)
+        for (path, img), (_, x, y) in mine:
+            page.blit(img, (x, y))
+            entries[path] = [pi, x, y, img.get_width(), img.get_height()]
+        if fmt == "png":
+            name = f"page_{pi}.png"
+            pygame.image.save(page, os.path.join(out_dir, name))
+        else:
+            name = f"page_{pi}.rgba"
+            with open(os.path.join(out_dir, name), "wb") as f:
+                tobytes = getattr(pygame.image, "tobytes", None) or pygame.image.tostring   # pygame < 2.1.3
+                f.write(tobytes(page, "RGBA"))
+        pages.append([name, pw, ph])
+
+    manifest = {
+        "_meta": {"format": FORMAT, "map": map_id, "tile_folder": M._norm(tile_folder), "pages": pages},
+        "tiles": entries,
+    }
+    with open(os.path.join(out_dir, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1)
+    size = sum(os.path.getsize(os.path.join(out_dir, n)) for n, _, _ in pages)
+    print(f"[tile_atlas] {map_id}: {len(entries)} tiles -> {len(pages)} pages "
+          f"({size / 2**20:.1f}MB on disk) -> {out_dir}")
+    return manifest
+
+
+# ---------------------------------------------------------
+# 로드 비교: 칸마다 파일 vs 아틀라스 페이지
+# 둘 다 맵의 모든 칸 surface(TILE_SIZE)를 얻을 때까지의 시간 / 연 파일 수
+# ---------------------------------------------------------
+def bench(map_id: str, tile_folder: str, rounds: int = 3) -> None:
+    import time
+
+    def load_all(use_atlas: bool) -> tuple:
+        best = None
+        for _ in range(rounds):
+            M.TILE_ATLAS = use_atlas
+            M.tile_stats["file_opens"] = 0
+            t0 = time.perf_counter()
+            M.set_current_map(map_id, tile_folder=tile_folder)
+            table = M._path_table()
+            for r in range(1, M.MAP_ROWS + 1):
+                for c in range(1, M.MAP_COLS + 1):
+                    M.load_image_cached(table[r][c])
+            t = time.perf_counter() - t0
+            best = t if best is None else min(best, t)
+        return best * 1000, M.tile_stats["file_opens"]
+
+    t_files, n_files = load_all(False)
+    t_atlas, n_atlas = load_all(True)
+    print(f"[tile_atlas] load {M.MAP_ROWS}x{M.MAP_COLS}: per-file {t_files:.1f}ms / {n_files} opens | "
+          f"atlas {t_atlas:.1f}ms / {n_atlas} opens (pages {M.atlas_bytes() / 2**20:.1f}MB)")
+
+
+def _parse_args(argv=None):
+    ap = argparse.ArgumentParser(description="맵 타일 아틀라스 굽기")
+    ap.add_argument("map_id", help="맵 id (map_overrides_<id>.json, 출력 폴더 이름)")
+    ap.add_argument("tile_folder", help="{r}-{c}.png 타일 폴더")
+    ap.add_argument("--atlas-dir", default=None, help=f"아틀라스 루트(기본 settings.TILE_ATLAS_DIR = {M.TILE_ATLAS_DIR})")
+    ap.add_argument("--page", type=int, default=PAGE_SIZE, help="페이지 한 변 픽셀")
+    ap.add_argument("--format", choices=["raw", "png"], default="raw", help="페이지 파일 형식")
+    ap.add_argument("--bench", action="store_true", help="굽고 나서 로드 시간/파일 열기 수 비교")
+    return ap.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = _parse_args()
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    if args.atlas_dir:
+        M.TILE_ATLAS_DIR = args.atlas_dir
+    pack(args.map_id, args.tile_folder, args.page, args.format)
+    if args.bench:
+        pygame.display.set_mode((64, 64))
+        bench(args.map_id, args.tile_folder)
+    pygame.quit()
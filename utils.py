@@ -2,6 +2,8 @@
 import pygame
 import math
 
+from textlayout import draw_wrapped
+
 def circle_rect_intersect(cx, cy, cr, rx, ry, rw, rh):
     """원(플레이어)과 직사각형(벽 블록) 충돌 여부."""
     nx = max(rx, min(cx, rx + rw))
@@ -12,18 +14,5 @@ def circle_rect_intersect(cx, cy, cr, rx, ry, rw, rh):
 def draw_multiline(surf, text, font, color, topleft, max_width):
     if not text:
         return
-    x, y = topleft
-    space_w = font.size(" ")[0]
-    for para in str(text).split("\n"):
-        words = para.split(" ")
-        line = ""
-        for w in words:
-            test = (line + " " + w) if line else w
-            if font.size(test)[0] <= max_width:
-                line = test
-            else:
-                surf.blit(font.render(line, True, color), (x, y))
-                y += font.get_linesize()
-                line = w
-        surf.blit(font.render(line, True, color), (x, y))
-        y += font.get_linesize()
+    # 줄바꿈은 textlayout 공용 캐시 사용(한글 글자 단위 끊김 포함)
+    draw_wrapped(surf, text, font, color, topleft, max_width)
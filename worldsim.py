@@ -0,0 +1,277 @@
+# worldsim.py
+# ---------------------------------------------------------
+# 로드되지 않은 씬의 NPC 간이(추상) 시뮬레이션.
+#
+# 워프하면 build_scene이 이전 씬의 NPC를 버려서, 연구실에 있는 동안
+# 카지노에서는 아무 일도 일어나지 않았다. 전부 돌리기엔 비싸므로 두 단계로 나눈다.
+#
+#   로드된 씬  : NPC 객체가 Route(두 지점 왕복 + 끝점 대기)를 매 갱신(LOD) 따라 걷는다
+#   언로드 씬  : 같은 규칙을 씬별 배열(x, dir, wait, a, b, speed, dwell)로 낮은 주기에 한꺼번에
+#                (물리/충돌/애니메이션/대화 없음, 위치·일정 상태만)
+#
+# - WORLDSIM_HZ(기본 4)로 NPC마다 초당 몇 번 진행할지 정한다.
+#   NPC를 FPS / HZ 개 그룹으로 나눠 프레임마다 한 그룹만 처리(한 프레임 몰림 없음),
+#   그룹별로 쌓인 dt를 한 번에 넘긴다
+# - 씬의 그룹 하나가 VEC_MIN명 이상이고 numpy가 있으면 배열 연산, 아니면 파이썬 루프(같은 규칙)
+#   (작은 그룹은 numpy 호출 오버헤드가 루프보다 큼)
+# - 씬을 떠날 때 store(scene, npcs)로 NPC 상태 → 배열, 들어올 때 restore(scene, npcs)로 배열 → NPC
+#   (씬 정의의 NPC 순서가 곧 인덱스)
+#
+# 씬 정의(main.SCENES)의 NPC 항목에 route가 있으면 움직인다:
+#   "npcs": [("워니", 1400, None, {"route": (1300, 1520), "dwell": 4.0, "speed": 40})]
+#
+# 사용 예:
+#
+#     world = WorldSim(SCENES)
+#     world.update(dt, loaded="casino")     # 매 프레임(카지노 외 씬만 진행)
+#     world.store("casino", npcs)           # 씬을 떠날 때
+#     world.restore("casino", npcs)         # 다시 들어올 때
+# ---------------------------------------------------------
+
+from __future__ import annotations
+
+try:
+    import numpy as np
+except ImportError:  # numpy는 선택 의존성(없으면 파이썬 루프)
+    np = None
+
+import settings as S
+
+DEFAULT_SPEED = 40.0
+DEFAULT_DWELL = 3.0
+VEC_MIN = 64
+
+
+class Route:
+    """두 지점(a, b) 왕복 + 끝점 대기. 로드된 NPC 한 명의 일정 상태."""
+    __slots__ = ("a", "b", "speed", "dwell", "dir", "wait")
+
+    def __init__(self, a, b, speed=DEFAULT_SPEED, dwell=DEFAULT_DWELL):
+        self.a, self.b = float(min(a, b)), float(max(a, b))
+        self.speed = float(speed)
+        self.dwell = float(dwell)
+        self.dir = 1
+        self.wait = 0.0
+
+    def step(self, x: float, dt: float) -> float:
+        """x에서 dt만큼 진행한 새 x. (WorldSim 배열 규칙과 동일)"""
+        if self.wait > 0:
+            self.wait -= dt
+            return x
+        target = self.b if self.dir > 0 else self.a
+        d = target - x
+        step = self.speed * dt
+        if abs(d) <= step:
+            self.dir = -self.dir
+            self.wait = self.dwell
+            return target
+        return x + step if d > 0 else x - step
+
+
+def route_of(spec_opts) -> Route | None:
+    if not spec_opts or "route" not in spec_opts:
+        return None
+    a, b = spec_opts["route"]
+    return Route(a, b, spec_opts.get("speed", DEFAULT_SPEED), spec_opts.get("dwell", DEFAULT_DWELL))
+
+
+def scene_npc_entries(spec: dict) -> list:
+    """씬 정의 → [(npc_id, x, sheet, opts)] (main._populate_scene과 같은 해석)."""
+    out = []
+    for ent in spec.get("npcs") or [spec["npc"]]:
+        sheet = ent[2] if len(ent) > 2 and ent[2] else spec.get("npc_sheet")
+        opts = ent[3] if len(ent) > 3 else None
+        out.append((ent[0], ent[1], sheet, opts))
+    return out
+
+
+class _SceneState:
+    """씬 하나의 추상 NPC 상태(필드별 배열)."""
+
+    def __init__(self, xs, routes, vec: bool = False):
+        n = len(xs)
+        a = [r.a if r else x for x, r in zip(xs, routes)]
+        b = [r.b if r else x for x, r in zip(xs, routes)]
+        sp = [r.speed if r else 0.0 for r in routes]
+        dw = [r.dwell if r else 0.0 for r in routes]
+        self.vec = vec and np is not None
+        if self.vec:
+            self.x = np.asarray(xs, dtype=np.float64)
+            self.a = np.asarray(a, dtype=np.float64)
+            self.b = np.asarray(b, dtype=np.float64)
+            self.speed = np.asarray(sp, dtype=np.float64)
+            self.dwell = np.asarray(dw, dtype=np.float64)
+            self.dir = np.ones(n, dtype=np.float64)
+            self.wait = np.zeros(n, dtype=np.float64)
+        else:
+            self.x, self.a, self.b = list(map(float, xs)), a, b
+            self.speed, self.dwell = sp, dw
+            self.dir = [1.0] * n
+            self.wait = [0.0] * n
+        self.n = n
+
+    def step(self, sl: slice, dt: float) -> None:
+        """sl 구간 NPC를 dt만큼 진행(Route.step과 같은 규칙)."""
+        if self.vec:
+            x, wait, d = self.x[sl], self.wait[sl], self.dir[sl]
+            waiting = wait > 0
+            wait[waiting] -= dt
+            target = np.where(d > 0, self.b[sl], self.a[sl])
+            delta = target - x
+            step = self.speed[sl] * dt
+            arrive = ~waiting & (np.abs(delta) <= step)
+            walk = ~waiting & ~arrive
+            x[walk] += np.copysign(step[walk], delta[walk])
+            x[arrive] = target[arrive]
+            d[arrive] *= -1.0
+            wait[arrive] = self.dwell[sl][arrive]
+            return
+        x, wait, d, a, b, sp, dw = self.x, self.wait, self.dir, self.a, self.b, self.speed, self.dwell
+        for i in range(*sl.indices(self.n)):
+            if wait[i] > 0:
+                wait[i] -= dt
+                continue
+            target = b[i] if d[i] > 0 else a[i]
+            delta = target - x[i]
+            s = sp[i] * dt
+            if abs(delta) <= s:
+                x[i] = target
+                d[i] = -d[i]
+                wait[i] = dw[i]
+            else:
+                x[i] += s if delta > 0 else -s
+
+
+class WorldSim:
+    def __init__(self, scenes: dict | None = None, hz=None):
+        hz = float(hz if hz is not None else getattr(S, "WORLDSIM_HZ", 4))
+        self.groups = max(1, int(round(getattr(S, "FPS", 60) / max(0.1, hz))))
+        self.scenes: dict[str, _SceneState] = {}
+        self._acc = [0.0] * self.groups
+        self._g = 0
+        self.steps = 0
+        for sid, spec in (scenes or {}).items():
+            ents = scene_npc_entries(spec)
+            self.add_scene(sid, [e[1] for e in ents], [route_of(e[3]) for e in ents])
+
+    def add_scene(self, scene_id: str, xs, routes) -> None:
+        xs = list(xs)
+        self.scenes[scene_id] = _SceneState(xs, list(routes), len(xs) // self.groups >= VEC_MIN)
+
+    def update(self, dt: float, loaded=None) -> None:
+        """매 프레임 호출. 한 그룹(NPC i % groups == g)만 그동안 쌓인 dt로 진행."""
+        acc = self._acc
+        for g in range(self.groups):
+            acc[g] += dt
+        g = self._g
+        gdt = acc[g]
+        acc[g] = 0.0
+        self._g = (g + 1) % self.groups
+        sl = slice(g, None, self.groups)
+        for sid, st in self.scenes.items():
+            if sid != loaded and st.n:
+                st.step(sl, gdt)
+        self.steps += 1
+
+    # -------------------------
+    # 로드된 NPC ↔ 추상 상태
+    # -------------------------
+    def store(self, scene_id: str, npcs) -> None:
+        st = self.scenes.get(scene_id)
+        if st is None:
+            return
+        for i, n in enumerate(npcs[:st.n]):
+            st.x[i] = n.pos.x
+            r = getattr(n, "route", None)
+            if r is not None:
+                st.dir[i] = r.dir
+                st.wait[i] = r.wait
+
+    def restore(self, scene_id: str, npcs, level=None) -> None:
+        st = self.scenes.get(scene_id)
+        if st is None:
+            return
+        for i, n in enumerate(npcs[:st.n]):
+            x = float(st.x[i])
+            r = getattr(n, "route", None)
+            if r is not None:
+                r.dir = 1 if st.dir[i] > 0 else -1
+                r.wait = float(st.wait[i])
+            if x != n.pos.x:
+                n.pos.x = x
+                if level is not None and hasattr(level, "get_support_y"):
+                    n.pos.y = level.get_support_y(int(x)) - n.h
+
+    def positions(self, scene_id: str) -> list:
+        st = self.scenes.get(scene_id)
+        return [] if st is None else [float(v) for v in st.x]
+
+    # -------------------------
+    # 퀵세이브(snapshot.write)
+    # -------------------------
+    def to_dict(self) -> dict:
+        """씬별 변하는 상태(x, dir, wait)만. a/b/speed/dwell은 씬 정의에서 다시 만든다."""
+        return {sid: {"x": [round(float(v), 2) for v in st.x],
+                      "dir": [int(v) for v in st.dir],
+                      "wait": [round(float(v), 3) for v in st.wait]}
+                for sid, st in self.scenes.items()}
+
+    def load_dict(self, data: dict) -> None:
+        for sid, d in (data or {}).items():
+            st = self.scenes.get(sid)
+            if st is None:
+                continue
+            for i, (x, di, w) in enumerate(zip(d["x"], d["dir"], d["wait"])):
+                if i >= st.n:
+                    break
+                st.x[i], st.dir[i], st.wait[i] = float(x), float(di), float(w)
+
+
+# ---------------------------------------------------------
+# 벤치마크: python worldsim.py [N]
+# 언로드 씬 여러 개에 추상 NPC N명 → 프레임당 비용(ms), 로드 NPC Route와 결과 비교
+# ---------------------------------------------------------
+def _bench(n: int = 5000, frames: int = 600):
+    import time
+    import random
+
+    rng = random.Random(3)
+    scenes = 8
+    per = n // scenes
+    sim = WorldSim()
+    for s in range(scenes):
+        xs, routes = [], []
+        for _ in range(per):
+            x = rng.uniform(0, 4000)
+            xs.append(x)
+            routes.append(Route(x - rng.uniform(50, 400), x + rng.uniform(50, 400),
+                                rng.uniform(20, 80), rng.uniform(0.5, 5)))
+        sim.add_scene(f"s{s}", xs, routes)
+
+    dt = 1 / 60
+    worst = 0.0
+    t_all = time.perf_counter()
+    for _ in range(frames):
+        t0 = time.perf_counter()
+        sim.update(dt, loaded="s0")
+        worst = max(worst, time.perf_counter() - t0)
+    avg = (time.perf_counter() - t_all) / frames * 1000
+
+    # 한 명을 로드된 NPC(Route.step)와 추상 상태(그룹 dt로 진행)로 같이 돌려 비교
+    ref = WorldSim(hz=60)
+    r = Route(100, 300, 50, 1.0)
+    ref.add_scene("a", [100.0], [Route(100, 300, 50, 1.0)])
+    x = 100.0
+    for _ in range(600):
+        x = r.step(x, dt)
+        ref.update(dt)
+    diff = abs(x - ref.positions("a")[0])
+    mode = "numpy" if sim.scenes["s1"].vec else "python"
+    print(f"[worldsim] {n} abstract npcs in {scenes} scenes ({mode}), "
+          f"groups={sim.groups}: avg {avg:.3f}ms/frame, worst {worst * 1000:.3f}ms | "
+          f"route vs abstract diff {diff:.2e}px")
+
+
+if __name__ == "__main__":
+    import sys
+    _bench(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)